@@ -0,0 +1,97 @@
+"""Measures the time taken to import splink, and the modules it imports.
+Each measurement uses a fresh interpreter, so nothing is already imported.
+
+Usage:
+    python scripts/benchmark_import_time.py
+    python scripts/benchmark_import_time.py --statement "from splink import Linker"
+    python scripts/benchmark_import_time.py --max-seconds 0.5   # fail if slower
+"""
+
+import argparse
+import statistics
+import subprocess
+import sys
+import time
+
+HEAVY_MODULES = [
+    "altair",
+    "duckdb",
+    "igraph",
+    "jinja2",
+    "numpy",
+    "pandas",
+    "pyspark",
+    "sqlglot",
+]
+
+
+def time_import(statement):
+    start_time = time.perf_counter()
+    subprocess.run([sys.executable, "-c", statement], check=True)
+    return time.perf_counter() - start_time
+
+
+def heavy_modules_imported(statement):
+    check = (
+        f"{statement}\n"
+        "import sys\n"
+        f"print(','.join(m for m in {HEAVY_MODULES!r} if m in sys.modules))"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", check], check=True, capture_output=True, text=True
+    )
+    return [m for m in result.stdout.strip().split(",") if m]
+
+
+def slowest_modules(statement, top_n):
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", statement],
+        check=True,
+        capture_output=True,
+        text=True,
+    )
+    timings = []
+    for line in result.stderr.splitlines():
+        # import time: self [us] | cumulative | imported package
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, module = line[len("import time:") :].split("|")
+        timings.append((int(cumulative), module.rstrip()))
+    return sorted(timings, reverse=True)[:top_n]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--statement", default="import splink")
+    parser.add_argument("--repeats", type=int, default=10)
+    parser.add_argument("--top-n", type=int, default=15)
+    parser.add_argument(
+        "--max-seconds",
+        type=float,
+        default=None,
+        help="Exit with an error if the median import time exceeds this",
+    )
+    args = parser.parse_args()
+
+    # Subtract the start up time of the interpreter itself
+    baseline = statistics.median(time_import("pass") for _ in range(args.repeats))
+    timings = [time_import(args.statement) - baseline for _ in range(args.repeats)]
+    median = statistics.median(timings)
+
+    print(f"`{args.statement}` over {args.repeats} runs:")  # noqa: T201
+    print(f"    median {median:.3f}s, min {min(timings):.3f}s")  # noqa: T201
+    heavy = heavy_modules_imported(args.statement)
+    print(f"    heavy modules imported: {', '.join(heavy) or 'none'}")  # noqa: T201
+    print("Slowest modules (cumulative):")  # noqa: T201
+    for cumulative, module in slowest_modules(args.statement, args.top_n):
+        print(f"    {cumulative / 1e6:.3f}s {module}")  # noqa: T201
+
+    if args.max_seconds is not None and median > args.max_seconds:
+        sys.exit(
+            f"Median import time {median:.3f}s exceeds the maximum of "
+            f"{args.max_seconds:.3f}s"
+        )
+
+
+if __name__ == "__main__":
+    main()
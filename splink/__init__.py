@@ -1,11 +1,6 @@
+from importlib import import_module
 from typing import TYPE_CHECKING
 
-from splink.internals.blocking_rule_library import block_on
-from splink.internals.column_expression import ColumnExpression
-from splink.internals.datasets import splink_datasets
-from splink.internals.linker import Linker
-from splink.internals.settings_creator import SettingsCreator
-
 # The following is a workaround for the fact that dependencies of particular backends
 # may not be installed, but we don't want this to prevent import
 # of the other backends.
@@ -14,29 +9,58 @@ from splink.internals.settings_creator import SettingsCreator
 # and ensures that typing information is retained so e.g. the arguments autocomplete
 # without importing them at runtime
 if TYPE_CHECKING:
+    from splink.internals.blocking_rule_library import (
+        block_on,
+        minhash_lsh,
+        sorted_neighbourhood,
+    )
+    from splink.internals.column_expression import ColumnExpression
+    from splink.internals.datasets import splink_datasets
     from splink.internals.duckdb.database_api import DuckDBAPI
+    from splink.internals.linker import Linker
+    from splink.internals.settings_creator import SettingsCreator
     from splink.internals.spark.database_api import SparkAPI
 
+# Top level names are imported lazily, on first access, so that `import splink`
+# is fast: the linker pulls in pandas, sqlglot and much of the rest of Splink
+_lazy_imports = {
+    "block_on": "splink.internals.blocking_rule_library",
+    "ColumnExpression": "splink.internals.column_expression",
+    "DuckDBAPI": "splink.internals.duckdb.database_api",
+    "Linker": "splink.internals.linker",
+    "minhash_lsh": "splink.internals.blocking_rule_library",
+    "SettingsCreator": "splink.internals.settings_creator",
+    "SparkAPI": "splink.internals.spark.database_api",
+    "sorted_neighbourhood": "splink.internals.blocking_rule_library",
+    "splink_datasets": "splink.internals.datasets",
+}
+
+_backend_apis = ["SparkAPI", "DuckDBAPI"]
+
 
 # Use getarr to make the error appear at the point of use
 def __getattr__(name):
-    try:
-        if name == "SparkAPI":
-            from splink.internals.spark.database_api import SparkAPI
-
-            return SparkAPI
-        elif name == "DuckDBAPI":
-            from splink.internals.duckdb.database_api import DuckDBAPI
+    if name not in _lazy_imports:
+        raise AttributeError(f"module 'splink' has no attribute '{name}'") from None
 
-            return DuckDBAPI
+    try:
+        value = getattr(import_module(_lazy_imports[name]), name)
     except ImportError as err:
-        if name in ["SparkAPI", "DuckDBAPI"]:
+        if name in _backend_apis:
             raise ImportError(
                 f"{name} cannot be imported because its dependencies are not "
                 "installed. Please `pip install` the required package(s) as "
                 "specified in the optional dependencies in pyproject.toml"
             ) from err
-    raise AttributeError(f"module 'splink' has no attribute '{name}'") from None
+        raise
+
+    # Cache on the module, so __getattr__ is not called again for this name
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(list(globals()) + list(_lazy_imports))
 
 
 __version__ = "4.0.0"
@@ -47,7 +71,9 @@ __all__ = [
     "ColumnExpression",
     "DuckDBAPI",
     "Linker",
+    "minhash_lsh",
     "SettingsCreator",
     "SparkAPI",
+    "sorted_neighbourhood",
     "splink_datasets",
 ]
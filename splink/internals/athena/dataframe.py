@@ -2,34 +2,32 @@ from __future__ import annotations
 
 import logging
 import os
-from typing import TYPE_CHECKING, Any, Dict, Optional
+from typing import TYPE_CHECKING, Any, Dict, Iterator, Optional
 
 import awswrangler as wr
 import numpy as np
 from pandas import DataFrame as pd_DataFrame
 
-from ..input_column import InputColumn
-from ..splink_dataframe import SplinkDataFrame
+from ..splink_dataframe import BatchOutputType, SplinkDataFrame, _import_pyarrow
 
 logger = logging.getLogger(__name__)
 if TYPE_CHECKING:
+    import pyarrow as pa
+
     from .database_api import AthenaAPI
 
 
 class AthenaDataFrame(SplinkDataFrame):
     db_api: AthenaAPI
 
-    @property
-    def columns(self) -> list[InputColumn]:
+    def _fetch_column_types(self) -> dict[str, str]:
         db, tb = self.db_api.get_schema_info(self.physical_name)
         d = wr.catalog.get_table_types(
             database=db,
             table=tb,
             boto3_session=self.db_api.boto3_session,
         )
-
-        cols = list(d.keys())
-        return [InputColumn(c, sql_dialect="presto") for c in cols]
+        return dict(d)
 
     def validate(self):
         pass
@@ -113,6 +111,76 @@ class AthenaDataFrame(SplinkDataFrame):
         )
         return out_df
 
+    def as_arrow(self, limit: Optional[int] = None) -> pa.Table:
+        pa = _import_pyarrow()
+        try:
+            return self._read_parquet_as_arrow(limit)
+        except (OSError, pa.ArrowException, wr.exceptions.InvalidTable) as e:
+            # e.g. a table registered by the user which is not stored as parquet
+            logger.debug(
+                f"Unable to read {self.physical_name} as parquet, so reading it "
+                f"via pandas: {e}"
+            )
+            return pa.Table.from_pandas(
+                self.as_pandas_dataframe(limit), preserve_index=False
+            )
+
+    def _read_parquet_as_arrow(self, limit: Optional[int] = None) -> pa.Table:
+        # Tables created or registered by Splink are stored on s3 as parquet, so
+        # can be read into Arrow directly, without running a query
+        import pyarrow.dataset as ds
+        from pyarrow.fs import S3FileSystem
+
+        boto3_session = self.db_api.boto3_session
+        db, tb = self.db_api.get_schema_info(self.physical_name)
+        location = wr.catalog.get_table_location(
+            database=db, table=tb, boto3_session=boto3_session
+        )
+        credentials = boto3_session.get_credentials().get_frozen_credentials()
+        filesystem = S3FileSystem(
+            access_key=credentials.access_key,
+            secret_key=credentials.secret_key,
+            session_token=credentials.token,
+            region=boto3_session.region_name,
+        )
+        dataset = ds.dataset(
+            location.replace("s3://", "", 1), format="parquet", filesystem=filesystem
+        )
+        if limit:
+            return dataset.head(limit)
+        return dataset.to_table()
+
+    def _iter_batches(
+        self, batch_size: int, output_type: BatchOutputType
+    ) -> Iterator[pa.RecordBatch | pd_DataFrame]:
+        # With a chunksize, awswrangler reads the CTAS output one chunk at a time
+        chunks = wr.athena.read_sql_query(
+            sql=f"select * from {self.physical_name}",
+            database=self.db_api.output_schema,
+            s3_output=self.db_api.s3_output,
+            keep_files=False,
+            ctas_approach=True,
+            chunksize=batch_size,
+            boto3_session=self.db_api.boto3_session,
+        )
+        for chunk in chunks:
+            if output_type == "pandas":
+                yield chunk.reset_index(drop=True)
+            else:
+                pa = _import_pyarrow()
+                yield pa.RecordBatch.from_pandas(chunk, preserve_index=False)
+
+    def _row_count(self) -> int:
+        out_df = wr.athena.read_sql_query(
+            sql=f"select count(*) as row_count from {self.physical_name}",
+            database=self.db_api.output_schema,
+            s3_output=self.db_api.s3_output,
+            keep_files=False,
+            ctas_approach=False,
+            boto3_session=self.db_api.boto3_session,
+        )
+        return int(out_df["row_count"].iloc[0])
+
     def as_record_dict(self, limit: Optional[int] = None) -> list[Dict[str, Any]]:
         out_df = self.as_pandas_dataframe(limit)
         out_df = out_df.fillna(np.nan).replace([np.nan], [None])
@@ -1,21 +1,30 @@
 from __future__ import annotations
 
+import hashlib
 import logging
-from typing import TYPE_CHECKING, Any, List, Literal, Optional
+from collections import Counter
+from copy import copy
+from typing import TYPE_CHECKING, Any, Dict, List, Literal, Optional, Tuple
 
-from sqlglot import parse_one
-from sqlglot.expressions import Column, Expression, Identifier, Join
+import sqlglot
+from sqlglot.expressions import Column, Expression, Identifier, Join, to_identifier
 from sqlglot.optimizer.eliminate_joins import join_condition
-from sqlglot.optimizer.optimizer import optimize
 
 from splink.internals.database_api import DatabaseAPISubClass
+from splink.internals.dialects import SplinkDialect
 from splink.internals.exceptions import SplinkException
 from splink.internals.input_column import InputColumn
 from splink.internals.misc import ensure_is_list
 from splink.internals.pipeline import CTEPipeline
+from splink.internals.pipeline_scheduler import PipelineScheduler
 from splink.internals.splink_dataframe import SplinkDataFrame
+from splink.internals.sqlglot_cache import optimize_cached, parse_one_cached
 from splink.internals.unique_id_concat import _composite_unique_id_from_nodes_sql
-from splink.internals.vertically_concatenate import vertically_concatenate_sql
+from splink.internals.vertically_concatenate import (
+    BLOCKING_KEY_COLUMN_PREFIX,
+    ROW_KEY_COLUMN_NAME,
+    vertically_concatenate_sql,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -29,6 +38,8 @@ backend_link_type_options = Literal[
     "link_only", "link_and_dedupe", "dedupe_only", "two_dataset_link_only", "self_link"
 ]
 
+deduplication_strategy_options = Literal["auto", "exclude_preceding_rules", "group_by"]
+
 
 def blocking_rule_to_obj(br: BlockingRule | dict[str, Any] | str) -> BlockingRule:
     if isinstance(br, BlockingRule):
@@ -40,7 +51,9 @@ def blocking_rule_to_obj(br: BlockingRule | dict[str, Any] | str) -> BlockingRul
         sqlglot_dialect = br.get("sql_dialect", None)
 
         salting_partitions = br.get("salting_partitions", None)
+        salting_min_comparisons = br.get("salting_min_comparisons", None)
         arrays_to_explode = br.get("arrays_to_explode", None)
+        sorted_neighbourhood_keys = br.get("sorted_neighbourhood_keys", None)
 
         if arrays_to_explode is not None and salting_partitions is not None:
             raise ValueError(
@@ -48,6 +61,40 @@ def blocking_rule_to_obj(br: BlockingRule | dict[str, Any] | str) -> BlockingRul
                 " both salted and exploding"
             )
 
+        minhash_lsh = br.get("minhash_lsh", None)
+        if minhash_lsh is not None:
+            if arrays_to_explode is not None or salting_partitions is not None:
+                raise ValueError(
+                    "MinHash LSH blocking rules cannot be salted or exploding"
+                )
+            return MinHashLSHBlockingRule(blocking_rule, sqlglot_dialect, **minhash_lsh)
+
+        if sorted_neighbourhood_keys is not None:
+            if arrays_to_explode is not None or salting_partitions is not None:
+                raise ValueError(
+                    "Sorted neighbourhood blocking rules cannot be salted "
+                    "or exploding"
+                )
+            return SortedNeighbourhoodBlockingRule(
+                blocking_rule,
+                sqlglot_dialect,
+                sorted_neighbourhood_keys,
+                br.get("sorted_neighbourhood_window", None),
+            )
+
+        if salting_min_comparisons is not None:
+            if salting_partitions is None:
+                raise ValueError(
+                    "salting_min_comparisons can only be used alongside "
+                    "salting_partitions"
+                )
+            return AdaptiveSaltedBlockingRule(
+                blocking_rule,
+                sqlglot_dialect,
+                salting_partitions,
+                salting_min_comparisons,
+            )
+
         if salting_partitions is not None:
             return SaltedBlockingRule(
                 blocking_rule, sqlglot_dialect, salting_partitions
@@ -131,15 +178,26 @@ class BlockingRule:
         """
         if not self.preceding_rules:
             return ""
-        or_clauses = [
-            br.exclude_pairs_generated_by_this_rule_sql(
+        or_clauses = []
+        anti_join_clauses = []
+        for br in self.preceding_rules:
+            exclude_sql = br.exclude_pairs_generated_by_this_rule_sql(
                 source_dataset_input_column,
                 unique_id_input_column,
             )
-            for br in self.preceding_rules
-        ]
-        previous_rules = " OR ".join(or_clauses)
-        return f"AND NOT ({previous_rules})"
+            # Pairs of exploding rules are excluded with a NOT EXISTS on their
+            # id pairs table.  As a top level condition, rather than part of the
+            # OR, this is planned as a hash anti-join
+            if isinstance(br, ExplodingBlockingRule):
+                anti_join_clauses.append(f"AND NOT {exclude_sql}")
+            else:
+                or_clauses.append(exclude_sql)
+
+        sql = ""
+        if or_clauses:
+            previous_rules = " OR ".join(or_clauses)
+            sql = f"AND NOT ({previous_rules})"
+        return " ".join([sql] + anti_join_clauses)
 
     def create_blocked_pairs_sql(
         self,
@@ -149,6 +207,7 @@ class BlockingRule:
         input_tablename_l: str,
         input_tablename_r: str,
         where_condition: str,
+        exclude_preceding_rules: bool = True,
     ) -> str:
         if source_dataset_input_column:
             unique_id_columns = [source_dataset_input_column, unique_id_input_column]
@@ -158,6 +217,12 @@ class BlockingRule:
         uid_l_expr = _composite_unique_id_from_nodes_sql(unique_id_columns, "l")
         uid_r_expr = _composite_unique_id_from_nodes_sql(unique_id_columns, "r")
 
+        exclude_sql = ""
+        if exclude_preceding_rules:
+            exclude_sql = self.exclude_pairs_generated_by_all_preceding_rules_sql(
+                source_dataset_input_column, unique_id_input_column
+            )
+
         sql = f"""
             select
             '{self.match_key}' as match_key,
@@ -168,17 +233,17 @@ class BlockingRule:
             on
             ({self.blocking_rule_sql})
             {where_condition}
-            {self.exclude_pairs_generated_by_all_preceding_rules_sql(
-                source_dataset_input_column,
-                unique_id_input_column)
-            }
+            {exclude_sql}
             """
         return sql
 
     @property
     def _parsed_join_condition(self) -> Join:
-        br = self.blocking_rule_sql
-        return parse_one("INNER JOIN r", into=Join).on(
+        br = parse_one_cached(
+            self.blocking_rule_sql, dialect=self.sqlglot_dialect, copy=False
+        )
+        # .on() copies both the join and the condition
+        return parse_one_cached("INNER JOIN r", into=Join, copy=False).on(
             br, dialect=self.sqlglot_dialect
         )  # using sqlglot==11.4.1
 
@@ -216,6 +281,32 @@ class BlockingRule:
 
         return keys_strings
 
+    def _with_blocking_key_columns(self, key_columns: Dict[str, str]) -> BlockingRule:
+        """A copy of this rule, with the expressions in `key_columns` replaced by
+        references to columns on the input tables which contain their values,
+        e.g. `substr(l.surname, 1, 3)` becomes `l.__splink__bk_1a2b3c4d`"""
+
+        def replace_key_expression(node: Expression) -> Expression:
+            columns = list(node.find_all(Column))
+            tables = {c.table for c in columns}
+            if not columns or len(tables) != 1 or not tables <= {"l", "r"}:
+                return node
+            de_prefixed = node.copy()
+            for c in de_prefixed.find_all(Column):
+                del c.args["table"]
+            key_column = key_columns.get(de_prefixed.sql(self.sqlglot_dialect))
+            if key_column is None:
+                return node
+            return sqlglot.column(key_column, table=tables.pop())
+
+        tree = parse_one_cached(self.blocking_rule_sql, dialect=self.sqlglot_dialect)
+        new_tree = tree.transform(replace_key_expression)
+        rule = copy(self)
+        # Only regenerate the SQL if needed, since it may not round trip exactly
+        if new_tree != tree:
+            rule.blocking_rule_sql = new_tree.sql(self.sqlglot_dialect)
+        return rule
+
     @property
     def _filter_conditions(self):
         # A more accurate term might be "non-equi-join conditions"
@@ -227,7 +318,7 @@ class BlockingRule:
         if not filter_condition:
             return ""
         else:
-            filter_condition = optimize(filter_condition)
+            filter_condition = optimize_cached(filter_condition)
             for i in filter_condition.find_all(Identifier):
                 i.set("quoted", False)
 
@@ -294,6 +385,7 @@ class SaltedBlockingRule(BlockingRule):
         input_tablename_l: str,
         input_tablename_r: str,
         where_condition: str,
+        exclude_preceding_rules: bool = True,
     ) -> str:
         if source_dataset_input_column:
             unique_id_columns = [source_dataset_input_column, unique_id_input_column]
@@ -304,9 +396,11 @@ class SaltedBlockingRule(BlockingRule):
         uid_r_expr = _composite_unique_id_from_nodes_sql(unique_id_columns, "r")
 
         sqls = []
-        exclude_sql = self.exclude_pairs_generated_by_all_preceding_rules_sql(
-            source_dataset_input_column, unique_id_input_column
-        )
+        exclude_sql = ""
+        if exclude_preceding_rules:
+            exclude_sql = self.exclude_pairs_generated_by_all_preceding_rules_sql(
+                source_dataset_input_column, unique_id_input_column
+            )
         for salt in range(self.salting_partitions):
             salt_condition = self._salting_condition(salt)
             sql = f"""
@@ -326,6 +420,315 @@ class SaltedBlockingRule(BlockingRule):
         return " UNION ALL ".join(sqls)
 
 
+class AdaptiveSaltedBlockingRule(SaltedBlockingRule):
+    """A salted blocking rule which only salts skewed blocks: values of the
+    equi-join keys generating at least `salting_min_comparisons` comparisons.
+    All other blocks use a plain join, so are not split into
+    `salting_partitions` joins.
+
+    The skewed keys are found by `materialise_skewed_key_tables()`.  If this has
+    not been called, every block is salted, as with a `SaltedBlockingRule`
+    """
+
+    def __init__(
+        self,
+        blocking_rule: str,
+        sqlglot_dialect: str = None,
+        salting_partitions: int = 1,
+        salting_min_comparisons: int = 1,
+    ):
+        super().__init__(blocking_rule, sqlglot_dialect, salting_partitions)
+        if salting_min_comparisons is None or salting_min_comparisons < 1:
+            raise ValueError("salting_min_comparisons must be specified and >= 1")
+        if not self._equi_join_conditions:
+            raise ValueError(
+                "Only blocking rules with equi-join conditions can be salted "
+                "adaptively, since skewed blocks are identified by their keys"
+            )
+        self.salting_min_comparisons = int(salting_min_comparisons)
+        self.skewed_keys_table: Optional[SplinkDataFrame] = None
+        self.has_skewed_keys: Optional[bool] = None
+
+    def as_dict(self):
+        output = super().as_dict()
+        output["salting_min_comparisons"] = self.salting_min_comparisons
+        return output
+
+    def skewed_keys_sql(self, input_tablename: str) -> str:
+        """The values of the equi-join keys which generate at least
+        salting_min_comparisons comparisons, prior to any filter conditions"""
+        join_conditions = self._equi_join_conditions
+        keys = ", ".join(f"key_{i}" for i in range(len(join_conditions)))
+        l_keys = [l_key for l_key, _ in join_conditions]
+        r_keys = [r_key for _, r_key in join_conditions]
+        l_cols = ", ".join(f"{k} as key_{i}" for i, k in enumerate(l_keys))
+        r_cols = ", ".join(f"{k} as key_{i}" for i, k in enumerate(r_keys))
+        l_group_by = ", ".join(l_keys)
+        r_group_by = ", ".join(r_keys)
+
+        return f"""
+        select {keys}, count_l * count_r as block_count
+        from (
+            select {l_cols}, count(*) as count_l
+            from {input_tablename}
+            group by {l_group_by}
+        ) as counts_l
+        inner join (
+            select {r_cols}, count(*) as count_r
+            from {input_tablename}
+            group by {r_group_by}
+        ) as counts_r
+        using ({keys})
+        where count_l * count_r >= {self.salting_min_comparisons}
+        """
+
+    def _is_skewed_key_sql(self) -> str:
+        """A SQL condition which is true if the record `l` is in a skewed block"""
+        key_conditions = []
+        for i, (l_key, _) in enumerate(self._equi_join_conditions):
+            tree = parse_one_cached(l_key, dialect=self.sqlglot_dialect)
+            for c in tree.find_all(Column):
+                c.set("table", to_identifier("l"))
+            key_conditions.append(
+                f"skewed.key_{i} = {tree.sql(dialect=self.sqlglot_dialect)}"
+            )
+        return f"""EXISTS (
+            select 1 from {self.skewed_keys_table.physical_name} as skewed
+            where {" and ".join(key_conditions)}
+        )"""
+
+    def drop_materialised_skewed_keys_dataframe(self):
+        if self.skewed_keys_table is not None:
+            self.skewed_keys_table.drop_table_from_database_and_remove_from_cache()
+        self.skewed_keys_table = None
+        self.has_skewed_keys = None
+
+    def create_blocked_pairs_sql(
+        self,
+        *,
+        source_dataset_input_column: Optional[InputColumn],
+        unique_id_input_column: InputColumn,
+        input_tablename_l: str,
+        input_tablename_r: str,
+        where_condition: str,
+        exclude_preceding_rules: bool = True,
+    ) -> str:
+        args: dict[str, Any] = dict(
+            source_dataset_input_column=source_dataset_input_column,
+            unique_id_input_column=unique_id_input_column,
+            input_tablename_r=input_tablename_r,
+            where_condition=where_condition,
+            exclude_preceding_rules=exclude_preceding_rules,
+        )
+
+        if self.has_skewed_keys is None:
+            # Not profiled, so salt every block
+            return super().create_blocked_pairs_sql(
+                input_tablename_l=input_tablename_l, **args
+            )
+        if not self.has_skewed_keys:
+            return BlockingRule.create_blocked_pairs_sql(
+                self, input_tablename_l=input_tablename_l, **args
+            )
+
+        # Split the left hand records by whether they are in a skewed block.
+        # Since blocks are defined by equality of the keys, the pairs from the
+        # two sides are disjoint
+        is_skewed = self._is_skewed_key_sql()
+        unskewed_sql = BlockingRule.create_blocked_pairs_sql(
+            self,
+            input_tablename_l=f"""(
+                select * from {input_tablename_l} as l where not {is_skewed}
+            )""",
+            **args,
+        )
+        skewed_sql = super().create_blocked_pairs_sql(
+            input_tablename_l=f"""(
+                select * from {input_tablename_l} as l where {is_skewed}
+            )""",
+            **args,
+        )
+        return f"{unskewed_sql} UNION ALL {skewed_sql}"
+
+
+class SortedNeighbourhoodBlockingRule(BlockingRule):
+    """Pairs each record with the `window_size` records which follow it, when all
+    records are sorted by the `sort_keys` SQL expressions.  Records with a null
+    sort key are not paired.  This catches near matches of the keys, such as
+    surnames with typos, which an equi-join cannot, and generates a predictable
+    number of pairs: at most n * window_size for n records.
+
+    The blocking rule SQL is a condition which the pairs must also satisfy, which
+    is `1=1` if all neighbouring pairs are to be kept.
+
+    Unlike other blocking rules, whether a pair is generated by this rule depends
+    on the other records, so its pairs cannot be excluded from those of
+    subsequent rules by a condition.  The 'group_by' deduplication strategy is
+    used instead (see `_choose_deduplication_strategy()`)
+
+    All records are sorted in a single window, with no partition.  On a
+    distributed backend such as Spark, this moves every record with non null
+    sort keys to one partition, to be sorted by a single task.
+    """
+
+    def __init__(
+        self,
+        blocking_rule: str = "1=1",
+        sqlglot_dialect: str = None,
+        sort_keys: Optional[list[str]] = None,
+        window_size: int = 1,
+    ):
+        super().__init__(blocking_rule, sqlglot_dialect)
+        sort_keys = ensure_is_list(sort_keys) if sort_keys is not None else []
+        if not sort_keys:
+            raise ValueError(
+                "At least one sort key must be specified for a sorted "
+                "neighbourhood blocking rule"
+            )
+        if window_size is None or window_size < 1:
+            raise ValueError("sorted_neighbourhood_window must be specified and >= 1")
+        self.sort_keys: List[str] = sort_keys
+        self.window_size = int(window_size)
+
+    def as_dict(self):
+        output = super().as_dict()
+        output["sorted_neighbourhood_keys"] = self.sort_keys
+        output["sorted_neighbourhood_window"] = self.window_size
+        return output
+
+    def _as_completed_dict(self):
+        return self.as_dict()
+
+    @property
+    def _human_readable_succinct(self):
+        sql = self._abbreviated_sql(75)
+        return (
+            f"Sorted neighbourhood blocking rule on {', '.join(self.sort_keys)} "
+            f"with window {self.window_size} using SQL: {sql}"
+        )
+
+    def exclude_pairs_generated_by_this_rule_sql(
+        self,
+        source_dataset_input_column: Optional[InputColumn],
+        unique_id_input_column: InputColumn,
+    ) -> str:
+        raise SplinkException(
+            "The pairs generated by a sorted neighbourhood blocking rule cannot be "
+            "excluded from those of subsequent blocking rules.  Use the 'group_by' "
+            "deduplication strategy."
+        )
+
+    def sort_keys_not_null_sql(self) -> str:
+        return " and ".join(f"{k} is not null" for k in self.sort_keys)
+
+    def sort_keys_sql(
+        self, unique_id_columns: List[InputColumn], input_tablenames: List[str]
+    ) -> str:
+        """The unique id and sort keys of the records of the input tables with
+        non null sort keys"""
+        uid_expr = _composite_unique_id_from_nodes_sql(unique_id_columns, "l")
+        keys = ", ".join(
+            f"{k} as __splink__sn_key_{i}" for i, k in enumerate(self.sort_keys)
+        )
+        not_null = self.sort_keys_not_null_sql()
+        return " UNION ALL ".join(
+            f"""
+            select {uid_expr} as __splink__sn_id, {keys}
+            from {tablename} as l
+            where {not_null}
+            """
+            # In a dedupe, both input tables are the same table
+            for tablename in dict.fromkeys(input_tablenames)
+        )
+
+    def _neighbours_sql(
+        self, unique_id_columns: List[InputColumn], input_tablenames: List[str]
+    ) -> str:
+        """The unique id of each record with non null sort keys, with the unique
+        id of each record within `window_size` places of it in the sort order.
+
+        The neighbours are found by lead() and lag() windows, rather than by a
+        range join on rank, so each record is only joined to its neighbours.
+        The windows have no partition by, as the neighbours of a record may be
+        anywhere in the sort order, so on Spark they run in a single partition"""
+        order_by = ", ".join(
+            f"__splink__sn_key_{i}" for i in range(len(self.sort_keys))
+        )
+        w = self.window_size
+        offsets = [k for k in range(-w, w + 1) if k != 0]
+        # The unique id breaks ties, so the neighbours are deterministic
+        neighbours = ",\n".join(
+            f"{'lead' if k > 0 else 'lag'}(__splink__sn_id, {abs(k)}) "
+            f"over (order by {order_by}, __splink__sn_id) as __splink__sn_n{i}"
+            for i, k in enumerate(offsets)
+        )
+        # Unpivot the neighbours into one row each
+        offsets_sql = " UNION ALL ".join(
+            f"select {i} as __splink__sn_offset" for i in range(len(offsets))
+        )
+        neighbour_case = " ".join(
+            f"when {i} then w.__splink__sn_n{i}" for i in range(len(offsets))
+        )
+        return f"""
+            select
+            w.__splink__sn_id,
+            case o.__splink__sn_offset {neighbour_case} end
+                as __splink__sn_neighbour_id
+            from (
+                select __splink__sn_id, {neighbours}
+                from ({self.sort_keys_sql(unique_id_columns, input_tablenames)})
+                    as sort_keys
+            ) as w
+            cross join ({offsets_sql}) as o
+        """
+
+    def create_blocked_pairs_sql(
+        self,
+        *,
+        source_dataset_input_column: Optional[InputColumn],
+        unique_id_input_column: InputColumn,
+        input_tablename_l: str,
+        input_tablename_r: str,
+        where_condition: str,
+        exclude_preceding_rules: bool = True,
+    ) -> str:
+        unique_id_columns = combine_unique_id_input_columns(
+            source_dataset_input_column, unique_id_input_column
+        )
+
+        uid_l_expr = _composite_unique_id_from_nodes_sql(unique_id_columns, "l")
+        uid_r_expr = _composite_unique_id_from_nodes_sql(unique_id_columns, "r")
+
+        exclude_sql = ""
+        if exclude_preceding_rules:
+            exclude_sql = self.exclude_pairs_generated_by_all_preceding_rules_sql(
+                source_dataset_input_column, unique_id_input_column
+            )
+
+        # Records are sorted across both input tables, so that in a two dataset
+        # link, records are paired with their neighbours from the other table.
+        # Neighbours are found in both directions, leaving the where condition
+        # to keep the pair in the correct order
+        neighbours_sql = self._neighbours_sql(
+            unique_id_columns, [input_tablename_l, input_tablename_r]
+        )
+        sql = f"""
+            select
+            '{self.match_key}' as match_key,
+            {uid_l_expr} as join_key_l,
+            {uid_r_expr} as join_key_r
+            from ({neighbours_sql}) as neighbours
+            inner join {input_tablename_l} as l
+            on {uid_l_expr} = neighbours.__splink__sn_id
+            inner join {input_tablename_r} as r
+            on {uid_r_expr} = neighbours.__splink__sn_neighbour_id
+            and ({self.blocking_rule_sql})
+            {where_condition}
+            {exclude_sql}
+            """
+        return sql
+
+
 def _explode_arrays_sql(db_api, tbl_name, columns_to_explode, other_columns_to_retain):
     return db_api.sql_dialect.explode_arrays_sql(
         tbl_name, columns_to_explode, other_columns_to_retain
@@ -348,6 +751,9 @@ class ExplodingBlockingRule(BlockingRule):
         super().__init__(blocking_rule_sql, sqlglot_dialect)
         self.array_columns_to_explode: List[str] = array_columns_to_explode
         self.exploded_id_pair_table: Optional[SplinkDataFrame] = None
+        # Whether the pairs in exploded_id_pair_table also carry the integer
+        # __splink__row_key of each record, which pairs are then matched on
+        self.exploded_id_pairs_have_row_keys: bool = False
 
     def marginal_exploded_id_pairs_table_sql(
         self,
@@ -358,7 +764,10 @@ class ExplodingBlockingRule(BlockingRule):
     ) -> str:
         """generates a table of the marginal id pairs from the exploded blocking rule
         i.e. pairs are only created that match this blocking rule and NOT any of
-        the preceding blocking rules
+        the preceding blocking rules.
+
+        If `exploded_id_pairs_have_row_keys`, the pairs also carry the row key of
+        each record, as __splink__row_key_l and __splink__row_key_r
         """
 
         unique_id_col = unique_id_input_column
@@ -376,13 +785,26 @@ class ExplodingBlockingRule(BlockingRule):
                 where_condition + " and l.source_dataset < r.source_dataset"
             )
 
-        exclude_sql = self.exclude_pairs_generated_by_all_preceding_rules_sql(
+        # The pairs of preceding sorted neighbourhood rules cannot be excluded, and
+        # are removed when the blocked pairs are deduplicated
+        excludable_br = copy(self)
+        excludable_br.preceding_rules = [
+            br
+            for br in self.preceding_rules
+            if not isinstance(br, SortedNeighbourhoodBlockingRule)
+        ]
+        exclude_sql = excludable_br.exclude_pairs_generated_by_all_preceding_rules_sql(
             source_dataset_input_column, unique_id_input_column
         )
+        row_key_cols = ""
+        if self.exploded_id_pairs_have_row_keys:
+            row_key_cols = f""",
+                l.{ROW_KEY_COLUMN_NAME} as {ROW_KEY_COLUMN_NAME}_l,
+                r.{ROW_KEY_COLUMN_NAME} as {ROW_KEY_COLUMN_NAME}_r"""
         sql = f"""
             select distinct
                 {id_expr_l} as {unique_id_col.name_l},
-                {id_expr_r} as {unique_id_col.name_r}
+                {id_expr_r} as {unique_id_col.name_r}{row_key_cols}
             from __splink__df_concat_unnested as l
             inner join __splink__df_concat_unnested as r
             on ({br.blocking_rule_sql})
@@ -392,10 +814,15 @@ class ExplodingBlockingRule(BlockingRule):
 
         return sql
 
+    @property
+    def _unnested_table_key(self) -> Tuple[Any, ...]:
+        return tuple(sorted(self.array_columns_to_explode))
+
     def drop_materialised_id_pairs_dataframe(self):
         if self.exploded_id_pair_table is not None:
             self.exploded_id_pair_table.drop_table_from_database_and_remove_from_cache()
         self.exploded_id_pair_table = None
+        self.exploded_id_pairs_have_row_keys = False
 
     def exclude_pairs_generated_by_this_rule_sql(
         self,
@@ -419,13 +846,22 @@ class ExplodingBlockingRule(BlockingRule):
                 "to set `exploded_id_pair_table` before calling "
                 "exclude_pairs_generated_by_this_rule_sql()."
             )
-        ids_to_compare_sql = f"select * from {splink_df.physical_name}"
+        if self.exploded_id_pairs_have_row_keys:
+            # Integer keys, which are unique, rather than composite ids
+            return f"""EXISTS (
+            select 1 from {splink_df.physical_name} as ids_to_compare
+            where (
+                l.{ROW_KEY_COLUMN_NAME} = ids_to_compare.{ROW_KEY_COLUMN_NAME}_l and
+                r.{ROW_KEY_COLUMN_NAME} = ids_to_compare.{ROW_KEY_COLUMN_NAME}_r
+            )
+        )
+        """
 
         id_expr_l = _composite_unique_id_from_nodes_sql(unique_id_input_columns, "l")
         id_expr_r = _composite_unique_id_from_nodes_sql(unique_id_input_columns, "r")
 
         return f"""EXISTS (
-            select 1 from ({ids_to_compare_sql}) as ids_to_compare
+            select 1 from {splink_df.physical_name} as ids_to_compare
             where (
                 {id_expr_l} = ids_to_compare.{unique_id_column.name_l} and
                 {id_expr_r} = ids_to_compare.{unique_id_column.name_r}
@@ -441,7 +877,12 @@ class ExplodingBlockingRule(BlockingRule):
         input_tablename_l: str,
         input_tablename_r: str,
         where_condition: str,
+        exclude_preceding_rules: bool = True,
     ) -> str:
+        # The materialised id pairs already exclude pairs generated by preceding
+        # rules, so exclude_preceding_rules has no effect.  They also meet the
+        # link type conditions of where_condition, which is applied for any
+        # further conditions on the records
         if self.exploded_id_pair_table is None:
             raise ValueError(
                 "Exploding blocking rules are not supported for the function you have"
@@ -456,6 +897,12 @@ class ExplodingBlockingRule(BlockingRule):
         uid_l_expr = _composite_unique_id_from_nodes_sql(unique_id_input_columns, "l")
         uid_r_expr = _composite_unique_id_from_nodes_sql(unique_id_input_columns, "r")
 
+        join_l = f"pairs.{unique_id_col.name_l}={uid_l_expr}"
+        join_r = f"pairs.{unique_id_col.name_r}={uid_r_expr}"
+        if self.exploded_id_pairs_have_row_keys:
+            join_l = f"pairs.{ROW_KEY_COLUMN_NAME}_l = l.{ROW_KEY_COLUMN_NAME}"
+            join_r = f"pairs.{ROW_KEY_COLUMN_NAME}_r = r.{ROW_KEY_COLUMN_NAME}"
+
         exploded_id_pair_table = self.exploded_id_pair_table
         sql = f"""
             select
@@ -464,9 +911,10 @@ class ExplodingBlockingRule(BlockingRule):
                 {uid_r_expr} as join_key_r
             from {exploded_id_pair_table.physical_name} as pairs
             left join {input_tablename_l} as l
-                on pairs.{unique_id_col.name_l}={uid_l_expr}
+                on {join_l}
             left join {input_tablename_r} as r
-                on pairs.{unique_id_col.name_r}={uid_r_expr}
+                on {join_r}
+            {where_condition}
         """
         return sql
 
@@ -476,6 +924,122 @@ class ExplodingBlockingRule(BlockingRule):
         return output
 
 
+class MinHashLSHBlockingRule(ExplodingBlockingRule):
+    """Compares records with similar sets of tokens: the overlapping substrings
+    of length `ngram_size` of a string column, or the elements of an array
+    column if `ngram_size` is None.
+
+    The tokens of each record are summarised by a MinHash signature of
+    `bands * rows` values, split into `bands` bands of `rows` values.  Two
+    records are compared if all values of any band are equal, which for
+    records whose tokens have Jaccard similarity s, has probability
+    1 - (1 - s^rows)^bands.  More rows make the rule stricter, and more bands
+    more lenient.
+
+    A key for each band is computed in SQL, and records are blocked on the
+    band keys as for an `ExplodingBlockingRule`, so only `bands` rows per
+    record are exploded, rather than every token.  The blocking rule SQL is a
+    condition which the pairs must also satisfy, which is `1=1` if all
+    candidate pairs are to be kept.
+    """
+
+    band_keys_column = "__splink__lsh_band_keys"
+
+    def __init__(
+        self,
+        blocking_rule: str = "1=1",
+        sqlglot_dialect: str = None,
+        column: str = None,
+        bands: int = 20,
+        rows: int = 5,
+        ngram_size: Optional[int] = None,
+    ):
+        if column is None:
+            raise ValueError("A column must be specified for MinHash LSH blocking")
+        if bands is None or bands < 1 or rows is None or rows < 1:
+            raise ValueError("MinHash LSH bands and rows must be >= 1")
+        if ngram_size is not None and ngram_size < 1:
+            raise ValueError("MinHash LSH ngram_size must be >= 1")
+
+        band_keys = self.band_keys_column
+        blocking_rule_sql = f"l.{band_keys} = r.{band_keys}"
+        if blocking_rule.strip() != "1=1":
+            blocking_rule_sql = f"{blocking_rule_sql} AND ({blocking_rule})"
+        super().__init__(blocking_rule_sql, sqlglot_dialect, [band_keys])
+
+        self.filter_condition_sql = blocking_rule
+        self.column = column
+        self.bands = int(bands)
+        self.rows = int(rows)
+        self.ngram_size = None if ngram_size is None else int(ngram_size)
+
+    def as_dict(self):
+        output = BlockingRule.as_dict(self)
+        output["blocking_rule"] = self.filter_condition_sql
+        output["minhash_lsh"] = {
+            "column": self.column,
+            "bands": self.bands,
+            "rows": self.rows,
+            "ngram_size": self.ngram_size,
+        }
+        return output
+
+    def _as_completed_dict(self):
+        return self.as_dict()
+
+    @property
+    def _unnested_table_key(self) -> Tuple[Any, ...]:
+        return ("minhash_lsh", self.column, self.bands, self.rows, self.ngram_size)
+
+    @property
+    def _human_readable_succinct(self):
+        return (
+            f"MinHash LSH blocking rule on {self.column} with {self.bands} bands "
+            f"of {self.rows} rows using SQL: {self._abbreviated_sql(75)}"
+        )
+
+    def band_keys_sqls(
+        self,
+        input_tablename: str,
+        sql_dialect: SplinkDialect,
+        columns_to_retain: List[str],
+        output_table_name: str,
+    ) -> list[dict[str, str]]:
+        """SQL to add the array of band keys of each record of `input_tablename`
+        as the column __splink__lsh_band_keys, retaining `columns_to_retain`"""
+        # Null and empty values have no tokens, and so no band keys: otherwise
+        # they would all share the same band keys and be compared to each other
+        if self.ngram_size is None:
+            tokens_sql = sql_dialect.array_without_nulls_sql(self.column)
+        else:
+            tokens_sql = sql_dialect.array_without_nulls_sql(
+                sql_dialect.ngrams_sql(f"nullif({self.column}, '')", self.ngram_size)
+            )
+
+        band_keys_sql = sql_dialect.minhash_band_keys_sql(
+            "__splink__lsh_tokens", self.bands, self.rows
+        )
+        retain_sql = "".join(f"{c}, " for c in columns_to_retain)
+        tokens_table_name = f"{output_table_name}_tokens"
+        sqls = [
+            {
+                "sql": f"""
+                select {retain_sql}{tokens_sql} as __splink__lsh_tokens
+                from {input_tablename}
+                """,
+                "output_table_name": tokens_table_name,
+            },
+            {
+                "sql": f"""
+                select {retain_sql}{band_keys_sql} as {self.band_keys_column}
+                from {tokens_table_name}
+                """,
+                "output_table_name": output_table_name,
+            },
+        ]
+        return sqls
+
+
 def materialise_exploded_id_tables(
     link_type: "LinkTypeLiteralType",
     blocking_rules: List[BlockingRule],
@@ -483,47 +1047,90 @@ def materialise_exploded_id_tables(
     splink_df_dict: dict[str, SplinkDataFrame],
     source_dataset_input_column: Optional[InputColumn],
     unique_id_input_column: InputColumn,
+    nodes_with_tf: Optional[SplinkDataFrame] = None,
 ) -> list[ExplodingBlockingRule]:
+    """Materialise the id pairs of each exploding blocking rule, excluding the
+    pairs of preceding rules.
+
+    If `nodes_with_tf` (the materialised __splink__df_concat_with_tf) has a
+    unique row key, its records are exploded, and the pairs also carry the row
+    key of each record.  Later rules then exclude these pairs by comparing the
+    integer row keys, rather than composite unique ids.
+    """
     exploding_blocking_rules = [
         br for br in blocking_rules if isinstance(br, ExplodingBlockingRule)
     ]
 
     if len(exploding_blocking_rules) == 0:
         return []
-    exploded_tables = []
-
-    pipeline = CTEPipeline()
 
-    sql = vertically_concatenate_sql(
-        splink_df_dict,
-        salting_required=False,
-        source_dataset_input_column=source_dataset_input_column,
+    use_row_keys = (
+        nodes_with_tf is not None
+        and available_row_key_column(nodes_with_tf, []) is not None
     )
-    pipeline.enqueue_sql(sql, "__splink__df_concat")
-    nodes_concat = db_api.sql_pipeline_to_splink_dataframe(pipeline)
+    if use_row_keys:
+        nodes_concat = nodes_with_tf
+    else:
+        pipeline = CTEPipeline()
+        sql = vertically_concatenate_sql(
+            splink_df_dict,
+            salting_required=False,
+            source_dataset_input_column=source_dataset_input_column,
+        )
+        pipeline.enqueue_sql(sql, "__splink__df_concat")
+        nodes_concat = db_api.sql_pipeline_to_splink_dataframe(pipeline)
+    nodes_tablename = nodes_concat.templated_name
 
     input_colnames = {col.name for col in nodes_concat.columns}
 
-    for br in exploding_blocking_rules:
-        pipeline = CTEPipeline([nodes_concat])
-        arrays_to_explode_quoted = [
-            InputColumn(colname, sql_dialect=db_api.sql_dialect.name).quote().name
-            for colname in br.array_columns_to_explode
-        ]
+    # Rules which explode the same arrays share an unnested table, which is
+    # materialised once.  An unnested table used by a single rule is computed
+    # in the same pipeline as the rule's id pairs
+    num_rules_by_unnested_key = Counter(
+        br._unnested_table_key for br in exploding_blocking_rules
+    )
+    unnested_tables: Dict[Tuple[Any, ...], SplinkDataFrame] = {}
 
-        expl_sql = db_api.sql_dialect.explode_arrays_sql(
-            "__splink__df_concat",
-            br.array_columns_to_explode,
-            list(input_colnames.difference(arrays_to_explode_quoted)),
-        )
+    for br in exploding_blocking_rules:
+        unnested_key = br._unnested_table_key
+        if unnested_key in unnested_tables:
+            pipeline = CTEPipeline([unnested_tables[unnested_key]])
+        else:
+            pipeline = CTEPipeline([nodes_concat])
+            arrays_to_explode_quoted = [
+                InputColumn(colname, sql_dialect=db_api.sql_dialect.name).quote().name
+                for colname in br.array_columns_to_explode
+            ]
+
+            input_tablename = nodes_tablename
+            if isinstance(br, MinHashLSHBlockingRule):
+                input_tablename = "__splink__df_concat_with_lsh_band_keys"
+                sqls = br.band_keys_sqls(
+                    nodes_tablename,
+                    db_api.sql_dialect,
+                    list(input_colnames),
+                    input_tablename,
+                )
+                pipeline.enqueue_list_of_sqls(sqls)
+
+            expl_sql = db_api.sql_dialect.explode_arrays_sql(
+                input_tablename,
+                br.array_columns_to_explode,
+                list(input_colnames.difference(arrays_to_explode_quoted)),
+            )
 
-        pipeline.enqueue_sql(
-            expl_sql,
-            "__splink__df_concat_unnested",
-        )
+            pipeline.enqueue_sql(
+                expl_sql,
+                "__splink__df_concat_unnested",
+            )
+            if num_rules_by_unnested_key[unnested_key] > 1:
+                unnested_table = db_api.sql_pipeline_to_splink_dataframe(pipeline)
+                unnested_tables[unnested_key] = unnested_table
+                pipeline = CTEPipeline([unnested_table])
 
         base_name = "__splink__marginal_exploded_ids_blocking_rule"
         table_name = f"{base_name}_mk_{br.match_key}"
+        br.exploded_id_pairs_have_row_keys = use_row_keys
 
         sql = br.marginal_exploded_id_pairs_table_sql(
             source_dataset_input_column=source_dataset_input_column,
@@ -536,11 +1143,116 @@ def materialise_exploded_id_tables(
 
         marginal_ids_table = db_api.sql_pipeline_to_splink_dataframe(pipeline)
         br.exploded_id_pair_table = marginal_ids_table
-        exploded_tables.append(marginal_ids_table)
+
+    for unnested_table in unnested_tables.values():
+        unnested_table.drop_table_from_database_and_remove_from_cache()
 
     return exploding_blocking_rules
 
 
+def materialise_skewed_key_tables(
+    blocking_rules: List[BlockingRule],
+    db_api: DatabaseAPISubClass,
+    splink_df_dict: dict[str, SplinkDataFrame],
+    source_dataset_input_column: Optional[InputColumn],
+    nodes_concat: Optional[SplinkDataFrame] = None,
+) -> list[AdaptiveSaltedBlockingRule]:
+    """Find the skewed blocks of each adaptively salted blocking rule, so that only
+    these are salted.
+
+    The blocks are those of `nodes_concat` if given, for instance records which
+    have been updated since the input tables were registered, or otherwise of
+    the input tables"""
+    adaptive_blocking_rules = [
+        br for br in blocking_rules if isinstance(br, AdaptiveSaltedBlockingRule)
+    ]
+
+    if len(adaptive_blocking_rules) == 0:
+        return []
+
+    if nodes_concat is None:
+        pipeline = CTEPipeline()
+        sql = vertically_concatenate_sql(
+            splink_df_dict,
+            salting_required=False,
+            source_dataset_input_column=source_dataset_input_column,
+        )
+        pipeline.enqueue_sql(sql, "__splink__df_concat")
+        nodes_concat = db_api.sql_pipeline_to_splink_dataframe(pipeline)
+
+    # The skewed keys of each rule are independent, so may be found concurrently
+    scheduler = PipelineScheduler(db_api)
+    skewed_keys_names = {}
+    for br in adaptive_blocking_rules:
+        pipeline = CTEPipeline([nodes_concat])
+        pipeline.enqueue_sql(
+            br.skewed_keys_sql(nodes_concat.templated_name),
+            f"__splink__skewed_keys_blocking_rule_mk_{br.match_key}",
+        )
+        skewed_keys_names[br.match_key] = scheduler.add_pipeline(pipeline)
+    results = scheduler.run()
+
+    for br in adaptive_blocking_rules:
+        skewed_keys_table = results[skewed_keys_names[br.match_key]]
+        n_skewed = skewed_keys_table._row_count()
+        logger.info(
+            f"Blocking rule {br.blocking_rule_sql} has {n_skewed} block(s) of "
+            f">= {br.salting_min_comparisons:,.0f} comparisons, which will be salted"
+        )
+        br.skewed_keys_table = skewed_keys_table
+        br.has_skewed_keys = n_skewed > 0
+
+    return adaptive_blocking_rules
+
+
+def blocking_key_column_name(key_expression_sql: str) -> str:
+    # Named by a hash of the expression, so that a column is only used by a
+    # blocking rule if it holds the values of the same expression
+    key_hash = hashlib.md5(key_expression_sql.encode()).hexdigest()[:8]
+    return f"{BLOCKING_KEY_COLUMN_PREFIX}{key_hash}"
+
+
+def blocking_key_columns(blocking_rules: List[BlockingRule]) -> Dict[str, str]:
+    """The equi-join key expressions of the blocking rules which are worth
+    computing once per record, mapped to the name of a column to hold them.
+
+    These are expressions other than plain columns, which are the same on
+    both sides of the join, such as `substr(l.surname, 1, 3) = substr(r.surname,
+    1, 3)`
+    """
+    key_columns = {}
+    for br in blocking_rules:
+        # Exploding rules join on the unnested table, not the nodes table
+        if isinstance(br, ExplodingBlockingRule):
+            continue
+        for l_key, r_key in br._equi_join_conditions:
+            if l_key != r_key:
+                continue
+            tree = parse_one_cached(l_key, dialect=br.sqlglot_dialect, copy=False)
+            if isinstance(tree, Column):
+                continue
+            key_columns[l_key] = blocking_key_column_name(l_key)
+    return key_columns
+
+
+def _use_blocking_key_columns(
+    blocking_rules: List[BlockingRule], key_columns: Dict[str, str]
+) -> List[BlockingRule]:
+    rewritten: Dict[int, BlockingRule] = {}
+
+    def rewrite(br: BlockingRule) -> BlockingRule:
+        if id(br) not in rewritten:
+            if isinstance(br, ExplodingBlockingRule):
+                rewritten[id(br)] = br
+            else:
+                new_br = br._with_blocking_key_columns(key_columns)
+                rewritten[id(br)] = new_br
+                new_br.preceding_rules = [rewrite(p) for p in br.preceding_rules]
+        return rewritten[id(br)]
+
+    return [rewrite(br) for br in blocking_rules]
+
+
 def _sql_gen_where_condition(
     link_type: backend_link_type_options, unique_id_cols: List[InputColumn]
 ) -> str:
@@ -561,6 +1273,56 @@ def _sql_gen_where_condition(
     return where_condition
 
 
+def _choose_deduplication_strategy(
+    blocking_rules: List[BlockingRule],
+) -> deduplication_strategy_options:
+    # Excluding the pairs of preceding rules evaluates the condition of every
+    # preceding rule against the candidate pairs of each rule, which grows
+    # quadratically with the number of rules.  Deduplicating costs a single
+    # aggregation over the pairs, so is cheaper once the number of exclusion
+    # conditions exceeds the number of rules (more than three rules).
+    # An exploding preceding rule is excluded using an EXISTS subquery on its
+    # id pairs table, which is more costly than a condition.  The pairs of a
+    # sorted neighbourhood rule cannot be excluded by a condition at all
+    exclusion_cost = 0
+    for br in blocking_rules:
+        for preceding_br in br.preceding_rules:
+            if isinstance(preceding_br, SortedNeighbourhoodBlockingRule):
+                return "group_by"
+            is_exploding = isinstance(preceding_br, ExplodingBlockingRule)
+            exclusion_cost += len(blocking_rules) if is_exploding else 1
+
+    if exclusion_cost > len(blocking_rules):
+        return "group_by"
+    return "exclude_preceding_rules"
+
+
+def available_row_key_column(
+    nodes_with_tf: SplinkDataFrame,
+    blocking_rules: List[BlockingRule],
+) -> Optional[InputColumn]:
+    """The __splink__row_key column of `nodes_with_tf`, to use to identify records
+    when blocking with `blocking_rules` and computing comparison vectors, or None
+    if the unique id columns must be used.
+
+    Exploding rules materialise their pairs of unique ids from the input tables,
+    and sorted neighbourhood rules order ties by unique id, so they use the
+    unique id columns.  So do tables whose row key is a hash which collides.
+    """
+    if any(
+        isinstance(br, (ExplodingBlockingRule, SortedNeighbourhoodBlockingRule))
+        for br in blocking_rules
+    ):
+        return None
+    if ROW_KEY_COLUMN_NAME not in {c.unquote().name for c in nodes_with_tf.columns}:
+        return None
+    if nodes_with_tf.metadata.get("row_key_is_unique") is False:
+        return None
+    return InputColumn(
+        ROW_KEY_COLUMN_NAME, sql_dialect=nodes_with_tf.db_api.sql_dialect.name
+    )
+
+
 def block_using_rules_sqls(
     *,
     input_tablename_l: str,
@@ -569,13 +1331,33 @@ def block_using_rules_sqls(
     link_type: "LinkTypeLiteralType",
     source_dataset_input_column: Optional[InputColumn],
     unique_id_input_column: InputColumn,
+    deduplication_strategy: deduplication_strategy_options = "auto",
+    blocking_key_columns: Optional[Dict[str, str]] = None,
+    row_key_column: Optional[InputColumn] = None,
+    left_record_condition: Optional[str] = None,
 ) -> list[dict[str, str]]:
     """Use the blocking rules specified in the linker's settings object to
     generate a SQL statement that will create pairwise record comparions
     according to the blocking rule(s).
 
     Where there are multiple blocking rules, the SQL statement contains logic
-    so that duplicate comparisons are not generated.
+    so that duplicate comparisons are not generated.  With the
+    'exclude_preceding_rules' strategy, each rule excludes the pairs generated by
+    the rules before it.  With 'group_by', the pairs of all rules are combined
+    and each pair is attributed to the first rule which generated it.  'auto'
+    chooses between these based on the number of rules.
+
+    `blocking_key_columns` maps key expressions to columns of the input tables
+    which hold their precomputed values (see `blocking_key_columns()`).  Blocking
+    rules join on these columns rather than evaluating the expressions.
+
+    If `row_key_column` is given (see `available_row_key_column()`), the pairs are
+    identified by its integer values rather than the unique ids.  The same column
+    must then be passed to `compute_comparison_vector_values_from_id_pairs_sqls`.
+
+    If `left_record_condition` is given, only pairs whose left record `l`
+    satisfies it are generated, for instance to block one partition of the
+    records at a time.
     """
 
     sqls = []
@@ -585,6 +1367,8 @@ def block_using_rules_sqls(
     )
 
     where_condition = _sql_gen_where_condition(link_type, unique_id_input_columns)
+    if left_record_condition is not None:
+        where_condition = f"{where_condition} and ({left_record_condition})"
 
     # Cover the case where there are no blocking rules
     # This is a bit of a hack where if you do a self-join on 'true'
@@ -593,6 +1377,24 @@ def block_using_rules_sqls(
     if not blocking_rules:
         blocking_rules = [BlockingRule("1=1")]
 
+    if blocking_key_columns:
+        blocking_rules = _use_blocking_key_columns(blocking_rules, blocking_key_columns)
+
+    if deduplication_strategy == "auto":
+        deduplication_strategy = _choose_deduplication_strategy(blocking_rules)
+    if deduplication_strategy not in ("exclude_preceding_rules", "group_by"):
+        raise ValueError(
+            f"Unknown deduplication_strategy '{deduplication_strategy}'. "
+            "Must be one of 'auto', 'exclude_preceding_rules' or 'group_by'"
+        )
+    exclude_preceding_rules = deduplication_strategy == "exclude_preceding_rules"
+
+    # The link type conditions still compare unique ids, so the pairs (and which
+    # record of each is on the left) are the same whichever key identifies them
+    if row_key_column is not None:
+        unique_id_input_column = row_key_column
+        source_dataset_input_column = None
+
     br_sqls = []
 
     for br in blocking_rules:
@@ -602,11 +1404,36 @@ def block_using_rules_sqls(
             input_tablename_l=input_tablename_l,
             input_tablename_r=input_tablename_r,
             where_condition=where_condition,
+            exclude_preceding_rules=exclude_preceding_rules,
         )
+        if not exclude_preceding_rules:
+            # match_key is a string, so is ranked using its number
+            sql = f"""
+            select {br.match_key} as match_key_rank, join_key_l, join_key_r
+            from ({sql}) as pairs_mk_{br.match_key}
+            """
         br_sqls.append(sql)
 
     sql = " UNION ALL ".join(br_sqls)
 
+    if exclude_preceding_rules:
+        sqls.append({"sql": sql, "output_table_name": "__splink__blocked_id_pairs"})
+        return sqls
+
+    sqls.append(
+        {"sql": sql, "output_table_name": "__splink__blocked_id_pairs_with_duplicates"}
+    )
+    match_key_cases = " ".join(
+        f"when {br.match_key} then '{br.match_key}'" for br in blocking_rules
+    )
+    sql = f"""
+    select
+        case min(match_key_rank) {match_key_cases} end as match_key,
+        join_key_l,
+        join_key_r
+    from __splink__blocked_id_pairs_with_duplicates
+    group by join_key_l, join_key_r
+    """
     sqls.append({"sql": sql, "output_table_name": "__splink__blocked_id_pairs"})
 
     return sqls
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import logging
+import math
 from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple, Union
 
 import pandas as pd
@@ -8,6 +9,9 @@ import sqlglot
 
 from splink.internals.blocking import (
     BlockingRule,
+    ExplodingBlockingRule,
+    MinHashLSHBlockingRule,
+    SortedNeighbourhoodBlockingRule,
     _sql_gen_where_condition,
     backend_link_type_options,
     block_using_rules_sqls,
@@ -24,6 +28,7 @@ from splink.internals.database_api import AcceptableInputTableType, DatabaseAPIS
 from splink.internals.input_column import InputColumn
 from splink.internals.misc import calculate_cartesian, ensure_is_iterable
 from splink.internals.pipeline import CTEPipeline
+from splink.internals.pipeline_scheduler import PipelineScheduler
 from splink.internals.splink_dataframe import SplinkDataFrame
 from splink.internals.vertically_concatenate import (
     split_df_concat_with_tf_into_two_tables_sqls,
@@ -32,6 +37,8 @@ from splink.internals.vertically_concatenate import (
 
 logger = logging.getLogger(__name__)
 
+_MAX_INCLUSION_EXCLUSION_TERMS = 256
+
 
 def _number_of_comparisons_generated_by_blocking_rule_post_filters_sqls(
     input_data_dict: dict[str, "SplinkDataFrame"],
@@ -72,6 +79,24 @@ def _number_of_comparisons_generated_by_blocking_rule_post_filters_sqls(
         input_tablename_l = "__splink__df_concat"
         input_tablename_r = "__splink__df_concat"
 
+    if isinstance(blocking_rule, SortedNeighbourhoodBlockingRule):
+        blocked_pairs_sql = blocking_rule.create_blocked_pairs_sql(
+            source_dataset_input_column=source_dataset_input_column,
+            unique_id_input_column=unique_id_input_column,
+            input_tablename_l=input_tablename_l,
+            input_tablename_r=input_tablename_r,
+            where_condition=where_condition,
+            exclude_preceding_rules=False,
+        )
+        sql = f"""
+        select count(*) as count_of_pairwise_comparisons_generated
+        from ({blocked_pairs_sql}) as blocked_pairs
+        """
+        sqls.append(
+            {"sql": sql, "output_table_name": "__splink__comparions_post_filter"}
+        )
+        return sqls
+
     sql = f"""
     select count(*) as count_of_pairwise_comparisons_generated
 
@@ -110,6 +135,69 @@ def _count_comparisons_from_blocking_rule_pre_filter_conditions_sqls(
         input_tablename_l = "__splink__df_concat"
         input_tablename_r = "__splink__df_concat"
 
+    if isinstance(blocking_rule, SortedNeighbourhoodBlockingRule):
+        # Each of the n records with non null sort keys is paired with the
+        # window_size records which follow it, so the count is known from n
+        not_null = blocking_rule.sort_keys_not_null_sql()
+        input_tablenames = dict.fromkeys([input_tablename_l, input_tablename_r])
+        count_sql = " UNION ALL ".join(
+            f"select count(*) as n from {t} as l where {not_null}"
+            for t in input_tablenames
+        )
+        w = blocking_rule.window_size
+        sql = f"""
+        select
+            sum(n) as count_l,
+            sum(n) as count_r,
+            case
+                when sum(n) > {w} then sum(n) * {w} - {w * (w + 1) // 2}
+                else sum(n) * (sum(n) - 1) / 2
+            end as block_count
+        from ({count_sql}) as counts
+        """
+        sqls.append({"sql": sql, "output_table_name": "__splink__block_counts"})
+        return sqls
+
+    if isinstance(blocking_rule, MinHashLSHBlockingRule):
+        # Each band key is a block, so the count is an upper bound, since a
+        # pair of records may share the keys of several bands
+        band_keys = blocking_rule.band_keys_column
+        for side, input_tablename in (
+            ("l", input_tablename_l),
+            ("r", input_tablename_r),
+        ):
+            band_keys_tablename = f"__splink__lsh_band_keys_{side}"
+            sqls.extend(
+                blocking_rule.band_keys_sqls(
+                    input_tablename, db_api.sql_dialect, [], band_keys_tablename
+                )
+            )
+            unnested_sql = db_api.sql_dialect.explode_arrays_sql(
+                band_keys_tablename, [band_keys], []
+            )
+            sql = f"""
+            select {band_keys} as key_0, count(*) as count_{side}
+            from ({unnested_sql}) as unnested_band_keys
+            group by {band_keys}
+            """
+            sqls.append(
+                {
+                    "sql": sql,
+                    "output_table_name": (
+                        f"__splink__count_comparisons_from_blocking_{side}"
+                    ),
+                }
+            )
+
+        sql = """
+        select *, count_l, count_r, count_l * count_r as block_count
+        from __splink__count_comparisons_from_blocking_l
+        inner join __splink__count_comparisons_from_blocking_r
+        using (key_0)
+        """
+        sqls.append({"sql": sql, "output_table_name": "__splink__block_counts"})
+        return sqls
+
     l_cols_sel = []
     r_cols_sel = []
     l_cols_gb = []
@@ -276,53 +364,172 @@ def _process_unique_id_columns(
         )
 
 
-def _cumulative_comparisons_to_be_scored_from_blocking_rules(
+def _marginal_key_sets_by_inclusion_exclusion(
+    blocking_rules: List[BlockingRule],
+) -> Optional[List[Dict[frozenset[str], int]]]:
+    """If every blocking rule is a pure equi-join on the same keys on each side,
+    the pairs generated by a rule and not by any preceding rule can be counted
+    without generating them.
+
+    The pairs generated by both of two such rules are those of an equi-join on
+    the union of their keys, so by inclusion-exclusion the count of pairs of
+    rule i not generated by rules j < i is:
+
+        sum over subsets S of {j < i} of (-1)^|S| * count(keys(i) | keys(S))
+
+    Returns, for each rule, these coefficients for each distinct set of keys, or
+    None if any rule is not a pure equi-join or there would be too many terms.
+    """
+    rule_keys = []
+    for br in blocking_rules:
+        if (
+            isinstance(br, (SortedNeighbourhoodBlockingRule, ExplodingBlockingRule))
+            or br._filter_conditions != "TRUE"
+        ):
+            return None
+        join_conditions = br._equi_join_conditions
+        if any(l_key != r_key for l_key, r_key in join_conditions):
+            return None
+        rule_keys.append(frozenset(l_key for l_key, _ in join_conditions))
+
+    marginal_key_sets = []
+    for i, keys in enumerate(rule_keys):
+        # Expand the product over preceding rules j of (1 - [keys(j)]), merging
+        # terms with the same union of keys
+        terms: Dict[frozenset[str], int] = {keys: 1}
+        for preceding_keys in rule_keys[:i]:
+            expanded = dict(terms)
+            for term_keys, coefficient in terms.items():
+                union = term_keys | preceding_keys
+                expanded[union] = expanded.get(union, 0) - coefficient
+            terms = {k: c for k, c in expanded.items() if c != 0}
+            if len(terms) > _MAX_INCLUSION_EXCLUSION_TERMS:
+                return None
+        marginal_key_sets.append(terms)
+    return marginal_key_sets
+
+
+def _marginal_counts_from_key_counts(
     *,
     splink_df_dict: dict[str, "SplinkDataFrame"],
-    blocking_rules: List[BlockingRule],
+    marginal_key_sets: List[Dict[frozenset[str], int]],
     link_type: backend_link_type_options,
     db_api: DatabaseAPISubClass,
-    max_rows_limit: int = int(1e9),
-    unique_id_input_column: InputColumn,
     source_dataset_input_column: Optional[InputColumn],
 ) -> pd.DataFrame:
-    # Check none of the blocking rules will create a vast/computationally
-    # intractable number of comparisons
-    for br in blocking_rules:
-        # TODO: Deal properly with exlpoding rules
-        count = _count_comparisons_generated_from_blocking_rule(
-            splink_df_dict=splink_df_dict,
-            blocking_rule=br,
-            link_type=link_type,
-            db_api=db_api,
-            max_rows_limit=max_rows_limit,
-            compute_post_filter_count=False,
-            unique_id_input_column=unique_id_input_column,
-            source_dataset_input_column=source_dataset_input_column,
-        )
-        count_pre_filter = count[
-            "number_of_comparisons_generated_pre_filter_conditions"
+    """Count the marginal comparisons of each blocking rule from the counts of
+    records in each block of each set of keys in `marginal_key_sets`, which are
+    found in a single scan using GROUPING SETS."""
+    key_sets = list({k for terms in marginal_key_sets for k in terms})
+    all_keys = sorted({key for key_set in key_sets for key in key_set})
+    aliases = {key: f"__splink__key_{i}" for i, key in enumerate(all_keys)}
+
+    pipeline = CTEPipeline()
+    sql = vertically_concatenate_sql(
+        splink_df_dict,
+        salting_required=False,
+        source_dataset_input_column=source_dataset_input_column,
+    )
+    pipeline.enqueue_sql(sql, "__splink__df_concat")
+
+    # Pairs of records from the same input dataset are not compared when
+    # linking only, so blocks are also counted per dataset
+    if link_type == "link_only" and source_dataset_input_column is not None:
+        source_dataset_expr = source_dataset_input_column.name
+    else:
+        source_dataset_expr = "0"
+
+    keys_sel = "".join(f"{key} as {alias}, " for key, alias in aliases.items())
+    sql = f"""
+    select {keys_sel}{source_dataset_expr} as __splink__source_dataset
+    from __splink__df_concat
+    """
+    pipeline.enqueue_sql(sql, "__splink__blocking_keys")
+
+    grouping_sets = ", ".join(
+        "("
+        + "".join(f"{aliases[k]}, " for k in sorted(ks))
+        + "__splink__source_dataset)"
+        for ks in key_sets
+    )
+    flags = [f"__splink__grouped_{i}" for i in range(len(all_keys))]
+    flags_sel = "".join(
+        f"grouping({alias}) as {flag}, {alias}, "
+        for alias, flag in zip(aliases.values(), flags)
+    )
+    sql = f"""
+    select {flags_sel}count(*) as n
+    from __splink__blocking_keys
+    group by grouping sets ({grouping_sets})
+    """
+    pipeline.enqueue_sql(sql, "__splink__block_counts_by_dataset")
+
+    # As in an inner join on the keys, records with a null key are not compared
+    not_null = " and ".join(
+        ["1 = 1"]
+        + [
+            f"({flag} = 1 or {alias} is not null)"
+            for flag, alias in zip(flags, aliases.values())
         ]
+    )
+    flags_prefix = "".join(f"{flag}, " for flag in flags)
+    group_by_blocks = ""
+    group_by_key_sets = ""
+    if flags:
+        group_by_blocks = f"group by {', '.join(flags + list(aliases.values()))}"
+        group_by_key_sets = f"group by {', '.join(flags)}"
+    sql = f"""
+    select {flags_prefix}
+        sum(n) as n,
+        sum(n * n) as n_squared_within_datasets
+    from __splink__block_counts_by_dataset
+    where {not_null}
+    {group_by_blocks}
+    """
+    pipeline.enqueue_sql(sql, "__splink__block_counts")
 
-        if float(count_pre_filter) > max_rows_limit:
-            # TODO: Use a SplinkException?  Want this to give a sensible message
-            # when ocoming from estimate_probability_two_random_records_match
-            raise ValueError(
-                f"Blocking rule {br.blocking_rule_sql} would create {count_pre_filter} "
-                "comparisonns.\nThis exceeds the max_rows_limit of "
-                f"{max_rows_limit}.\nPlease tighten the "
-                "blocking rule or increase the max_rows_limit."
-            )
+    sql = f"""
+    select {flags_prefix}
+        cast(sum(n) as bigint) as n,
+        cast(sum(n * n) as bigint) as n_squared,
+        cast(sum(n_squared_within_datasets) as bigint) as n_squared_within_datasets
+    from __splink__block_counts
+    {group_by_key_sets}
+    """
+    pipeline.enqueue_sql(sql, "__splink__comparison_counts_by_key_set")
+
+    counts_df = db_api.sql_pipeline_to_splink_dataframe(pipeline)
+    comparison_counts: Dict[frozenset[str], int] = {}
+    for row in counts_df.as_record_dict():
+        key_set = frozenset(key for key, flag in zip(all_keys, flags) if row[flag] == 0)
+        if link_type == "link_only":
+            # Pairs of records in the same block, but from different datasets
+            count = (row["n_squared"] - row["n_squared_within_datasets"]) // 2
+        else:
+            count = (row["n_squared"] - row["n"]) // 2
+        comparison_counts[key_set] = count
+    counts_df.drop_table_from_database_and_remove_from_cache()
 
-    rc = _row_counts_per_input_table(
-        splink_df_dict=splink_df_dict,
-        link_type=link_type,
-        source_dataset_input_column=source_dataset_input_column,
-        db_api=db_api,
-    ).as_record_dict()
+    return pd.DataFrame(
+        {
+            "row_count": [
+                sum(c * comparison_counts.get(k, 0) for k, c in terms.items())
+                for terms in marginal_key_sets
+            ],
+            "match_key": [str(i) for i in range(len(marginal_key_sets))],
+        }
+    )
 
-    cartesian_count = calculate_cartesian(rc, link_type)
 
+def _marginal_counts_from_blocked_pairs(
+    *,
+    splink_df_dict: dict[str, "SplinkDataFrame"],
+    blocking_rules: List[BlockingRule],
+    link_type: backend_link_type_options,
+    db_api: DatabaseAPISubClass,
+    unique_id_input_column: InputColumn,
+    source_dataset_input_column: Optional[InputColumn],
+) -> Tuple[pd.DataFrame, List[BlockingRule]]:
     for n, br in enumerate(blocking_rules):
         br.add_preceding_rules(blocking_rules[:n])
 
@@ -389,6 +596,80 @@ def _cumulative_comparisons_to_be_scored_from_blocking_rules(
 
     result_df = db_api.sql_pipeline_to_splink_dataframe(pipeline).as_pandas_dataframe()
 
+    return result_df, exploding_br_with_id_tables
+
+
+def _cumulative_comparisons_to_be_scored_from_blocking_rules(
+    *,
+    splink_df_dict: dict[str, "SplinkDataFrame"],
+    blocking_rules: List[BlockingRule],
+    link_type: backend_link_type_options,
+    db_api: DatabaseAPISubClass,
+    max_rows_limit: int = int(1e9),
+    unique_id_input_column: InputColumn,
+    source_dataset_input_column: Optional[InputColumn],
+) -> pd.DataFrame:
+    # Check none of the blocking rules will create a vast/computationally
+    # intractable number of comparisons
+    for br in blocking_rules:
+        # TODO: Deal properly with exlpoding rules
+        count = _count_comparisons_generated_from_blocking_rule(
+            splink_df_dict=splink_df_dict,
+            blocking_rule=br,
+            link_type=link_type,
+            db_api=db_api,
+            max_rows_limit=max_rows_limit,
+            compute_post_filter_count=False,
+            unique_id_input_column=unique_id_input_column,
+            source_dataset_input_column=source_dataset_input_column,
+        )
+        count_pre_filter = count[
+            "number_of_comparisons_generated_pre_filter_conditions"
+        ]
+
+        if float(count_pre_filter) > max_rows_limit:
+            # TODO: Use a SplinkException?  Want this to give a sensible message
+            # when ocoming from estimate_probability_two_random_records_match
+            raise ValueError(
+                f"Blocking rule {br.blocking_rule_sql} would create {count_pre_filter} "
+                "comparisonns.\nThis exceeds the max_rows_limit of "
+                f"{max_rows_limit}.\nPlease tighten the "
+                "blocking rule or increase the max_rows_limit."
+            )
+
+    rc = _row_counts_per_input_table(
+        splink_df_dict=splink_df_dict,
+        link_type=link_type,
+        source_dataset_input_column=source_dataset_input_column,
+        db_api=db_api,
+    ).as_record_dict()
+
+    cartesian_count = calculate_cartesian(rc, link_type)
+
+    # Where possible, count without generating the pairs
+    marginal_key_sets = None
+    if db_api.sql_dialect.supports_grouping_sets:
+        marginal_key_sets = _marginal_key_sets_by_inclusion_exclusion(blocking_rules)
+
+    if marginal_key_sets is not None:
+        result_df = _marginal_counts_from_key_counts(
+            splink_df_dict=splink_df_dict,
+            marginal_key_sets=marginal_key_sets,
+            link_type=link_type,
+            db_api=db_api,
+            source_dataset_input_column=source_dataset_input_column,
+        )
+        exploding_br_with_id_tables = []
+    else:
+        result_df, exploding_br_with_id_tables = _marginal_counts_from_blocked_pairs(
+            splink_df_dict=splink_df_dict,
+            blocking_rules=blocking_rules,
+            link_type=link_type,
+            db_api=db_api,
+            unique_id_input_column=unique_id_input_column,
+            source_dataset_input_column=source_dataset_input_column,
+        )
+
     # The above table won't include rules that have no matches
     all_rules_df = pd.DataFrame(
         {
@@ -429,6 +710,312 @@ def _cumulative_comparisons_to_be_scored_from_blocking_rules(
     return complete_df[col_order]
 
 
+def _qualify_columns_sql(sql: str, table_name: str, sqlglot_dialect: str) -> str:
+    tree = sqlglot.parse_one(sql, dialect=sqlglot_dialect)
+    for node in tree.find_all(sqlglot.expressions.Column):
+        node.set("table", table_name)
+    return tree.sql(dialect=sqlglot_dialect)
+
+
+# Count-min sketches overestimate the join size of two key columns by at most
+# e / width * n_l * n_r, with probability 1 - exp(-depth)
+_SKETCH_DEPTH = 4
+_SKETCH_WIDTH = 2**16
+_SAMPLE_RESOLUTION = 1_000_000
+_N_HEAVY_HITTERS = 100
+
+
+def _frequency_sketch_sql(
+    input_tablename: str, keys: List[str], db_api: DatabaseAPISubClass
+) -> str:
+    """SQL for a count-min sketch of the frequencies of the values of the key
+    expressions `keys`, with one row per (sketch_row, bucket), built in a single
+    scan of the input table.  Rows with a null key never join, so are skipped.
+    """
+    sketch_rows = " union all ".join(
+        f"select {i} as sketch_row" for i in range(_SKETCH_DEPTH)
+    )
+    keys_str = ", ".join(keys)
+    bucket_expr = db_api.sql_dialect.hash_partition_sql(
+        f"sketch_row, {keys_str}", _SKETCH_WIDTH
+    )
+    not_null = " and ".join(f"({k}) is not null" for k in keys)
+    return f"""
+    select sketch_row, {bucket_expr} as bucket, count(*) as n
+    from {input_tablename}
+    cross join ({sketch_rows}) as sketch_rows
+    where {not_null}
+    group by sketch_row, {bucket_expr}
+    """
+
+
+def _key_sample_condition_sql(
+    keys: List[str], sample_fraction: float, db_api: DatabaseAPISubClass
+) -> str:
+    # Sampling on a hash of the key keeps blocks whole and selects the same
+    # blocks on both sides of the join
+    partition_expr = db_api.sql_dialect.hash_partition_sql(
+        f"-1, {', '.join(keys)}", _SAMPLE_RESOLUTION
+    )
+    return f"{partition_expr} < {round(sample_fraction * _SAMPLE_RESOLUTION)}"
+
+
+def _heavy_hitter_keys(
+    pipeline: CTEPipeline,
+    input_tablename: str,
+    keys: List[str],
+    unique_id_input_column: InputColumn,
+    sample_fraction: float,
+    db_api: DatabaseAPISubClass,
+) -> SplinkDataFrame:
+    """The most frequent values of the key expressions `keys`, found from a
+    sample of records.  Like the frequency sketches, these are cached for reuse.
+    """
+    row_sample_expr = db_api.sql_dialect.hash_partition_sql(
+        f"-2, {unique_id_input_column.name}", _SAMPLE_RESOLUTION
+    )
+    keys_sel = ", ".join(f"{k} as __splink__hh_key_{i}" for i, k in enumerate(keys))
+    not_null = " and ".join(f"({k}) is not null" for k in keys)
+    sql = f"""
+    select {keys_sel}, count(*) as sampled_count
+    from {input_tablename}
+    where {row_sample_expr} < {round(sample_fraction * _SAMPLE_RESOLUTION)}
+    and {not_null}
+    group by {", ".join(keys)}
+    order by count(*) desc
+    limit {_N_HEAVY_HITTERS}
+    """
+    pipeline.enqueue_sql(sql, "__splink__heavy_hitter_keys")
+    return db_api.sql_pipeline_to_splink_dataframe(pipeline)
+
+
+def _approximate_count_comparisons_generated_from_blocking_rule(
+    *,
+    splink_df_dict: dict[str, "SplinkDataFrame"],
+    blocking_rule: BlockingRule,
+    link_type: backend_link_type_options,
+    db_api: DatabaseAPISubClass,
+    compute_post_filter_count: bool,
+    sample_fraction: float,
+    unique_id_input_column: InputColumn,
+    source_dataset_input_column: Optional[InputColumn],
+) -> dict[str, Union[int, float, str]]:
+    join_conditions = blocking_rule._equi_join_conditions
+    if (
+        isinstance(
+            blocking_rule, (SortedNeighbourhoodBlockingRule, MinHashLSHBlockingRule)
+        )
+        or not join_conditions
+    ):
+        raise ValueError(
+            "Approximate counts are only available for blocking rules with "
+            f"equi-join conditions, which {blocking_rule.blocking_rule_sql} "
+            "does not have.  Use approximate=False instead."
+        )
+    if not 0 < sample_fraction <= 1:
+        raise ValueError("`sample_fraction` must be in the interval (0, 1]")
+
+    sqlglot_dialect = db_api.sql_dialect.sqlglot_name
+    keys_l = [l_key for l_key, _ in join_conditions]
+    keys_r = [r_key for _, r_key in join_conditions]
+
+    input_dataframes = list(splink_df_dict.values())
+    two_dataset_link_only = link_type == "link_only" and len(input_dataframes) == 2
+
+    # The frequency sketches depend only on the input data and the key
+    # expressions, so are left in the cache to be reused by other blocking rules
+    # which block on the same keys.  The two sketches are independent, so may be
+    # computed concurrently
+    scheduler = PipelineScheduler(db_api)
+    sketch_names = []
+    for side, keys, input_dataframe in (
+        ("l", keys_l, input_dataframes[0]),
+        ("r", keys_r, input_dataframes[-1]),
+    ):
+        pipeline = CTEPipeline()
+        if two_dataset_link_only:
+            input_tablename = input_dataframe.physical_name
+        else:
+            sql = vertically_concatenate_sql(
+                splink_df_dict,
+                salting_required=False,
+                source_dataset_input_column=None,
+            )
+            pipeline.enqueue_sql(sql, "__splink__df_concat")
+            input_tablename = "__splink__df_concat"
+        pipeline.enqueue_sql(
+            _frequency_sketch_sql(input_tablename, keys, db_api),
+            f"__splink__frequency_sketch_{side}",
+        )
+        sketch_names.append(scheduler.add_pipeline(pipeline, name=side))
+
+    sketches = scheduler.run()
+    pipeline = CTEPipeline([sketches[name] for name in sketch_names])
+    sql = """
+    select
+        l.sketch_row,
+        sum(cast(l.n as double) * r.n) as join_size
+    from __splink__frequency_sketch_l as l
+    inner join __splink__frequency_sketch_r as r
+    on l.sketch_row = r.sketch_row and l.bucket = r.bucket
+    group by l.sketch_row
+    """
+    pipeline.enqueue_sql(sql, "__splink__sketch_join_sizes")
+    sql = """
+    select
+        (select min(join_size) from __splink__sketch_join_sizes) as join_size,
+        (select sum(cast(n as double)) from __splink__frequency_sketch_l
+            where sketch_row = 0) as n_l,
+        (select sum(cast(n as double)) from __splink__frequency_sketch_r
+            where sketch_row = 0) as n_r
+    """
+    pipeline.enqueue_sql(sql, "__splink__sketch_join_size_estimate")
+    estimate_df = db_api.sql_pipeline_to_splink_dataframe(pipeline, use_cache=False)
+    estimate = estimate_df.as_record_dict()[0]
+    estimate_df.drop_table_from_database_and_remove_from_cache()
+
+    pre_filter_estimate = int(estimate["join_size"] or 0)
+    pre_filter_error_bound = math.ceil(
+        math.e / _SKETCH_WIDTH * (estimate["n_l"] or 0) * (estimate["n_r"] or 0)
+    )
+
+    equi_join_conditions_joined = " AND ".join(
+        _qualify_columns_sql(i, "l", sqlglot_dialect)
+        + " = "
+        + _qualify_columns_sql(j, "r", sqlglot_dialect)
+        for i, j in join_conditions
+    )
+
+    filter_conditions = blocking_rule._filter_conditions
+    if filter_conditions == "TRUE":
+        filter_conditions = ""
+
+    if source_dataset_input_column:
+        unique_id_cols = [source_dataset_input_column, unique_id_input_column]
+    else:
+        unique_id_cols = [unique_id_input_column]
+
+    link_type_join_condition_sql = _sql_gen_where_condition(link_type, unique_id_cols)
+
+    results: dict[str, Union[int, float, str]] = {
+        "number_of_comparisons_generated_pre_filter_conditions": pre_filter_estimate,
+        "number_of_comparisons_generated_pre_filter_conditions_error_bound": (
+            pre_filter_error_bound
+        ),
+        "number_of_comparisons_to_be_scored_post_filter_conditions": "not computed",
+        "number_of_comparisons_to_be_scored_post_filter_conditions_standard_error": (
+            "not computed"
+        ),
+        "filter_conditions_identified": filter_conditions,
+        "equi_join_conditions_identified": equi_join_conditions_joined,
+        "link_type_join_condition": link_type_join_condition_sql,
+    }
+    if not compute_post_filter_count:
+        return results
+
+    # Estimate the post filter count by running the blocking rule on a sample
+    # of the blocks
+    pipeline = CTEPipeline()
+    if two_dataset_link_only:
+        where_condition = _sql_gen_where_condition(
+            "two_dataset_link_only", unique_id_cols
+        )
+        input_tablename_l = input_dataframes[0].physical_name
+        input_tablename_r = input_dataframes[1].physical_name
+    else:
+        where_condition = link_type_join_condition_sql
+        concat_sql = vertically_concatenate_sql(
+            splink_df_dict,
+            salting_required=False,
+            source_dataset_input_column=source_dataset_input_column,
+        )
+        pipeline.enqueue_sql(concat_sql, "__splink__df_concat")
+        input_tablename_l = "__splink__df_concat"
+        input_tablename_r = "__splink__df_concat"
+
+    # The largest blocks dominate the variance of a sample of blocks, so they
+    # are always included and counted exactly
+    heavy_hitters = _heavy_hitter_keys(
+        pipeline,
+        input_tablename_l,
+        keys_l,
+        unique_id_input_column,
+        sample_fraction,
+        db_api,
+    )
+    pipeline = CTEPipeline([heavy_hitters])
+    if not two_dataset_link_only:
+        pipeline.enqueue_sql(concat_sql, "__splink__df_concat")
+
+    for side, keys, input_tablename in (
+        ("l", keys_l, input_tablename_l),
+        ("r", keys_r, input_tablename_r),
+    ):
+        on_heavy_hitter = " and ".join(
+            f"{k} = hh.__splink__hh_key_{i}" for i, k in enumerate(keys)
+        )
+        sql = f"""
+        select
+            t.*,
+            hh.__splink__hh_key_0 is not null as __splink__is_heavy_hitter
+        from {input_tablename} as t
+        left join __splink__heavy_hitter_keys as hh
+        on {on_heavy_hitter}
+        where hh.__splink__hh_key_0 is not null
+        or {_key_sample_condition_sql(keys, sample_fraction, db_api)}
+        """
+        pipeline.enqueue_sql(sql, f"__splink__df_concat_sample_{side}")
+
+    keys_l_qualified = ", ".join(
+        _qualify_columns_sql(k, "l", sqlglot_dialect) for k in keys_l
+    )
+    sql = f"""
+    select
+        l.__splink__is_heavy_hitter as is_heavy_hitter,
+        count(*) as pair_count
+    from __splink__df_concat_sample_l as l
+    inner join __splink__df_concat_sample_r as r
+    on
+    {blocking_rule.blocking_rule_sql}
+    {where_condition}
+    group by l.__splink__is_heavy_hitter, {keys_l_qualified}
+    """
+    pipeline.enqueue_sql(sql, "__splink__sampled_pair_counts_per_block")
+
+    sql = """
+    select
+        sum(case when is_heavy_hitter then cast(pair_count as double) else 0 end)
+            as heavy_hitter_pair_count,
+        sum(case when is_heavy_hitter then 0 else cast(pair_count as double) end)
+            as sampled_pair_count,
+        sum(
+            case when is_heavy_hitter then 0
+            else cast(pair_count as double) * pair_count end
+        ) as sampled_sum_of_squares
+    from __splink__sampled_pair_counts_per_block
+    """
+    pipeline.enqueue_sql(sql, "__splink__sampled_pair_counts")
+    sample_df = db_api.sql_pipeline_to_splink_dataframe(pipeline, use_cache=False)
+    sample = sample_df.as_record_dict()[0]
+    sample_df.drop_table_from_database_and_remove_from_cache()
+
+    # Each other block is included with probability p, so scaling up by 1/p gives
+    # an unbiased (Horvitz-Thompson) estimate, with variance estimated from the
+    # sampled blocks
+    p = round(sample_fraction * _SAMPLE_RESOLUTION) / _SAMPLE_RESOLUTION
+    heavy_hitter_pair_count = sample["heavy_hitter_pair_count"] or 0
+    sampled_pair_count = sample["sampled_pair_count"] or 0
+    sampled_sum_of_squares = sample["sampled_sum_of_squares"] or 0
+    results["number_of_comparisons_to_be_scored_post_filter_conditions"] = round(
+        heavy_hitter_pair_count + sampled_pair_count / p
+    )
+    results[
+        "number_of_comparisons_to_be_scored_post_filter_conditions_standard_error"
+    ] = math.sqrt((1 - p) * sampled_sum_of_squares) / p
+
+    return results
+
+
 def _count_comparisons_generated_from_blocking_rule(
     *,
     splink_df_dict: dict[str, "SplinkDataFrame"],
@@ -462,10 +1049,7 @@ def _count_comparisons_generated_from_blocking_rule(
     pre_filter_total_df.drop_table_from_database_and_remove_from_cache()
 
     def add_l_r(sql, table_name):
-        tree = sqlglot.parse_one(sql, dialect=db_api.sql_dialect.sqlglot_name)
-        for node in tree.find_all(sqlglot.expressions.Column):
-            node.set("table", table_name)
-        return tree.sql(dialect=db_api.sql_dialect.sqlglot_name)
+        return _qualify_columns_sql(sql, table_name, db_api.sql_dialect.sqlglot_name)
 
     equi_join_conditions = [
         add_l_r(i, "l") + " = " + add_l_r(j, "r")
@@ -494,7 +1078,21 @@ def _count_comparisons_generated_from_blocking_rule(
             "link_type_join_condition": link_type_join_condition_sql,
         }
 
-    if pre_filter_total < max_rows_limit:
+    if pre_filter_total < max_rows_limit and isinstance(
+        blocking_rule, MinHashLSHBlockingRule
+    ):
+        # The pairs are found as they are for predictions
+        materialise_exploded_id_tables(
+            link_type,
+            [blocking_rule],
+            db_api,
+            splink_df_dict,
+            source_dataset_input_column=source_dataset_input_column,
+            unique_id_input_column=unique_id_input_column,
+        )
+        post_filter_total = blocking_rule.exploded_id_pair_table._row_count()
+        blocking_rule.drop_materialised_id_pairs_dataframe()
+    elif pre_filter_total < max_rows_limit:
         pipeline = CTEPipeline()
         sqls = _number_of_comparisons_generated_by_blocking_rule_post_filters_sqls(
             splink_df_dict,
@@ -542,7 +1140,9 @@ def count_comparisons_from_blocking_rule(
     source_dataset_column_name: Optional[str] = None,
     compute_post_filter_count: bool = True,
     max_rows_limit: int = int(1e9),
-) -> dict[str, Union[int, str]]:
+    approximate: bool = False,
+    sample_fraction: float = 0.01,
+) -> dict[str, Union[int, float, str]]:
     """Analyse a blocking rule to understand the number of comparisons it will generate.
 
     Read more about the definition of pre and post filter conditions
@@ -563,9 +1163,21 @@ def count_comparisons_from_blocking_rule(
         max_rows_limit (int, optional): Calculation of post filter counts will only
             proceed if the fast method returns a value below this limit. Defaults
             to int(1e9).
+        approximate (bool, optional): If True, estimate the counts rather than
+            computing them exactly, which is much faster for large inputs.  The
+            pre filter count is estimated from count-min sketches of the
+            frequencies of the blocking keys, and is an overestimate by at most
+            `..._pre_filter_conditions_error_bound` with probability 98%.  The post
+            filter count is estimated by running the blocking rule on a sample
+            of the blocks, and is reported with its standard error.
+            `max_rows_limit` is ignored.  Only available for blocking rules with
+            equi-join conditions.  Defaults to False.
+        sample_fraction (float, optional): The fraction of blocks sampled to
+            estimate the post filter count when `approximate=True`. Defaults to
+            0.01.
 
     Returns:
-        dict[str, Union[int, str]]: A dictionary containing the results
+        dict[str, Union[int, float, str]]: A dictionary containing the results
     """
 
     # Ensure what's been passed in is a BlockingRuleCreator
@@ -583,6 +1195,18 @@ def count_comparisons_from_blocking_rule(
         db_api.sql_dialect.name,
     )
 
+    if approximate:
+        return _approximate_count_comparisons_generated_from_blocking_rule(
+            splink_df_dict=splink_df_dict,
+            blocking_rule=blocking_rule_creator,
+            link_type=link_type,
+            db_api=db_api,
+            compute_post_filter_count=compute_post_filter_count,
+            sample_fraction=sample_fraction,
+            unique_id_input_column=unique_id_input_column,
+            source_dataset_input_column=source_dataset_input_column,
+        )
+
     return _count_comparisons_generated_from_blocking_rule(
         splink_df_dict=splink_df_dict,
         blocking_rule=blocking_rule_creator,
@@ -716,6 +1340,11 @@ def n_largest_blocks(
     blocking_rule_as_br = to_blocking_rule_creator(blocking_rule).get_blocking_rule(
         db_api.sql_dialect.name
     )
+    if isinstance(blocking_rule_as_br, SortedNeighbourhoodBlockingRule):
+        raise ValueError(
+            "A sorted neighbourhood blocking rule does not generate blocks of "
+            "records, so it has no largest blocks"
+        )
 
     splink_df_dict = db_api.register_multiple_tables(table_or_tables)
 
@@ -12,19 +12,43 @@ class BlockingRuleCreator(ABC):
         self,
         salting_partitions: int | None = None,
         arrays_to_explode: list[str] | None = None,
+        salting_min_comparisons: int | None = None,
+        sorted_neighbourhood_keys: list[str] | None = None,
+        sorted_neighbourhood_window: int | None = None,
+        minhash_lsh: dict[str, Any] | None = None,
     ):
         self._salting_partitions = salting_partitions
         self._arrays_to_explode = arrays_to_explode
+        self._salting_min_comparisons = salting_min_comparisons
+        self._sorted_neighbourhood_keys = sorted_neighbourhood_keys
+        self._sorted_neighbourhood_window = sorted_neighbourhood_window
+        self._minhash_lsh = minhash_lsh
 
     # @property because merged levels need logic to determine salting partitions
     @property
     def salting_partitions(self):
         return self._salting_partitions
 
+    @property
+    def salting_min_comparisons(self):
+        return getattr(self, "_salting_min_comparisons", None)
+
     @property
     def arrays_to_explode(self):
         return self._arrays_to_explode
 
+    @property
+    def sorted_neighbourhood_keys(self):
+        return getattr(self, "_sorted_neighbourhood_keys", None)
+
+    @property
+    def sorted_neighbourhood_window(self):
+        return getattr(self, "_sorted_neighbourhood_window", None)
+
+    @property
+    def minhash_lsh(self):
+        return getattr(self, "_minhash_lsh", None)
+
     @abstractmethod
     def create_sql(self, sql_dialect: SplinkDialect) -> str:
         pass
@@ -43,9 +67,19 @@ class BlockingRuleCreator(ABC):
         if self.salting_partitions:
             level_dict["salting_partitions"] = self.salting_partitions
 
+        if self.salting_min_comparisons:
+            level_dict["salting_min_comparisons"] = self.salting_min_comparisons
+
         if self.arrays_to_explode:
             level_dict["arrays_to_explode"] = self.arrays_to_explode
 
+        if self.sorted_neighbourhood_keys:
+            level_dict["sorted_neighbourhood_keys"] = self.sorted_neighbourhood_keys
+            level_dict["sorted_neighbourhood_window"] = self.sorted_neighbourhood_window
+
+        if self.minhash_lsh:
+            level_dict["minhash_lsh"] = self.minhash_lsh
+
         return level_dict
 
     @final
@@ -44,9 +44,18 @@ class CustomRule(BlockingRuleCreator):
         sql_dialect: str = None,
         salting_partitions: int | None = None,
         arrays_to_explode: list[str] | None = None,
+        salting_min_comparisons: int | None = None,
+        sorted_neighbourhood_keys: list[str] | None = None,
+        sorted_neighbourhood_window: int | None = None,
+        minhash_lsh: dict[str, Any] | None = None,
     ):
         super().__init__(
-            salting_partitions=salting_partitions, arrays_to_explode=arrays_to_explode
+            salting_partitions=salting_partitions,
+            arrays_to_explode=arrays_to_explode,
+            salting_min_comparisons=salting_min_comparisons,
+            sorted_neighbourhood_keys=sorted_neighbourhood_keys,
+            sorted_neighbourhood_window=sorted_neighbourhood_window,
+            minhash_lsh=minhash_lsh,
         )
         self.sql_condition = blocking_rule
 
@@ -125,6 +134,18 @@ class _Merge(BlockingRuleCreator):
             raise ValueError("Cannot merge blocking rules with arrays_to_explode")
         return None
 
+    @property
+    def sorted_neighbourhood_keys(self):
+        if any([br.sorted_neighbourhood_keys for br in self.blocking_rules]):
+            raise ValueError("Cannot merge sorted neighbourhood blocking rules")
+        return None
+
+    @property
+    def minhash_lsh(self):
+        if any([br.minhash_lsh for br in self.blocking_rules]):
+            raise ValueError("Cannot merge MinHash LSH blocking rules")
+        return None
+
     @final
     def create_sql(self, sql_dialect: SplinkDialect) -> str:
         return f" {self._clause} ".join(
@@ -148,12 +169,28 @@ class Not(BlockingRuleCreator):
     def salting_partitions(self):
         return self.blocking_rule_creator.salting_partitions
 
+    @property
+    def salting_min_comparisons(self):
+        return self.blocking_rule_creator.salting_min_comparisons
+
     @property
     def arrays_to_explode(self):
         if self.blocking_rule_creator.arrays_to_explode:
             raise ValueError("Cannot use arrays_to_explode with Not")
         return None
 
+    @property
+    def sorted_neighbourhood_keys(self):
+        if self.blocking_rule_creator.sorted_neighbourhood_keys:
+            raise ValueError("Cannot use a sorted neighbourhood blocking rule with Not")
+        return None
+
+    @property
+    def minhash_lsh(self):
+        if self.blocking_rule_creator.minhash_lsh:
+            raise ValueError("Cannot use a MinHash LSH blocking rule with Not")
+        return None
+
     @final
     def create_sql(self, sql_dialect: SplinkDialect) -> str:
         return f"NOT ({self.blocking_rule_creator.create_sql(sql_dialect)})"
@@ -163,6 +200,7 @@ def block_on(
     *col_names_or_exprs: Union[str, ColumnExpression],
     salting_partitions: int | None = None,
     arrays_to_explode: list[str] | None = None,
+    salting_min_comparisons: int | None = None,
 ) -> BlockingRuleCreator:
     """Generates blocking rules of equality conditions  based on the columns
     or SQL expressions specified.
@@ -182,12 +220,22 @@ def block_on(
             be found within the docs.
         arrays_to_explode (optional, List[str]): List of arrays to explode
             before applying the blocking rule.
+        salting_min_comparisons (optional, int): If provided alongside
+            `salting_partitions`, only salt the blocks (values of the columns)
+            which generate at least this many comparisons, such as a 'John Smith'
+            block.  Other blocks are joined without salting.
 
     Examples:
         ``` python
         from splink import block_on
         br_1 = block_on("first_name")
         br_2 = block_on("substr(surname,1,2)", "surname")
+        br_3 = block_on(
+            "first_name",
+            "surname",
+            salting_partitions=10,
+            salting_min_comparisons=1e6,
+        )
         ```
 
     """
@@ -207,4 +255,184 @@ def block_on(
         br._salting_partitions = salting_partitions
     if arrays_to_explode:
         br._arrays_to_explode = arrays_to_explode
+    if salting_min_comparisons:
+        br._salting_min_comparisons = salting_min_comparisons
     return br
+
+
+class _SortedNeighbourhood(BlockingRuleCreator):
+    def __init__(
+        self,
+        blocking_rule_creator: BlockingRuleCreator,
+        sort_keys: list[ColumnExpression],
+        window_size: int,
+    ):
+        super().__init__(sorted_neighbourhood_window=window_size)
+        self.blocking_rule_creator = blocking_rule_creator
+        self.sort_keys = sort_keys
+
+    @property
+    def salting_partitions(self):
+        if self.blocking_rule_creator.salting_partitions:
+            raise ValueError("Cannot salt a sorted neighbourhood blocking rule")
+        return None
+
+    @property
+    def arrays_to_explode(self):
+        if self.blocking_rule_creator.arrays_to_explode:
+            raise ValueError(
+                "Cannot use arrays_to_explode with a sorted neighbourhood blocking rule"
+            )
+        return None
+
+    @property
+    def sorted_neighbourhood_keys(self):
+        return [key.name for key in self.sort_keys]
+
+    def create_sql(self, sql_dialect: SplinkDialect) -> str:
+        for key in self.sort_keys:
+            key.sql_dialect = sql_dialect
+        return self.blocking_rule_creator.create_sql(sql_dialect)
+
+
+def sorted_neighbourhood(
+    *col_names_or_exprs: Union[str, ColumnExpression],
+    window_size: int,
+    filter_condition: Union[str, BlockingRuleCreator, None] = None,
+) -> BlockingRuleCreator:
+    """Generates a sorted neighbourhood blocking rule, which sorts the records by
+    the columns or SQL expressions specified, and pairs each record with the
+    `window_size` records which follow it.
+
+    Unlike an equality condition, this pairs records whose values are close
+    in sort order, such as surnames with typos after the first few characters.
+    It generates at most n * `window_size` comparisons for n records.  Records
+    with a null value in any of the columns are not paired.
+
+    The records are sorted as a whole, rather than in partitions, so on Spark
+    the sort runs in a single task.  On very large data, blocking on an equality
+    condition may scale better.
+
+    Args:
+        col_names_or_exprs: A list of input columns or SQL expressions to sort
+            the records by.
+        window_size (int): The number of following records to pair each
+            record with.
+        filter_condition (optional, str or BlockingRuleCreator): A condition
+            which the pairs must also satisfy, such as
+            `"l.dob_year = r.dob_year"`.
+
+    Examples:
+        ``` python
+        from splink import sorted_neighbourhood
+        br_1 = sorted_neighbourhood("surname", "first_name", window_size=10)
+        br_2 = sorted_neighbourhood(
+            "surname", window_size=20, filter_condition="l.dob = r.dob"
+        )
+        ```
+
+    """
+    if filter_condition is None:
+        br: BlockingRuleCreator = CustomRule("1=1")
+    elif isinstance(filter_condition, str):
+        br = CustomRule(filter_condition)
+    else:
+        br = filter_condition
+
+    sort_keys = [ColumnExpression.instantiate_if_str(c) for c in col_names_or_exprs]
+    if not sort_keys:
+        raise ValueError("Must provide at least one column to sort by")
+
+    return _SortedNeighbourhood(br, sort_keys, window_size)
+
+
+class _MinHashLSH(BlockingRuleCreator):
+    def __init__(
+        self,
+        blocking_rule_creator: BlockingRuleCreator,
+        column: ColumnExpression,
+        bands: int,
+        rows: int,
+        ngram_size: int | None,
+    ):
+        super().__init__()
+        self.blocking_rule_creator = blocking_rule_creator
+        self.column = column
+        self.bands = bands
+        self.rows = rows
+        self.ngram_size = ngram_size
+
+    @property
+    def salting_partitions(self):
+        if self.blocking_rule_creator.salting_partitions:
+            raise ValueError("Cannot salt a MinHash LSH blocking rule")
+        return None
+
+    @property
+    def arrays_to_explode(self):
+        if self.blocking_rule_creator.arrays_to_explode:
+            raise ValueError(
+                "Cannot use arrays_to_explode with a MinHash LSH blocking rule"
+            )
+        return None
+
+    @property
+    def minhash_lsh(self):
+        return {
+            "column": self.column.name,
+            "bands": self.bands,
+            "rows": self.rows,
+            "ngram_size": self.ngram_size,
+        }
+
+    def create_sql(self, sql_dialect: SplinkDialect) -> str:
+        self.column.sql_dialect = sql_dialect
+        return self.blocking_rule_creator.create_sql(sql_dialect)
+
+
+def minhash_lsh(
+    col_name_or_expr: Union[str, ColumnExpression],
+    bands: int = 20,
+    rows: int = 5,
+    ngram_size: int | None = None,
+    filter_condition: Union[str, BlockingRuleCreator, None] = None,
+) -> BlockingRuleCreator:
+    """Generates a MinHash locality sensitive hashing (LSH) blocking rule, which
+    compares records with similar sets of tokens.  The tokens are the elements
+    of an array column or, if `ngram_size` is given, the overlapping substrings
+    of that length of a string column, such as an address.
+
+    Each record's tokens are summarised by a MinHash signature of `bands * rows`
+    values, and records are compared if all values of any band are equal.
+    Records whose tokens have Jaccard similarity s are compared with probability
+    1 - (1 - s^rows)^bands, so more rows make the rule stricter and more bands
+    more lenient.
+
+    Args:
+        col_name_or_expr: The input column or SQL expression to block on.
+        bands (int, optional): The number of bands.  Defaults to 20.
+        rows (int, optional): The number of signature values in each band.
+            Defaults to 5.
+        ngram_size (optional, int): If given, the column is a string, and its
+            tokens are its substrings of this length.  Otherwise the column is
+            an array of tokens.
+        filter_condition (optional, str or BlockingRuleCreator): A condition
+            which the pairs must also satisfy.
+
+    Examples:
+        ``` python
+        from splink import minhash_lsh
+        br_1 = minhash_lsh("address", bands=20, rows=5, ngram_size=3)
+        br_2 = minhash_lsh("postcode_tokens", bands=10, rows=2)
+        ```
+
+    """
+    if filter_condition is None:
+        br: BlockingRuleCreator = CustomRule("1=1")
+    elif isinstance(filter_condition, str):
+        br = CustomRule(filter_condition)
+    else:
+        br = filter_condition
+
+    column = ColumnExpression.instantiate_if_str(col_name_or_expr)
+    return _MinHashLSH(br, column, bands, rows, ngram_size)
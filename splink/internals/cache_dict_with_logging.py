@@ -1,7 +1,10 @@
 import logging
+import threading
+import weakref
 from collections import UserDict
 from copy import copy
-from typing import TYPE_CHECKING
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Dict, List, Optional
 
 from splink.internals.splink_dataframe import SplinkDataFrame
 
@@ -13,42 +16,187 @@ else:
     TypedUserDict = UserDict
 
 
-class CacheDictWithLogging(TypedUserDict):
+@dataclass
+class CachedTableInfo:
+    """Bookkeeping for a table held in the cache, keyed by its physical name"""
+
+    physical_name: str
+    row_count: Optional[int] = None
+    last_used: int = 0
+    pins: int = 0
+    # SplinkDataFrames handed out to callers for this table.  Whilst any of these
+    # are still alive the table is considered to be in use
+    handles: "weakref.WeakSet[SplinkDataFrame]" = field(default_factory=weakref.WeakSet)
+
+    @property
+    def in_use(self) -> bool:
+        return self.pins > 0 or len(self.handles) > 0
+
+
+class TableScope:
+    """Collects the tables created by Splink within a `db_api.scoped_tables()` block,
+    so that they can be dropped when the block exits"""
+
     def __init__(self):
+        self.created_tables: List[str] = []
+        self.kept_tables: set[str] = set()
+
+    def keep(self, splink_dataframe: SplinkDataFrame) -> SplinkDataFrame:
+        """Keep a table created within the scope, so it is not dropped on exit"""
+        self.kept_tables.add(splink_dataframe.physical_name)
+        return splink_dataframe
+
+
+class CacheDictWithLogging(TypedUserDict):
+    def __init__(self, max_rows: Optional[int] = None):
         super().__init__()
         self.executed_queries = []
         self.queries_retrieved_from_cache = []
 
+        # If set, tables created by Splink which are no longer in use are dropped,
+        # least recently used first, to keep the total rows held below this budget
+        self.max_rows = max_rows
+        self._table_info: Dict[str, CachedTableInfo] = {}
+        self._access_counter = 0
+        self._active_scopes: List[TableScope] = []
+        # Pipelines may be executed concurrently by a PipelineScheduler
+        self._lock = threading.RLock()
+
     def __getitem__(self, key: str) -> SplinkDataFrame:
         splink_dataframe = super().__getitem__(key)
 
         # Return a copy so that user can modify physical or templated name
         # without modifying the version in the cache
-        return copy(splink_dataframe)
+        splink_dataframe = copy(splink_dataframe)
+        self._track_handle(splink_dataframe)
+        return splink_dataframe
 
     def __setitem__(self, key, value):
         if not isinstance(value, SplinkDataFrame):
             raise TypeError("Cached items must be of type SplinkDataFrame")
 
-        super().__setitem__(key, value)
-
-        logger.log(
-            1, f"Setting cache for {key}" f" with physical name {value.physical_name}"
-        )
+        with self._lock:
+            is_new_table = value.physical_name not in self._table_info
+
+            # Store a copy, so that the cache itself does not count as a reference
+            # to the table when deciding whether it is still in use
+            super().__setitem__(key, copy(value))
+            self._track_handle(value)
+            self._mark_used(value.physical_name)
+
+            logger.log(
+                1,
+                f"Setting cache for {key}" f" with physical name {value.physical_name}",
+            )
+
+            if is_new_table and value.created_by_splink:
+                for scope in self._active_scopes:
+                    scope.created_tables.append(value.physical_name)
+
+            if self.max_rows is not None:
+                self.evict_tables_over_budget()
+
+    def __delitem__(self, key):
+        with self._lock:
+            physical_name = super().__getitem__(key).physical_name
+            super().__delitem__(key)
+            if physical_name not in {df.physical_name for df in self.data.values()}:
+                self._table_info.pop(physical_name, None)
+
+    def _track_handle(self, splink_dataframe: SplinkDataFrame) -> None:
+        physical_name = splink_dataframe.physical_name
+        with self._lock:
+            if physical_name not in self._table_info:
+                self._table_info[physical_name] = CachedTableInfo(physical_name)
+            self._table_info[physical_name].handles.add(splink_dataframe)
+
+    def _mark_used(self, physical_name: str) -> None:
+        info = self._table_info.get(physical_name)
+        if info is not None:
+            self._access_counter += 1
+            info.last_used = self._access_counter
 
     def invalidate_cache(self):
         self.data = dict()
+        self._table_info = dict()
 
     def get_with_logging(self, key):
         df = self[key]
         phy_name = df.physical_name
+        self._mark_used(phy_name)
         logger.debug(
             f"Using cache for template name {key}" f" with physical name {phy_name}"
         )
-        self.queries_retrieved_from_cache.append(df)
+        self.queries_retrieved_from_cache.append(copy(df))
 
         return df
 
+    def pin(self, splink_dataframe: SplinkDataFrame) -> None:
+        """Prevent a table from being evicted, until `unpin` is called"""
+        info = self._table_info.get(splink_dataframe.physical_name)
+        if info is not None:
+            info.pins += 1
+
+    def unpin(self, splink_dataframe: SplinkDataFrame) -> None:
+        info = self._table_info.get(splink_dataframe.physical_name)
+        if info is not None and info.pins > 0:
+            info.pins -= 1
+
+    @property
+    def total_rows(self) -> int:
+        return sum(info.row_count or 0 for info in self._table_info.values())
+
+    def table_sizes(self) -> Dict[str, Optional[int]]:
+        """Row counts of the tables in the cache, keyed by physical name.
+        Sizes are only measured when a `max_rows` budget is set."""
+        return {name: info.row_count for name, info in self._table_info.items()}
+
+    def _evictable_tables(self) -> List[SplinkDataFrame]:
+        tables_by_name = {}
+        for df in self.data.values():
+            info = self._table_info.get(df.physical_name)
+            if df.created_by_splink and info is not None and not info.in_use:
+                tables_by_name[df.physical_name] = df
+        return sorted(
+            tables_by_name.values(),
+            key=lambda df: self._table_info[df.physical_name].last_used,
+        )
+
+    def evict_tables_over_budget(self) -> None:
+        """Drop the least recently used tables which are no longer in use until
+        the total number of rows held is within `max_rows`"""
+        if self.max_rows is None:
+            return
+
+        with self._lock:
+            for df in list(self.data.values()):
+                info = self._table_info.get(df.physical_name)
+                if info is not None and info.row_count is None:
+                    info.row_count = df._row_count()
+
+            for df in self._evictable_tables():
+                if self.total_rows <= self.max_rows:
+                    return
+                logger.debug(
+                    f"Evicting {df.templated_name} with physical name "
+                    f"{df.physical_name} from cache to stay within row budget"
+                )
+                df.drop_table_from_database_and_remove_from_cache()
+
+    def open_scope(self) -> TableScope:
+        scope = TableScope()
+        self._active_scopes.append(scope)
+        return scope
+
+    def close_scope(self, scope: TableScope) -> None:
+        self._active_scopes.remove(scope)
+
+        tables_to_drop = set(scope.created_tables) - scope.kept_tables
+        for df in list(self.data.values()):
+            if df.physical_name in tables_to_drop:
+                tables_to_drop.remove(df.physical_name)
+                df.drop_table_from_database_and_remove_from_cache()
+
     def reset_executed_queries_tracker(self):
         self.executed_queries = []
 
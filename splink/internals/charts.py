@@ -11,18 +11,11 @@ import pandas as pd
 from splink.internals.misc import read_resource
 from splink.internals.waterfall_chart import records_to_waterfall_data
 
-altair_installed = True
-
-try:
-    import altair as alt
-except ImportError:
-    altair_installed = False
-
 if TYPE_CHECKING:
     import altair as alt
 
 # type alias:
-ChartReturnType = Union[Dict[Any, Any], alt.core.SchemaBase]
+ChartReturnType = Union[Dict[Any, Any], "alt.core.SchemaBase"]
 
 
 def load_chart_definition(filename):
@@ -42,13 +35,15 @@ def _load_external_libs():
 def altair_or_json(
     chart_dict: dict[Any, Any], as_dict: bool = False
 ) -> ChartReturnType:
-    if altair_installed:
-        if not as_dict:
-            try:
-                return alt.Chart.from_dict(chart_dict)
+    if not as_dict:
+        # altair is slow to import, so is only imported when a chart is produced
+        try:
+            import altair as alt
+
+            return alt.Chart.from_dict(chart_dict)
 
-            except ModuleNotFoundError:
-                return chart_dict
+        except ModuleNotFoundError:
+            return chart_dict
 
     return chart_dict
 
@@ -5,8 +5,6 @@ import os
 import random
 from typing import TYPE_CHECKING, Any, Literal, Optional
 
-from jinja2 import Template
-
 from splink.internals.exceptions import SplinkException
 from splink.internals.misc import EverythingEncoder, read_resource
 from splink.internals.pipeline import CTEPipeline
@@ -375,6 +373,9 @@ def render_splink_cluster_studio_html(
     nodes_recs = df_nodes.as_record_dict()
     edges_recs = df_edges_as_records(linker, df_predicted_edges, df_nodes)
 
+    # jinja2 is only imported when a dashboard is rendered
+    from jinja2 import Template
+
     # Render template with cluster, nodes and edges
     template_path = "internals/files/splink_cluster_studio/cluster_template.j2"
     template = Template(read_resource(template_path))
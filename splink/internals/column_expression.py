@@ -6,14 +6,13 @@ from copy import copy
 from functools import partial
 from typing import Protocol, Union
 
-import sqlglot
-
 from splink.internals.dialects import SplinkDialect
 from splink.internals.input_column import SqlglotColumnTreeBuilder
 from splink.internals.sql_transform import (
     add_suffix_to_all_column_identifiers,
     add_table_to_all_column_identifiers,
 )
+from splink.internals.sqlglot_cache import transpile_cached
 
 
 class ColumnExpressionOperation(Protocol):
@@ -113,9 +112,7 @@ class ColumnExpression:
         return name
 
     def _lower_dialected(self, name: str, dialect: SplinkDialect) -> str:
-        lower_sql = sqlglot.parse_one("lower(___col___)").sql(
-            dialect=dialect.sqlglot_name
-        )
+        lower_sql = transpile_cached("lower(___col___)", write=dialect.sqlglot_name)
 
         return lower_sql.replace("___col___", name)
 
@@ -130,8 +127,8 @@ class ColumnExpression:
     def _substr_dialected(
         self, name: str, start: int, end: int, dialect: SplinkDialect
     ) -> str:
-        substr_sql = sqlglot.parse_one(f"substring(___col___, {start}, {end})").sql(
-            dialect=dialect.sqlglot_name
+        substr_sql = transpile_cached(
+            f"substring(___col___, {start}, {end})", write=dialect.sqlglot_name
         )
 
         return substr_sql.replace("___col___", name)
@@ -152,8 +149,8 @@ class ColumnExpression:
         return clone
 
     def _cast_to_string_dialected(self, name: str, dialect: SplinkDialect) -> str:
-        cast_sql = sqlglot.parse_one("cast(___col___ as string)").sql(
-            dialect=dialect.sqlglot_name
+        cast_sql = transpile_cached(
+            "cast(___col___ as string)", write=dialect.sqlglot_name
         )
         return cast_sql.replace("___col___", name)
 
@@ -141,6 +141,14 @@ class Comparison:
         cc_name = self.output_column_name
         return f"{bf}{tf}adj_{cc_name}".replace(" ", "_")
 
+    @property
+    def _log2_bf_column_name(self):
+        return f"log2_{self._bf_column_name}"
+
+    @property
+    def _log2_bf_tf_adj_column_name(self):
+        return f"log2_{self._bf_tf_adj_column_name}"
+
     @property
     def _has_tf_adjustments(self):
         return any([cl._has_tf_adjustments for cl in self.comparison_levels])
@@ -222,6 +230,7 @@ class Comparison:
         self,
         retain_matching_columns: bool,
         retain_intermediate_calculation_columns: bool,
+        log2_weights: bool = False,
     ) -> List[str]:
         input_cols = []
         for cl in self.comparison_levels:
@@ -240,14 +249,29 @@ class Comparison:
                     col = cl._tf_adjustment_input_column
                     output_cols.extend(col.tf_name_l_r)
 
+        # In log2 mode the Bayes factors are only needed as output columns
+        include_bayes_factors = (
+            not log2_weights or retain_intermediate_calculation_columns
+        )
+
         # Bayes factor case when statement
-        sqls = [
-            cl._bayes_factor_sql(self._gamma_column_name)
-            for cl in self.comparison_levels
-        ]
-        sql = " ".join(sqls)
-        sql = f"CASE {sql} END as {self._bf_column_name} "
-        output_cols.append(sql)
+        if include_bayes_factors:
+            sqls = [
+                cl._bayes_factor_sql(self._gamma_column_name)
+                for cl in self.comparison_levels
+            ]
+            sql = " ".join(sqls)
+            sql = f"CASE {sql} END as {self._bf_column_name} "
+            output_cols.append(sql)
+
+        if log2_weights:
+            sqls = [
+                cl._log2_bayes_factor_sql(self._gamma_column_name)
+                for cl in self.comparison_levels
+            ]
+            sql = " ".join(sqls)
+            sql = f"CASE {sql} END as {self._log2_bf_column_name} "
+            output_cols.append(sql)
 
         # tf adjustment case when statement
 
@@ -257,8 +281,12 @@ class Comparison:
                 for cl in self.comparison_levels
             ]
             sql = " ".join(sqls)
-            sql = f"CASE {sql} END as {self._bf_tf_adj_column_name} "
-            output_cols.append(sql)
+            if include_bayes_factors:
+                output_cols.append(f"CASE {sql} END as {self._bf_tf_adj_column_name} ")
+            if log2_weights:
+                output_cols.append(
+                    f"log2(CASE {sql} END) as {self._log2_bf_tf_adj_column_name} "
+                )
         output_cols.append(self._gamma_column_name)
 
         return dedupe_preserving_order(output_cols)
@@ -299,6 +327,14 @@ class Comparison:
             cols.append(self._bf_tf_adj_column_name)
         return cols
 
+    @property
+    def _match_weight_columns_to_sum(self):
+        cols = []
+        cols.append(self._log2_bf_column_name)
+        if self._has_tf_adjustments:
+            cols.append(self._log2_bf_tf_adj_column_name)
+        return cols
+
     def as_dict(self):
         d = {
             "output_column_name": self.output_column_name,
@@ -540,6 +540,22 @@ class ComparisonLevel:
         """
         return dedent(sql)
 
+    @property
+    def _log2_bayes_factor_sql_literal(self) -> str:
+        if self._bayes_factor == math.inf:
+            return "cast('Infinity' as float8)"
+        elif self._bayes_factor == 0:
+            return "cast('-Infinity' as float8)"
+        return f"cast({self._log2_bayes_factor} as float8)"
+
+    def _log2_bayes_factor_sql(self, gamma_column_name: str) -> str:
+        sql = f"""
+        WHEN
+        {gamma_column_name} = {self.comparison_vector_value}
+        THEN {self._log2_bayes_factor_sql_literal}
+        """
+        return dedent(sql)
+
     def _tf_adjustment_sql(
         self, gamma_column_name: str, comparison_levels: list[ComparisonLevel]
     ) -> str:
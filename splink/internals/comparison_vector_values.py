@@ -43,16 +43,23 @@ def compute_comparison_vector_values_from_id_pairs_sqls(
     source_dataset_input_column: Optional[InputColumn],
     unique_id_input_column: InputColumn,
     include_clerical_match_score: bool = False,
+    blocked_pairs_tablename: str = "__splink__blocked_id_pairs",
+    row_key_column: Optional[InputColumn] = None,
 ) -> list[dict[str, str]]:
     """Compute the comparison vectors from __splink__blocked_id_pairs, the
-    materialised dataframe of blocked pairwise record comparisons.
+    materialised dataframe of blocked pairwise record comparisons, or from
+    `blocked_pairs_tablename` if it is a subset of these pairs.
+
+    `row_key_column` must be given if it was used to identify the blocked pairs.
 
     See [the fastlink paper](https://imai.fas.harvard.edu/research/files/linkage.pdf)
     for more details of what is meant by comparison vectors.
     """
     sqls = []
 
-    if source_dataset_input_column:
+    if row_key_column is not None:
+        unique_id_columns = [row_key_column]
+    elif source_dataset_input_column:
         unique_id_columns = [source_dataset_input_column, unique_id_input_column]
     else:
         unique_id_columns = [unique_id_input_column]
@@ -70,7 +77,7 @@ def compute_comparison_vector_values_from_id_pairs_sqls(
     sql = sql = f"""
     select {select_cols_expr}, b.match_key
     from {input_tablename_l} as l
-    inner join __splink__blocked_id_pairs as b
+    inner join {blocked_pairs_tablename} as b
     on {uid_l_expr} = b.join_key_l
     inner join {input_tablename_r} as r
     on {uid_r_expr} = b.join_key_r
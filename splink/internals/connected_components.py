@@ -20,6 +20,7 @@ from splink.internals.unique_id_concat import (
     _composite_unique_id_from_edges_sql,
     _composite_unique_id_from_nodes_sql,
 )
+from splink.internals.vertically_concatenate import visible_columns_sql
 
 if TYPE_CHECKING:
     from splink.internals.linker import Linker
@@ -27,7 +28,11 @@ if TYPE_CHECKING:
 logger = logging.getLogger(__name__)
 
 
-def _cc_create_nodes_table(linker: "Linker", generated_graph: bool = False) -> str:
+def _cc_create_nodes_table(
+    linker: "Linker",
+    generated_graph: bool = False,
+    row_key_column: Optional[InputColumn] = None,
+) -> str:
     """SQL to create our connected components nodes table.
 
     From our edges table, create a nodes table.
@@ -37,10 +42,16 @@ def _cc_create_nodes_table(linker: "Linker", generated_graph: bool = False) -> s
 
     This logic can be shortcut by using the unique
     id column found in __splink__df_concat_with_tf.
+
+    If `row_key_column` is given, the nodes are identified by their row keys
+    rather than their composite unique ids.
     """
 
     uid_cols = linker._settings_obj.column_info_settings.unique_id_input_columns
-    uid_concat = _composite_unique_id_from_nodes_sql(uid_cols)
+    if row_key_column is not None:
+        uid_concat = row_key_column.name
+    else:
+        uid_concat = _composite_unique_id_from_nodes_sql(uid_cols)
 
     if generated_graph:
         sql = """
@@ -301,6 +312,7 @@ def _cc_create_unique_id_cols(
     concat_with_tf: str,
     df_predict: SplinkDataFrame,
     match_probability_threshold: Optional[float],
+    row_key_column: Optional[InputColumn] = None,
 ) -> SplinkDataFrame:
     """Create SQL to pull unique ID columns for connected components.
 
@@ -318,6 +330,10 @@ def _cc_create_unique_id_cols(
             and connected in our algorithm.
             Not required if in deterministic link mode.
 
+        row_key_column (InputColumn, optional):
+            The row key column of `concat_with_tf`.  If given, the unique IDs
+            are the row keys of the records, which are cheaper to join on.
+
     Returns:
         SplinkDataFrame: A dataframe containing two sets of unique IDs,
         unique_id_l and unique_id_r.
@@ -330,10 +346,37 @@ def _cc_create_unique_id_cols(
         raise TypeError("Parameter 'match_probability_threshold' is missing or None")
     else:
         match_probability_condition = (
-            f"where match_probability >= {match_probability_threshold}"
+            f"where p.match_probability >= {match_probability_threshold}"
         )
 
     uid_cols = linker._settings_obj.column_info_settings.unique_id_input_columns
+
+    if row_key_column is not None:
+        # Look up the row keys of each pair, so that connected components joins
+        # on integers rather than strings
+        row_key = row_key_column.name
+        join_l = " and ".join(f"nl.{c.name} = p.{c.name_l}" for c in uid_cols)
+        join_r = " and ".join(f"nr.{c.name} = p.{c.name_r}" for c in uid_cols)
+        sql = f"""
+            select
+            nl.{row_key} as unique_id_l,
+            nr.{row_key} as unique_id_r
+            from {df_predict.physical_name} as p
+            inner join {concat_with_tf} as nl on {join_l}
+            inner join {concat_with_tf} as nr on {join_r}
+            {match_probability_condition}
+
+            UNION
+
+            select
+            {row_key} as unique_id_l,
+            {row_key} as unique_id_r
+            from {concat_with_tf}
+        """
+        pipeline = CTEPipeline()
+        pipeline.enqueue_sql(sql, "__splink__df_connected_components_df")
+        return linker._db_api.sql_pipeline_to_splink_dataframe(pipeline)
+
     uid_concat_edges_l = _composite_unique_id_from_edges_sql(uid_cols, "l")
     uid_concat_edges_r = _composite_unique_id_from_edges_sql(uid_cols, "r")
     uid_concat_edges = _composite_unique_id_from_edges_sql(uid_cols, None)
@@ -343,7 +386,7 @@ def _cc_create_unique_id_cols(
         select
         {uid_concat_edges_l} as unique_id_l,
         {uid_concat_edges_r} as unique_id_r
-        from {df_predict.physical_name}
+        from {df_predict.physical_name} as p
         {match_probability_condition}
 
         UNION
@@ -362,15 +405,30 @@ def _exit_query(
     representatives: SplinkDataFrame,
     concat_with_tf: SplinkDataFrame,
     uid_cols: list[InputColumn],
+    row_key_column: Optional[InputColumn] = None,
 ) -> str:
     representatives_name = representatives.physical_name
     concat_with_tf_name = concat_with_tf.physical_name
 
     uid_concat = _composite_unique_id_from_nodes_sql(uid_cols, "n")
+    nodes_columns = visible_columns_sql(concat_with_tf, "n")
+
+    if row_key_column is not None:
+        # Representatives are the lowest row key in each cluster, so the cluster
+        # id is taken to be the lowest composite unique id, as it is otherwise
+        return f"""
+        select
+            min({uid_concat}) over (partition by c.representative) as cluster_id,
+            {nodes_columns}
+        from {representatives_name} as c
+
+        inner join {concat_with_tf_name} as n
+        on n.{row_key_column.name} = c.node_id
+        """
 
     return f"""
         select
-            c.representative as cluster_id, n.*
+            c.representative as cluster_id, {nodes_columns}
         from {representatives_name} as c
 
         left join {concat_with_tf_name} as n
@@ -383,6 +441,7 @@ def solve_connected_components(
     edges_table: SplinkDataFrame,
     concat_with_tf: SplinkDataFrame,
     _generated_graph: bool = False,
+    row_key_column: Optional[InputColumn] = None,
 ) -> SplinkDataFrame:
     """Connected Components main algorithm.
 
@@ -404,6 +463,10 @@ def solve_connected_components(
             our nodes table is generated as this can be shortcut using
             __splink__df_concat_with_tf.
 
+        row_key_column (InputColumn, optional):
+            If given, the nodes of `edges_table` are the row keys of
+            `concat_with_tf` (see `_cc_create_unique_id_cols`).
+
     Returns:
         SplinkDataFrame: A dataframe containing the connected components list
         for your link or dedupe job.
@@ -418,7 +481,7 @@ def solve_connected_components(
 
     pipeline = CTEPipeline(input_dfs)
     # Create our initial node and neighbours tables
-    sql = _cc_create_nodes_table(linker, _generated_graph)
+    sql = _cc_create_nodes_table(linker, _generated_graph, row_key_column)
     pipeline.enqueue_sql(sql, "nodes")
     sql = _cc_generate_neighbours_representation()
     pipeline.enqueue_sql(sql, "__splink__df_neighbours")
@@ -503,6 +566,7 @@ def solve_connected_components(
         representatives=representatives,
         concat_with_tf=concat_with_tf,
         uid_cols=uid_cols,
+        row_key_column=row_key_column,
     )
     pipeline = CTEPipeline([representatives])
     pipeline.enqueue_sql(exit_query, "__splink__df_representatives")
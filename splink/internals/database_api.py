@@ -2,19 +2,31 @@ from __future__ import annotations
 
 import hashlib
 import logging
+import threading
 import time
 from abc import ABC, abstractmethod
-from collections.abc import Sequence
+from collections.abc import Iterator, Sequence
+from contextlib import contextmanager
+from copy import copy
+from datetime import datetime
+from pathlib import Path
 from typing import Any, Dict, Generic, List, Optional, TypeVar, Union, final
 
 import sqlglot
 from pandas import DataFrame as PandasDataFrame
 
-from splink.internals.cache_dict_with_logging import CacheDictWithLogging
+from splink.internals.cache_dict_with_logging import CacheDictWithLogging, TableScope
+from splink.internals.execution_stats import (
+    CacheStatus,
+    ExecutionRecord,
+    ExecutionStatsRegistry,
+)
 from splink.internals.logging_messages import execute_sql_logging_message_info, log_sql
 from splink.internals.misc import ascii_uid, ensure_is_list, parse_duration
+from splink.internals.persistent_cache import PersistentTableCache
 from splink.internals.pipeline import CTEPipeline
-from splink.internals.splink_dataframe import SplinkDataFrame
+from splink.internals.splink_dataframe import SplinkDataFrame, TableSchema
+from splink.internals.subplan_reuse import SubplanPlanner
 
 from .dialects import (
     SplinkDialect,
@@ -37,6 +49,12 @@ T = TypeVar("T")
 class DatabaseAPI(ABC, Generic[TablishType]):
     sql_dialect: SplinkDialect
     debug_mode: bool = False
+    # whether to count the rows of each table created, for execution_stats(), if
+    # the backend does not record them.  Off by default since it runs an extra
+    # count(*) against the new table
+    execution_stats_count_rows: bool = False
+    # maximum number of independent pipelines a PipelineScheduler runs at once
+    max_concurrent_pipelines: int = 1
     """
     DatabaseAPI class handles _all_ interactions with the database
     Anything backend-specific (but not related to SQL dialects) lives here also
@@ -47,6 +65,12 @@ class DatabaseAPI(ABC, Generic[TablishType]):
     def __init__(self) -> None:
         self._intermediate_table_cache: CacheDictWithLogging = CacheDictWithLogging()
         self._cache_uid: str = ascii_uid(8)
+        self._persistent_cache: Optional[PersistentTableCache] = None
+        self._execution_stats: ExecutionStatsRegistry = ExecutionStatsRegistry()
+        self._subplan_planner: Optional[SubplanPlanner] = None
+        self._table_schemas: Dict[str, TableSchema] = {}
+        self._table_creation_locks: Dict[str, threading.Lock] = {}
+        self._table_creation_locks_lock = threading.Lock()
 
     @final
     def _log_and_run_sql_execution(
@@ -89,12 +113,13 @@ class DatabaseAPI(ABC, Generic[TablishType]):
 
         Returns a SplinkDataFrame which also uses templated_name
         """
+        self._forget_table_schema(physical_name)
         sql = self._setup_for_execute_sql(sql, physical_name)
         spark_df = self._log_and_run_sql_execution(sql, templated_name, physical_name)
         output_df = self._cleanup_for_execute_sql(
             spark_df, templated_name, physical_name
         )
-        self._intermediate_table_cache.executed_queries.append(output_df)
+        self._intermediate_table_cache.executed_queries.append(copy(output_df))
         return output_df
 
     @final
@@ -139,47 +164,301 @@ class DatabaseAPI(ABC, Generic[TablishType]):
         # differences from _sql_to_splink_dataframe:
         # this _calculates_ physical name, handles debug_mode,
         # and checks cache before querying
-        to_hash = (sql + self._cache_uid).encode("utf-8")
-        hash = hashlib.sha256(to_hash).hexdigest()[:9]
+        started_at = datetime.now()
+        start_time = time.perf_counter()
+
+        persistent_cache = self._persistent_cache
+        persistent_key = None
+        if persistent_cache is not None and not self.debug_mode:
+            persistent_key = persistent_cache.key_for_sql(sql, self)
+
+        if persistent_key is not None:
+            # Deterministic across sessions, so the table can be found again
+            hash = persistent_key[:9]
+        else:
+            to_hash = (sql + self._cache_uid).encode("utf-8")
+            hash = hashlib.sha256(to_hash).hexdigest()[:9]
         # Ensure hash is valid sql table name
         table_name_hash = f"{output_tablename_templated}_{hash}"
 
-        if use_cache:
-            splink_dataframe = self._get_table_from_cache_or_db(
-                table_name_hash, output_tablename_templated
-            )
-            if splink_dataframe is not None:
-                return splink_dataframe
+        # Concurrent pipelines may request the same table, which must only be
+        # created once
+        with self._table_creation_lock(table_name_hash):
+            if use_cache:
+                splink_dataframe = self._get_table_from_cache_or_db(
+                    table_name_hash, output_tablename_templated
+                )
+                if splink_dataframe is not None:
+                    if (
+                        persistent_key is not None
+                        and splink_dataframe.physical_name == table_name_hash
+                    ):
+                        persistent_cache.record_fingerprint(
+                            table_name_hash, persistent_key
+                        )
+                    self._record_execution(
+                        splink_dataframe, "hit", started_at, start_time
+                    )
+                    return splink_dataframe
+
+                if persistent_key is not None and persistent_cache.should_persist(
+                    output_tablename_templated
+                ):
+                    splink_dataframe = self._load_table_from_persistent_cache(
+                        sql, output_tablename_templated, table_name_hash, persistent_key
+                    )
+                    if splink_dataframe is not None:
+                        self._record_execution(
+                            splink_dataframe, "persistent_hit", started_at, start_time
+                        )
+                        return splink_dataframe
+
+            if self.debug_mode:
+                print(sql)  # noqa: T201
+                splink_dataframe = self._sql_to_splink_dataframe(
+                    sql,
+                    output_tablename_templated,
+                    output_tablename_templated,
+                )
 
-        if self.debug_mode:
-            print(sql)  # noqa: T201
-            splink_dataframe = self._sql_to_splink_dataframe(
-                sql,
-                output_tablename_templated,
-                output_tablename_templated,
-            )
+                df_pd = splink_dataframe.as_pandas_dataframe()
+                try:
+                    from IPython.display import display
 
-            df_pd = splink_dataframe.as_pandas_dataframe()
-            try:
-                from IPython.display import display
+                    display(df_pd)
+                except ModuleNotFoundError:
+                    print(df_pd)  # noqa: T201
 
-                display(df_pd)
-            except ModuleNotFoundError:
-                print(df_pd)  # noqa: T201
+            else:
+                splink_dataframe = self._sql_to_splink_dataframe(
+                    sql, output_tablename_templated, table_name_hash
+                )
 
-        else:
-            splink_dataframe = self._sql_to_splink_dataframe(
-                sql, output_tablename_templated, table_name_hash
+            splink_dataframe.created_by_splink = True
+            splink_dataframe.sql_used_to_create = sql
+
+            physical_name = splink_dataframe.physical_name
+
+            self._intermediate_table_cache[physical_name] = splink_dataframe
+
+            if persistent_key is not None:
+                persistent_cache.record_fingerprint(physical_name, persistent_key)
+                if persistent_cache.should_persist(output_tablename_templated):
+                    persistent_cache.save(splink_dataframe, persistent_key)
+
+            self._record_execution(splink_dataframe, "miss", started_at, start_time)
+            return splink_dataframe
+
+    @contextmanager
+    def _table_creation_lock(self, table_name: str) -> Iterator[None]:
+        with self._table_creation_locks_lock:
+            lock = self._table_creation_locks.setdefault(table_name, threading.Lock())
+        with lock:
+            yield
+
+    def _record_execution(
+        self,
+        splink_dataframe: SplinkDataFrame,
+        cache_status: CacheStatus,
+        started_at: datetime,
+        start_time: float,
+    ) -> None:
+        rows_out = bytes_out = None
+        # Statistics are informational only, so must never cause a failure
+        if cache_status == "miss":
+            try:
+                rows_out, bytes_out = splink_dataframe._stored_size()
+            except Exception as e:
+                logger.debug(
+                    f"Unable to find size of {splink_dataframe.physical_name}: {e}"
+                )
+        if (
+            cache_status == "miss"
+            and rows_out is None
+            and self.execution_stats_count_rows
+        ):
+            try:
+                rows_out = splink_dataframe._row_count()
+            except Exception as e:
+                logger.debug(
+                    f"Unable to count rows of {splink_dataframe.physical_name}: {e}"
+                )
+
+        self._execution_stats.record(
+            ExecutionRecord(
+                templated_name=splink_dataframe.templated_name,
+                physical_name=splink_dataframe.physical_name,
+                backend=self.sql_dialect.name,
+                cache_status=cache_status,
+                started_at=started_at,
+                duration_seconds=time.perf_counter() - start_time,
+                rows_out=rows_out,
+                bytes_out=bytes_out,
             )
+        )
+
+    def execution_stats(self) -> PandasDataFrame:
+        """Statistics for each table Splink has requested from this DatabaseAPI,
+        one row per executed pipeline, in order of execution.
+
+        Columns are `templated_name`, `physical_name`, `backend`, `cache_status`
+        (`miss`, `hit` or `persistent_hit`), `started_at`, `duration_seconds`,
+        `rows_out` and `bytes_out`.
+
+        `rows_out` and `bytes_out` are only recorded for tables which were
+        computed, from metadata the backend already holds about the table, so
+        without scanning it.  Which are available depends on the backend:
+
+        - DuckDB records rows, but not bytes
+        - Postgres records rows and bytes
+        - SQLite records bytes, if it was compiled with the `dbstat` table
+        - Spark records bytes of tables read from files, for instance with
+            `break_lineage_method="parquet"`.  Other tables are lazily evaluated,
+            so their size is not known when they are created
+
+        Where rows are not recorded, they are counted if
+        `execution_stats_count_rows` is set to True.  This is off by default
+        because counting costs an extra query per table.
+
+        Examples:
+            ```py
+            df_predict = linker.inference.predict()
+            stats = db_api.execution_stats()
+            stats.sort_values("duration_seconds", ascending=False).head()
+            ```
+
+        Returns:
+            pandas.DataFrame: The execution statistics
+        """
+        return self._execution_stats.as_pandas_dataframe()
+
+    def reset_execution_stats(self) -> None:
+        self._execution_stats.reset()
 
+    @final
+    def _load_table_from_persistent_cache(
+        self,
+        sql: str,
+        output_tablename_templated: str,
+        table_name_hash: str,
+        persistent_key: str,
+    ) -> Union[SplinkDataFrame, None]:
+        persistent_cache = self._persistent_cache
+        if persistent_cache is None:
+            return None
+        path = persistent_cache.lookup(output_tablename_templated, persistent_key)
+        if path is None:
+            return None
+
+        logger.debug(
+            f"Using persistent cache for {output_tablename_templated} "
+            f"from file {path}"
+        )
+        read_sql = self.sql_dialect.read_parquet_sql(path)
+        read_sql = self._setup_for_execute_sql(read_sql, table_name_hash)
+        table = self._log_and_run_sql_execution(
+            read_sql, output_tablename_templated, table_name_hash
+        )
+        splink_dataframe = self._cleanup_for_execute_sql(
+            table, output_tablename_templated, table_name_hash
+        )
         splink_dataframe.created_by_splink = True
         splink_dataframe.sql_used_to_create = sql
 
-        physical_name = splink_dataframe.physical_name
+        self._intermediate_table_cache[table_name_hash] = splink_dataframe
+        self._intermediate_table_cache.queries_retrieved_from_cache.append(
+            copy(splink_dataframe)
+        )
+        persistent_cache.record_fingerprint(table_name_hash, persistent_key)
+        return splink_dataframe
+
+    def enable_persistent_cache(
+        self,
+        cache_dir: Union[str, Path],
+        tables_to_persist: Optional[List[str]] = None,
+    ) -> None:
+        """Opt in to caching intermediate tables on disk, so they can be reused
+        by subsequent sessions (e.g. the next run of a nightly job).
+
+        Cached tables are keyed on a fingerprint of the input data (schema, row
+        count and a hash of the content, or the modification time of input files)
+        together with the SQL used to create them, so they are recomputed if
+        either changes.
+
+        Args:
+            cache_dir (str | Path): Directory in which cached tables are stored
+                as parquet files. Created if it does not exist.
+            tables_to_persist (list[str], optional): Regular expressions matched
+                against the templated names of tables to persist. Defaults to
+                `__splink__df_concat_with_tf`, the term frequency tables and
+                `__splink__blocked_id_pairs`.
+        """
+        self._persistent_cache = PersistentTableCache(cache_dir, tables_to_persist)
+
+    def disable_persistent_cache(self) -> None:
+        self._persistent_cache = None
 
-        self._intermediate_table_cache[physical_name] = splink_dataframe
+    def enable_subplan_reuse(self, min_references: int = 2) -> None:
+        """Opt in to detecting subplans (CTEs) which are repeated within or across
+        SQL pipelines, and materialising them so they are computed only once.
 
-        return splink_dataframe
+        A CTE is materialised if it is read at least `min_references` times within
+        a pipeline, or if it has already been computed as part of an earlier
+        pipeline.  Materialised tables are held in the intermediate table cache,
+        so subsequent pipelines containing the same CTE reuse them.
+
+        Args:
+            min_references (int, optional): The number of times a CTE must be read
+                within a single pipeline for it to be materialised. Defaults to 2.
+        """
+        self._subplan_planner = SubplanPlanner(min_references=min_references)
+
+    def disable_subplan_reuse(self) -> None:
+        self._subplan_planner = None
+
+    def set_cache_budget(self, max_rows: Optional[int]) -> None:
+        """Limit the total number of rows held in intermediate tables created by
+        Splink.
+
+        When the budget is exceeded, tables which are no longer in use (i.e. no
+        SplinkDataFrame referring to them is still alive, and they are not pinned)
+        are dropped from the database, least recently used first.  They will be
+        recomputed if needed again.
+
+        Args:
+            max_rows (int | None): The row budget.  None removes the limit.
+        """
+        self._intermediate_table_cache.max_rows = max_rows
+        self._intermediate_table_cache.evict_tables_over_budget()
+
+    @contextmanager
+    def scoped_tables(self) -> Iterator[TableScope]:
+        """Drop all tables created by Splink within the `with` block when it exits.
+
+        Examples:
+            ```py
+            with db_api.scoped_tables() as scope:
+                df_predict = linker.inference.predict()
+                df_clusters = scope.keep(
+                    linker.clustering.cluster_pairwise_predictions_at_threshold(
+                        df_predict, 0.95
+                    )
+                )
+            # Only df_clusters remains in the database
+            ```
+        """
+        scope = self._intermediate_table_cache.open_scope()
+        try:
+            yield scope
+        finally:
+            self._intermediate_table_cache.close_scope(scope)
+
+    @contextmanager
+    def _worker_thread_context(self) -> Iterator[None]:
+        """Wraps execution of a pipeline on a worker thread of a PipelineScheduler.
+        Backends whose connections cannot be shared across threads override this
+        to set up a connection for the thread."""
+        yield
 
     def sql_pipeline_to_splink_dataframe(
         self,
@@ -194,6 +473,8 @@ class DatabaseAPI(ABC, Generic[TablishType]):
         """
 
         if not self.debug_mode:
+            if self._subplan_planner is not None and use_cache:
+                pipeline = self._subplan_planner.plan(pipeline, self)
             sql_gen = pipeline.generate_cte_pipeline_sql()
             output_tablename_templated = pipeline.output_table_name
 
@@ -205,6 +486,9 @@ class DatabaseAPI(ABC, Generic[TablishType]):
         else:
             # In debug mode, we do not pipeline the sql and print the
             # results of each part of the pipeline
+            # Later steps refer to earlier ones by name only, so hold a reference
+            # to each to ensure they are not evicted before the pipeline completes
+            steps = []
             for cte in pipeline.ctes_pipeline():
                 start_time = time.time()
                 output_tablename = cte.output_table_name
@@ -219,6 +503,7 @@ class DatabaseAPI(ABC, Generic[TablishType]):
                     output_tablename,
                     use_cache=False,
                 )
+                steps.append(splink_dataframe)
                 run_time = parse_duration(time.time() - start_time)
                 print(f"Step ran in: {run_time}")  # noqa: T201
 
@@ -264,6 +549,9 @@ class DatabaseAPI(ABC, Generic[TablishType]):
             if not isinstance(table, str):
                 self._table_registration(table, alias)
                 table = alias
+            if self._persistent_cache is not None:
+                self._persistent_cache.forget_fingerprint(table)
+            self._forget_table_schema(table)
             sdf = self.table_to_splink_dataframe(alias, table)
             tables_as_splink_dataframes[alias] = sdf
         return tables_as_splink_dataframes
@@ -348,6 +636,10 @@ class DatabaseAPI(ABC, Generic[TablishType]):
 
         for k in keys_to_delete:
             del self._intermediate_table_cache[k]
+        self._forget_table_schema(splink_dataframe.physical_name)
+
+    def _forget_table_schema(self, physical_name: str) -> None:
+        self._table_schemas.pop(physical_name, None)
 
     def delete_tables_created_by_splink_from_db(self):
         # Accounts for names in cache with key which are templated names
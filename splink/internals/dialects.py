@@ -110,6 +110,21 @@ class SplinkDialect(ABC):
             f"Backend '{self.name}' needs an infinity_expression added to its dialect"
         )
 
+    @property
+    def supports_grouping_sets(self) -> bool:
+        return True
+
+    def row_key_sql(self, unique_id_columns: list[str]) -> str:
+        """SQL for an integer which identifies each row of a table, whose unique
+        id is given by `unique_id_columns`.  It is only computed for materialised
+        tables, so need not be deterministic unless `row_key_may_collide`"""
+        return "row_number() over ()"
+
+    @property
+    def row_key_may_collide(self) -> bool:
+        """Whether `row_key_sql` is a hash, which may not be unique"""
+        return False
+
     @staticmethod
     def _wrap_in_nullif(func):
         def nullif_wrapped_function(*args, **kwargs):
@@ -157,6 +172,45 @@ class SplinkDialect(ABC):
             f"Unnesting blocking rules are not supported for {type(self)}"
         )
 
+    def ngrams_sql(self, name: str, ngram_size: int) -> str:
+        """SQL for the array of overlapping substrings of length `ngram_size` of
+        `name`, or `name` itself if it is shorter"""
+        raise NotImplementedError(
+            f"MinHash LSH blocking rules are not supported for {type(self)}"
+        )
+
+    def array_without_nulls_sql(self, name: str) -> str:
+        raise NotImplementedError(
+            f"MinHash LSH blocking rules are not supported for {type(self)}"
+        )
+
+    def minhash_band_keys_sql(self, tokens_name: str, bands: int, rows: int) -> str:
+        """SQL for the array of `bands` keys of the MinHash signature of the array
+        `tokens_name`, where each key hashes `rows` signature values.  Null if
+        the array is empty.  The array must not contain nulls"""
+        raise NotImplementedError(
+            f"MinHash LSH blocking rules are not supported for {type(self)}"
+        )
+
+    def hash_partition_sql(self, expr: str, num_partitions: int) -> str:
+        """SQL assigning `expr` to one of `num_partitions` partitions, numbered
+        from 0, using a hash of its value"""
+        raise NotImplementedError(
+            f"Partitioned prediction is not supported for {type(self)}"
+        )
+
+    def table_fingerprint_sql(self, tbl_name: str) -> str:
+        """SQL returning a single row with a `row_count` and an order-independent
+        `content_hash` of all rows in `tbl_name`"""
+        raise NotImplementedError(
+            f"Backend '{self.name}' does not support fingerprinting tables"
+        )
+
+    def read_parquet_sql(self, path: str) -> str:
+        raise NotImplementedError(
+            f"Backend '{self.name}' does not support reading parquet files"
+        )
+
 
 class DuckDBDialect(SplinkDialect):
     _dialect_name_for_factory = "duckdb"
@@ -229,6 +283,41 @@ class DuckDBDialect(SplinkDialect):
         else:
             return f"USING SAMPLE {percent}% (bernoulli)"
 
+    def table_fingerprint_sql(self, tbl_name: str) -> str:
+        return f"""
+        select count(*) as row_count, cast(bit_xor(hash(t)) as varchar) as content_hash
+        from {tbl_name} as t
+        """
+
+    def read_parquet_sql(self, path: str) -> str:
+        return f"select * from read_parquet('{path}')"
+
+    def hash_partition_sql(self, expr: str, num_partitions: int) -> str:
+        return f"hash({expr}) % {num_partitions}"
+
+    def ngrams_sql(self, name: str, ngram_size: int) -> str:
+        q = ngram_size
+        return f"""list_transform(
+            range(1, greatest(length({name}) - {q} + 2, 2)),
+            i -> substr({name}, i, {q})
+        )"""
+
+    def array_without_nulls_sql(self, name: str) -> str:
+        return f"list_filter({name}, t -> t is not null)"
+
+    def minhash_band_keys_sql(self, tokens_name: str, bands: int, rows: int) -> str:
+        # The signature value of seed k is the minimum of the tokens' hashes
+        band_keys = []
+        for band in range(bands):
+            mins = ", ".join(
+                f"list_min(list_transform({tokens_name}, t -> hash(t, {k})))"
+                for k in range(band * rows, (band + 1) * rows)
+            )
+            band_keys.append(f"'{band}:' || hash({mins})")
+        return f"""case when len({tokens_name}) > 0
+            then [{", ".join(band_keys)}]
+        end"""
+
     def explode_arrays_sql(
         self,
         tbl_name: str,
@@ -318,6 +407,52 @@ class SparkDialect(SplinkDialect):
         else:
             return f" TABLESAMPLE ({percent} PERCENT) "
 
+    def table_fingerprint_sql(self, tbl_name: str) -> str:
+        return f"""
+        select count(*) as row_count,
+        cast(bit_xor(xxhash64(*)) as string) as content_hash
+        from {tbl_name}
+        """
+
+    def read_parquet_sql(self, path: str) -> str:
+        return f"select * from parquet.`{path}`"
+
+    def row_key_sql(self, unique_id_columns: list[str]) -> str:
+        # Unlike row_number(), doesn't move all rows into a single partition.
+        # Unlike monotonically_increasing_id(), is the same if the table is
+        # recomputed, e.g. after a persisted table is evicted
+        return f"xxhash64({', '.join(unique_id_columns)})"
+
+    @property
+    def row_key_may_collide(self) -> bool:
+        return True
+
+    def hash_partition_sql(self, expr: str, num_partitions: int) -> str:
+        return f"pmod(xxhash64({expr}), {num_partitions})"
+
+    def ngrams_sql(self, name: str, ngram_size: int) -> str:
+        q = ngram_size
+        return f"""transform(
+            sequence(1, greatest(length({name}) - {q} + 1, 1)),
+            i -> substring({name}, i, {q})
+        )"""
+
+    def array_without_nulls_sql(self, name: str) -> str:
+        return f"filter({name}, t -> t is not null)"
+
+    def minhash_band_keys_sql(self, tokens_name: str, bands: int, rows: int) -> str:
+        # The signature value of seed k is the minimum of the tokens' hashes
+        band_keys = []
+        for band in range(bands):
+            mins = ", ".join(
+                f"array_min(transform({tokens_name}, t -> xxhash64(t, {k})))"
+                for k in range(band * rows, (band + 1) * rows)
+            )
+            band_keys.append(f"concat('{band}:', cast(xxhash64({mins}) as string))")
+        return f"""case when size({tokens_name}) > 0
+            then array({", ".join(band_keys)})
+        end"""
+
     def explode_arrays_sql(
         self,
         tbl_name: str,
@@ -369,6 +504,10 @@ class SQLiteDialect(SplinkDialect):
     def infinity_expression(self):
         return "'infinity'"
 
+    @property
+    def supports_grouping_sets(self) -> bool:
+        return False
+
     def random_sample_sql(
         self, proportion, sample_size, seed=None, table=None, unique_id=None
     ):
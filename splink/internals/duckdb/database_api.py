@@ -1,7 +1,9 @@
 from __future__ import annotations
 
 import logging
-from typing import Sequence, Union
+import threading
+from contextlib import contextmanager
+from typing import Any, Dict, Iterator, Sequence, Union
 
 import duckdb
 import pandas as pd
@@ -48,6 +50,13 @@ class DuckDBAPI(DatabaseAPI[duckdb.DuckDBPyRelation]):
             con = duckdb.connect(database=connection)
 
         self._con = con
+        self._output_schema = output_schema
+
+        # Dataframes registered with con.register() are only visible to the
+        # connection they were registered with, so are recorded in order to be
+        # registered with the cursors used by worker threads
+        self._registered_tables: Dict[str, Any] = {}
+        self._thread_local = threading.local()
 
         if output_schema:
             self._execute_sql_against_backend(
@@ -67,6 +76,7 @@ class DuckDBAPI(DatabaseAPI[duckdb.DuckDBPyRelation]):
         except duckdb.CatalogException:
             drop_sql = f"DROP VIEW IF EXISTS {name}"
             self._execute_sql_against_backend(drop_sql)
+            self._registered_tables.pop(name, None)
 
     def _table_registration(
         self, input: AcceptableInputTableType, table_name: str
@@ -77,6 +87,7 @@ class DuckDBAPI(DatabaseAPI[duckdb.DuckDBPyRelation]):
             input = pd.DataFrame.from_records(input)
 
         self._con.register(table_name, input)
+        self._registered_tables[table_name] = input
 
     def table_to_splink_dataframe(
         self, templated_name: str, physical_name: str
@@ -97,7 +108,31 @@ class DuckDBAPI(DatabaseAPI[duckdb.DuckDBPyRelation]):
         return duckdb_load_from_file(file_path)
 
     def _execute_sql_against_backend(self, final_sql: str) -> duckdb.DuckDBPyRelation:
-        return self._con.sql(final_sql)
+        con = getattr(self._thread_local, "con", None) or self._con
+        return con.sql(final_sql)
+
+    def _new_cursor(self) -> duckdb.DuckDBPyConnection:
+        """A cursor onto the same database, which can run queries independently
+        of the main connection"""
+        cursor = self._con.cursor()
+        # Registered tables are not visible to other cursors
+        for table_name, input in list(self._registered_tables.items()):
+            cursor.register(table_name, input)
+        if self._output_schema:
+            cursor.sql(f"SET schema '{self._output_schema}'")
+        return cursor
+
+    @contextmanager
+    def _worker_thread_context(self) -> Iterator[None]:
+        # A DuckDB connection must not be used by several threads at once, so
+        # each worker thread uses its own cursor onto the same database
+        cursor = self._new_cursor()
+        self._thread_local.con = cursor
+        try:
+            yield
+        finally:
+            self._thread_local.con = None
+            cursor.close()
 
     @property
     def accepted_df_dtypes(self):
@@ -2,27 +2,32 @@ from __future__ import annotations
 
 import logging
 import os
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Iterator, Optional
 
 from pandas import DataFrame as pd_DataFrame
 
-from splink.internals.input_column import InputColumn
-from splink.internals.splink_dataframe import SplinkDataFrame
+from splink.internals.splink_dataframe import (
+    BatchOutputType,
+    SplinkDataFrame,
+    _pyarrow_installed,
+    _rows_to_batch,
+)
 
 logger = logging.getLogger(__name__)
 if TYPE_CHECKING:
+    import pyarrow as pa
+
     from .database_api import DuckDBAPI
 
 
 class DuckDBDataFrame(SplinkDataFrame):
     db_api: DuckDBAPI
 
-    @property
-    def columns(self) -> list[InputColumn]:
-        d = self.as_record_dict(1)[0]
-
-        col_strings = list(d.keys())
-        return [InputColumn(c, sql_dialect="duckdb") for c in col_strings]
+    def _fetch_column_types(self) -> dict[str, str]:
+        sql = f"DESCRIBE select * from {self.physical_name}"
+        rows = self.db_api._execute_sql_against_backend(sql).fetchall()
+        # columns are column_name, column_type, null, key, default, extra
+        return {r[0]: r[1] for r in rows}
 
     def validate(self):
         pass
@@ -43,6 +48,21 @@ class DuckDBDataFrame(SplinkDataFrame):
             .to_dict(orient="records")
         )
 
+    def _row_count(self) -> int:
+        sql = f"select count(*) from {self.physical_name}"
+        return self.db_api._execute_sql_against_backend(sql).fetchone()[0]
+
+    def _stored_size(self) -> tuple[Optional[int], Optional[int]]:
+        # DuckDB keeps the row count of each table, but not its size in bytes
+        sql = f"""
+        select estimated_size from duckdb_tables()
+        where table_name = '{self.physical_name}'
+        and schema_name = current_schema()
+        """
+        # Fully consumed, so that the connection's transaction is closed
+        rows = self.db_api._execute_sql_against_backend(sql).fetchall()
+        return (rows[0][0] if rows else None), None
+
     def as_pandas_dataframe(self, limit: int = None) -> pd_DataFrame:
         sql = f"select * from {self.physical_name}"
         if limit:
@@ -50,6 +70,32 @@ class DuckDBDataFrame(SplinkDataFrame):
 
         return self.db_api._execute_sql_against_backend(sql).to_df()
 
+    def as_arrow(self, limit: int = None) -> pa.Table:
+        sql = f"select * from {self.physical_name}"
+        if limit:
+            sql += f" limit {limit}"
+
+        return self.db_api._execute_sql_against_backend(sql).arrow()
+
+    def _iter_batches(
+        self, batch_size: int, output_type: BatchOutputType
+    ) -> Iterator[pa.RecordBatch | pd_DataFrame]:
+        # Stream from a separate cursor, so other queries can run on the
+        # connection while the batches are being consumed
+        cursor = self.db_api._new_cursor()
+        try:
+            result = cursor.execute(f"select * from {self.physical_name}")
+            if output_type == "arrow" or _pyarrow_installed():
+                for batch in result.fetch_record_batch(batch_size):
+                    yield batch if output_type == "arrow" else batch.to_pandas()
+                return
+
+            column_names = [d[0] for d in result.description]
+            while rows := result.fetchmany(batch_size):
+                yield _rows_to_batch(column_names, rows, output_type)
+        finally:
+            cursor.close()
+
     def to_parquet(self, filepath, overwrite=False):
         if not overwrite:
             self.check_file_exists(filepath)
@@ -0,0 +1,60 @@
+from __future__ import annotations
+
+import logging
+from collections import deque
+from dataclasses import asdict, dataclass
+from datetime import datetime
+from typing import Deque, Literal, Optional
+
+from pandas import DataFrame as PandasDataFrame
+
+logger = logging.getLogger(__name__)
+
+CacheStatus = Literal["miss", "hit", "persistent_hit"]
+
+
+@dataclass(frozen=True)
+class ExecutionRecord:
+    """Statistics about a single request to create a table from a SQL pipeline"""
+
+    templated_name: str
+    physical_name: str
+    backend: str
+    cache_status: CacheStatus
+    started_at: datetime
+    duration_seconds: float
+    rows_out: Optional[int]
+    bytes_out: Optional[int]
+
+
+class ExecutionStatsRegistry:
+    """Records one `ExecutionRecord` per pipeline executed by a `DatabaseAPI`.
+
+    Only the most recent `max_records` entries are retained, so that the registry
+    can be left on in long-running production jobs.
+    """
+
+    def __init__(self, max_records: int = 10_000):
+        self._records: Deque[ExecutionRecord] = deque(maxlen=max_records)
+
+    def record(self, execution_record: ExecutionRecord) -> None:
+        self._records.append(execution_record)
+        logger.debug(
+            f"{execution_record.templated_name} "
+            f"({execution_record.cache_status}) took "
+            f"{execution_record.duration_seconds:.3f}s"
+        )
+
+    def reset(self) -> None:
+        self._records.clear()
+
+    def __len__(self) -> int:
+        return len(self._records)
+
+    @property
+    def records(self) -> list[ExecutionRecord]:
+        return list(self._records)
+
+    def as_pandas_dataframe(self) -> PandasDataFrame:
+        columns = list(ExecutionRecord.__dataclass_fields__.keys())
+        return PandasDataFrame([asdict(r) for r in self._records], columns=columns)
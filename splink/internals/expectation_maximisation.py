@@ -2,7 +2,7 @@ from __future__ import annotations
 
 import logging
 import time
-from typing import Any, List, cast
+from typing import TYPE_CHECKING, Any, List, cast
 
 import pandas as pd
 
@@ -21,6 +21,9 @@ from splink.internals.splink_dataframe import SplinkDataFrame
 
 from .database_api import DatabaseAPISubClass
 
+if TYPE_CHECKING:
+    import pyarrow as pa
+
 logger = logging.getLogger(__name__)
 
 
@@ -149,15 +152,18 @@ def compute_proportions_for_new_parameters_pandas(
 
 
 def compute_proportions_for_new_parameters(
-    m_u_df: pd.DataFrame,
+    m_u_df: pd.DataFrame | pa.Table,
 ) -> List[dict[str, Any]]:
-    # Execute with duckdb if installed, otherwise default to pandas
+    # Execute with duckdb if installed, otherwise default to pandas.
+    # duckdb can query m_u_df whether it's a pandas DataFrame or a pyarrow Table
     try:
         import duckdb
 
         sql = compute_proportions_for_new_parameters_sql("m_u_df")
         return duckdb.query(sql).to_df().to_dict("records")
     except (ImportError, ModuleNotFoundError):
+        if not isinstance(m_u_df, pd.DataFrame):
+            m_u_df = m_u_df.to_pandas()
         return compute_proportions_for_new_parameters_pandas(m_u_df)
 
 
@@ -310,7 +316,7 @@ def expectation_maximisation(
         else:
             pipeline.append_input_dataframe(df_comparison_vector_values)
             df_params = db_api.sql_pipeline_to_splink_dataframe(pipeline)
-        param_records = df_params.as_pandas_dataframe()
+        param_records = df_params._as_arrow_or_pandas()
         param_records = compute_proportions_for_new_parameters(param_records)
 
         df_params.drop_table_from_database_and_remove_from_cache()
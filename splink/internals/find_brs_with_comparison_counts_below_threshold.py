@@ -13,13 +13,20 @@ from splink.internals.blocking_analysis import (
 from splink.internals.blocking_rule_creator import BlockingRuleCreator
 from splink.internals.blocking_rule_library import CustomRule, block_on
 from splink.internals.database_api import DatabaseAPISubClass
+from splink.internals.pipeline import CTEPipeline
+from splink.internals.vertically_concatenate import vertically_concatenate_sql
 
 from .input_column import InputColumn
 
 if TYPE_CHECKING:
     from splink.internals.linker import Linker
+    from splink.internals.splink_dataframe import SplinkDataFrame
 logger = logging.getLogger(__name__)
 
+# Upper bound on the number of grouping sets counted by a single query, so that
+# wide levels of the search tree are split over several queries
+MAX_GROUPING_SETS_PER_QUERY = 64
+
 
 def sanitise_column_name_for_one_hot_encoding(column_name: str) -> str:
     allowed_chars = string.ascii_letters + string.digits + "_"
@@ -84,6 +91,148 @@ def _generate_blocking_rule(
     return br.get_blocking_rule(db_api.sql_dialect.name)
 
 
+def _comparison_counts_for_combinations_sql(
+    splink_df_dict: dict[str, "SplinkDataFrame"],
+    link_type: str,
+    all_columns: List[str],
+    combinations: List[List[str]],
+) -> list[dict[str, str]]:
+    """SQL to count the comparisons generated prior to filter conditions by
+    blocking on each of `combinations` of `all_columns`, in a single scan of
+    the input data using GROUPING SETS.
+
+    The output has a row for each combination, with a flag `__splink__grouped_i`
+    which is 1 if the i-th column of `all_columns` is not in the combination.
+    """
+    input_dataframes = list(splink_df_dict.values())
+    two_dataset_link_only = link_type == "link_only" and len(input_dataframes) == 2
+
+    keys = [f"__splink__key_{i}" for i in range(len(all_columns))]
+    keys_sel = ", ".join(f"{c} as {k}" for c, k in zip(all_columns, keys))
+
+    sqls = []
+    if two_dataset_link_only:
+        # The left and right tables are counted separately, as in
+        # _count_comparisons_from_blocking_rule_pre_filter_conditions_sqls
+        sql = f"""
+        select 1 as __splink__in_l, 0 as __splink__in_r, {keys_sel}
+        from {input_dataframes[0].physical_name}
+        union all
+        select 0 as __splink__in_l, 1 as __splink__in_r, {keys_sel}
+        from {input_dataframes[1].physical_name}
+        """
+    else:
+        sql = vertically_concatenate_sql(
+            splink_df_dict, salting_required=False, source_dataset_input_column=None
+        )
+        sqls.append({"sql": sql, "output_table_name": "__splink__df_concat"})
+        sql = f"""
+        select 1 as __splink__in_l, 1 as __splink__in_r, {keys_sel}
+        from __splink__df_concat
+        """
+    sqls.append({"sql": sql, "output_table_name": "__splink__blocking_keys"})
+
+    grouping_sets = ", ".join(
+        "(" + ", ".join(keys[all_columns.index(c)] for c in combination) + ")"
+        for combination in combinations
+    )
+    # Columns in none of the combinations can't be selected, as they are not
+    # grouped by
+    used_columns = {c for combination in combinations for c in combination}
+    key_cols = []
+    for i, (c, k) in enumerate(zip(all_columns, keys)):
+        if c in used_columns:
+            key_cols.append(f"grouping({k}) as __splink__grouped_{i}, {k}")
+        else:
+            key_cols.append(f"1 as __splink__grouped_{i}, null as {k}")
+    sql = f"""
+    select
+        {", ".join(key_cols)},
+        sum(__splink__in_l) as count_l,
+        sum(__splink__in_r) as count_r
+    from __splink__blocking_keys
+    group by grouping sets ({grouping_sets})
+    """
+    sqls.append({"sql": sql, "output_table_name": "__splink__block_counts_by_set"})
+
+    # As in an inner join on the blocking keys, blocks with a null key in any
+    # of the columns of their combination generate no comparisons
+    grouped_flag_names = [f"__splink__grouped_{i}" for i in range(len(keys))]
+    not_null = " and ".join(
+        f"({g} = 1 or {k} is not null)" for g, k in zip(grouped_flag_names, keys)
+    )
+    sql = f"""
+    select
+        {", ".join(grouped_flag_names)},
+        cast(sum(count_l * count_r) as bigint) as comparison_count
+    from __splink__block_counts_by_set
+    where {not_null}
+    group by {", ".join(grouped_flag_names)}
+    """
+    sqls.append({"sql": sql, "output_table_name": "__splink__comparison_counts_by_set"})
+    return sqls
+
+
+def _comparison_counts_by_level(
+    linker: "Linker",
+    all_columns: List[str],
+    threshold: int,
+    max_results: Optional[int] = None,
+) -> Dict[frozenset[str], int]:
+    """Count the comparisons for the combinations of columns that
+    _search_tree_for_blocking_rules_below_threshold_count will visit, one level
+    of the tree (i.e. number of columns) at a time, with at most
+    MAX_GROUPING_SETS_PER_QUERY combinations counted per query.
+
+    The combinations at each level are those that extend a combination at the
+    previous level whose count exceeded the threshold.  Once `max_results`
+    combinations below the threshold have been found, no further levels are
+    counted, so the returned counts may not cover every node the search visits.
+    """
+    db_api = linker._db_api
+    comparison_counts: Dict[frozenset[str], int] = {}
+    num_below_threshold = 0
+
+    level: List[List[str]] = [[]]
+    while level:
+        level_counts = {frozenset(combination): 0 for combination in level}
+        for start in range(0, len(level), MAX_GROUPING_SETS_PER_QUERY):
+            pipeline = CTEPipeline()
+            sqls = _comparison_counts_for_combinations_sql(
+                linker._input_tables_dict,
+                linker._settings_obj._link_type,
+                all_columns,
+                level[start : start + MAX_GROUPING_SETS_PER_QUERY],
+            )
+            pipeline.enqueue_list_of_sqls(sqls)
+            counts_df = db_api.sql_pipeline_to_splink_dataframe(pipeline)
+            for row in counts_df.as_record_dict():
+                combination = frozenset(
+                    c
+                    for i, c in enumerate(all_columns)
+                    if row[f"__splink__grouped_{i}"] == 0
+                )
+                level_counts[combination] = int(row["comparison_count"] or 0)
+            counts_df.drop_table_from_database_and_remove_from_cache()
+        comparison_counts.update(level_counts)
+
+        num_below_threshold += sum(c <= threshold for c in level_counts.values())
+        if max_results is not None and num_below_threshold >= max_results:
+            break
+
+        next_level: Dict[frozenset[str], List[str]] = {}
+        for combination in level:
+            if comparison_counts[frozenset(combination)] <= threshold:
+                continue
+            for col in all_columns:
+                next_combination = frozenset(combination + [col])
+                if col not in combination and len(next_combination) < len(all_columns):
+                    next_level.setdefault(next_combination, combination + [col])
+        level = list(next_level.values())
+
+    return comparison_counts
+
+
 def _search_tree_for_blocking_rules_below_threshold_count(
     linker: "Linker",
     all_columns: List[str],
@@ -92,6 +241,7 @@ def _search_tree_for_blocking_rules_below_threshold_count(
     already_visited: Set[frozenset[str]] = None,
     results: List[Dict[str, str]] = None,
     max_results: Optional[int] = None,
+    comparison_counts: Optional[Dict[frozenset[str], int]] = None,
 ) -> List[Dict[str, str]]:
     """
     Recursively search combinations of fields to find ones that result in a count less
@@ -144,6 +294,9 @@ def _search_tree_for_blocking_rules_below_threshold_count(
         current_combination (List[str], optional): Current combination of fields.
         already_visited (Set[frozenset], optional): Set of visited combinations.
         results (List[Dict[str, str]], optional): List of results. Defaults to [].
+        comparison_counts (Dict[frozenset, int], optional): Precomputed counts
+            of comparisons for combinations, see _comparison_counts_by_level.
+            Combinations which are not in it are counted with a separate query.
 
     Returns:
         List[Dict]: List of results.  Each result is a dict with statistics like
@@ -164,17 +317,21 @@ def _search_tree_for_blocking_rules_below_threshold_count(
 
     br = _generate_blocking_rule(linker._db_api, current_combination)
 
-    comparison_count = _count_comparisons_generated_from_blocking_rule(
-        splink_df_dict=linker._input_tables_dict,
-        blocking_rule=br,
-        link_type=linker._settings_obj._link_type,
-        db_api=linker._db_api,
-        compute_post_filter_count=False,
-        source_dataset_input_column=linker._settings_obj.column_info_settings.source_dataset_input_column,
-        unique_id_input_column=linker._settings_obj.column_info_settings.unique_id_input_column,
-    )["number_of_comparisons_generated_pre_filter_conditions"]
-
-    already_visited.add(frozenset(current_combination))
+    combination_key = frozenset(current_combination)
+    if comparison_counts is not None and combination_key in comparison_counts:
+        comparison_count = comparison_counts[combination_key]
+    else:
+        comparison_count = _count_comparisons_generated_from_blocking_rule(
+            splink_df_dict=linker._input_tables_dict,
+            blocking_rule=br,
+            link_type=linker._settings_obj._link_type,
+            db_api=linker._db_api,
+            compute_post_filter_count=False,
+            source_dataset_input_column=linker._settings_obj.column_info_settings.source_dataset_input_column,
+            unique_id_input_column=linker._settings_obj.column_info_settings.unique_id_input_column,
+        )["number_of_comparisons_generated_pre_filter_conditions"]
+
+    already_visited.add(combination_key)
 
     # int just to satisfy mypy
     comparison_count = int(comparison_count)
@@ -192,6 +349,7 @@ def _search_tree_for_blocking_rules_below_threshold_count(
                 already_visited,
                 results,
                 max_results=max_results,
+                comparison_counts=comparison_counts,
             )
     else:
         row = _generate_output_combinations_table_row(
@@ -257,11 +415,22 @@ def find_blocking_rules_below_threshold_comparison_count(
         else:
             column_expressions_as_strings.append(c)
 
+    # Where possible, count a whole level of the search tree in a single scan
+    comparison_counts = None
+    if linker._db_api.sql_dialect.supports_grouping_sets:
+        comparison_counts = _comparison_counts_by_level(
+            linker,
+            column_expressions_as_strings,
+            max_comparisons_per_rule,
+            max_results=max_results,
+        )
+
     results = _search_tree_for_blocking_rules_below_threshold_count(
         linker,
         column_expressions_as_strings,
         max_comparisons_per_rule,
         max_results=max_results,
+        comparison_counts=comparison_counts,
     )
 
     if not results:
@@ -0,0 +1,158 @@
+from __future__ import annotations
+
+from typing import List, Optional
+
+from splink.internals.input_column import InputColumn
+from splink.internals.term_frequencies import colname_to_tf_tablename
+
+RETRACTED_IDS_TABLENAME = "__splink__df_incremental_retracted_ids"
+
+
+def incremental_tf_tablename(tf_col: InputColumn) -> str:
+    return colname_to_tf_tablename(tf_col).replace(
+        "__splink__df_tf_", "__splink__df_incremental_tf_"
+    )
+
+
+def _not_retracted_sql(
+    unique_id_input_columns: List[InputColumn],
+    table_alias: str,
+    side: Optional[str] = None,
+) -> str:
+    def name(col: InputColumn) -> str:
+        return {None: col.name, "l": col.name_l, "r": col.name_r}[side]
+
+    conditions = " and ".join(
+        f"x.{col.name} = {table_alias}.{name(col)}" for col in unique_id_input_columns
+    )
+    return f"""
+    not exists (
+        select 1 from {RETRACTED_IDS_TABLENAME} as x
+        where {conditions}
+    )
+    """
+
+
+def retracted_ids_sql(
+    unique_id_input_columns: List[InputColumn], tablenames: List[str]
+) -> str:
+    """The ids of records whose existing pairs are retracted: those of the new or
+    updated records, and of any deleted records"""
+    id_cols = ", ".join(col.name for col in unique_id_input_columns)
+    return " UNION ".join(f"select {id_cols} from {tbl}" for tbl in tablenames)
+
+
+def updated_term_frequencies_sql(
+    tf_col: InputColumn,
+    unique_id_input_columns: List[InputColumn],
+    old_tf_tablename: str,
+) -> str:
+    """Update a term frequency table by the values of the retracted and new
+    records, rather than recounting every value of `__splink__df_concat_with_tf`
+    """
+    col = tf_col.name
+    join_condition = " and ".join(
+        f"x.{uid_col.name} = nodes.{uid_col.name}"
+        for uid_col in unique_id_input_columns
+    )
+
+    # The old counts are recovered from the term frequencies and the number of
+    # non-null values they were computed from
+    return f"""
+    select
+    {col},
+    cast(sum(count_change) as float8) / sum(sum(count_change)) over ()
+        as {tf_col.tf_name}
+    from (
+        select {col}, cast(round({tf_col.tf_name} * (
+            select count({col}) from __splink__df_concat_with_tf
+        )) as bigint) as count_change
+        from {old_tf_tablename}
+
+        UNION ALL
+
+        select nodes.{col}, -1 as count_change
+        from {RETRACTED_IDS_TABLENAME} as x
+        inner join __splink__df_concat_with_tf as nodes
+        on {join_condition}
+        where nodes.{col} is not null
+
+        UNION ALL
+
+        select {col}, 1 as count_change
+        from __splink__df_incremental_records
+        where {col} is not null
+    ) as __splink__tf_count_changes
+    group by {col}
+    having sum(count_change) > 0
+    """
+
+
+def incremental_nodes_sqls(
+    node_columns: List[InputColumn],
+    tf_cols: List[InputColumn],
+    unique_id_input_columns: List[InputColumn],
+) -> list[dict[str, str]]:
+    """The records to block and score, joined to the updated term frequencies:
+
+    - `__splink__df_incremental_unchanged_with_tf`: the existing records which
+        have been neither updated nor deleted
+    - `__splink__df_incremental_records_with_tf`: the new and updated records
+
+    Each is computed by its own pipeline, so that it is materialised once
+    """
+    sqls = []
+
+    select_cols = [f"n.{col.name}" for col in node_columns]
+    left_joins = []
+    for i, tf_col in enumerate(tf_cols):
+        tbl = incremental_tf_tablename(tf_col)
+        select_cols.append(f"tf_{i}.{tf_col.tf_name}")
+        left_joins.append(
+            f"left join {tbl} as tf_{i} on n.{tf_col.name} = tf_{i}.{tf_col.name}"
+        )
+    select_cols_expr = ", ".join(select_cols)
+    left_joins_expr = "\n".join(left_joins)
+
+    sql = f"""
+    select {select_cols_expr}
+    from __splink__df_concat_with_tf as n
+    {left_joins_expr}
+    where {_not_retracted_sql(unique_id_input_columns, "n")}
+    """
+    sqls.append(
+        {"sql": sql, "output_table_name": "__splink__df_incremental_unchanged_with_tf"}
+    )
+
+    sql = f"""
+    select {select_cols_expr}
+    from __splink__df_incremental_records as n
+    {left_joins_expr}
+    """
+    sqls.append(
+        {"sql": sql, "output_table_name": "__splink__df_incremental_records_with_tf"}
+    )
+
+    return sqls
+
+
+def merge_predictions_sql(
+    columns: List[InputColumn],
+    unique_id_input_columns: List[InputColumn],
+    existing_predictions_tablename: str,
+    new_predictions_tablename: str,
+) -> str:
+    """Replace the pairs of the retracted records in the existing predictions with
+    the newly scored pairs"""
+    cols_expr = ", ".join(col.name for col in columns)
+    return f"""
+    select {cols_expr}
+    from {existing_predictions_tablename} as p
+    where {_not_retracted_sql(unique_id_input_columns, "p", "l")}
+    and {_not_retracted_sql(unique_id_input_columns, "p", "r")}
+
+    UNION ALL
+
+    select {cols_expr}
+    from {new_predictions_tablename}
+    """
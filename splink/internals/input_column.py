@@ -8,6 +8,7 @@ import sqlglot
 import sqlglot.expressions as exp
 
 from splink.internals.sql_transform import sqlglot_tree_signature
+from splink.internals.sqlglot_cache import parse_one_cached
 
 if TYPE_CHECKING:
     from splink.internals.settings import ColumnInfoSettings
@@ -102,14 +103,14 @@ class SqlglotColumnTreeBuilder:
                 return f"{q_s}{input_str}{q_e}"
 
         valid_signatures = {
-            sqlglot_tree_signature(sqlglot.parse_one("col_name")),
-            sqlglot_tree_signature(sqlglot.parse_one("col_name[1]")),
-            sqlglot_tree_signature(sqlglot.parse_one("col_name['lat']")),
+            sqlglot_tree_signature(parse_one_cached("col_name", copy=False)),
+            sqlglot_tree_signature(parse_one_cached("col_name[1]", copy=False)),
+            sqlglot_tree_signature(parse_one_cached("col_name['lat']", copy=False)),
         }
 
         # If the raw string parses to a valid signature, use it
         try:
-            tree = sqlglot.parse_one(input_str, read=sqlglot_dialect)
+            tree = parse_one_cached(input_str, dialect=sqlglot_dialect)
         except (sqlglot.ParseError, sqlglot.TokenError):
             pass
         else:
@@ -126,7 +127,7 @@ class SqlglotColumnTreeBuilder:
         q_s, q_e = _get_dialect_quotes(sqlglot_dialect)
         input_str = add_quotes_to_column_name(input_str, q_s, q_e)
         try:
-            tree = sqlglot.parse_one(input_str, read=sqlglot_dialect)
+            tree = parse_one_cached(input_str, dialect=sqlglot_dialect)
         except (sqlglot.ParseError, sqlglot.TokenError):
             pass
         else:
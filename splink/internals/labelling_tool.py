@@ -7,12 +7,14 @@ from typing import TYPE_CHECKING, Any
 
 import numpy as np
 import pandas as pd
-from jinja2 import Template
 
 from splink.internals.misc import EverythingEncoder, read_resource
 from splink.internals.pipeline import CTEPipeline
 from splink.internals.splink_dataframe import SplinkDataFrame
-from splink.internals.vertically_concatenate import compute_df_concat_with_tf
+from splink.internals.vertically_concatenate import (
+    compute_df_concat_with_tf,
+    visible_columns_sql,
+)
 
 # https://stackoverflow.com/questions/39740632/python-type-hinting-without-cyclic-imports
 if TYPE_CHECKING:
@@ -43,7 +45,7 @@ def generate_labelling_tool_comparisons(
         """
 
     sql = f"""
-    select *
+    select {visible_columns_sql(nodes_with_tf)}
     from __splink__df_concat_with_tf
     where {settings.column_info_settings.unique_id_column_name} = '{unique_id}'
     {source_dataset_condition}
@@ -87,6 +89,9 @@ def render_labelling_tool_html(
     )
 
     comparisons_recs = comparisons_recs.to_dict(orient="records")
+    # jinja2 is only imported when a dashboard is rendered
+    from jinja2 import Template
+
     # Render template with cluster, nodes and edges
     template_path = "internals/files/labelling_tool/template.j2"
     template = Template(read_resource(template_path))
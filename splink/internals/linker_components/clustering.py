@@ -2,6 +2,7 @@ from __future__ import annotations
 
 from typing import TYPE_CHECKING, Optional
 
+from splink.internals.blocking import available_row_key_column
 from splink.internals.connected_components import (
     _cc_create_unique_id_cols,
     solve_connected_components,
@@ -61,18 +62,21 @@ class LinkerClustering:
         # Feeding in df_predict forces materiailisation, if it exists in your database
         pipeline = CTEPipeline()
         nodes_with_tf = compute_df_concat_with_tf(self._linker, pipeline)
+        row_key_column = available_row_key_column(nodes_with_tf, [])
 
         edges_table = _cc_create_unique_id_cols(
             self._linker,
             nodes_with_tf.physical_name,
             df_predict,
             threshold_match_probability,
+            row_key_column=row_key_column,
         )
 
         cc = solve_connected_components(
             self._linker,
             edges_table,
             nodes_with_tf,
+            row_key_column=row_key_column,
         )
         cc.metadata["threshold_match_probability"] = threshold_match_probability
 
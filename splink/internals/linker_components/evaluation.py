@@ -16,10 +16,6 @@ from splink.internals.charts import (
     threshold_selection_tool,
     unlinkables_chart,
 )
-from splink.internals.labelling_tool import (
-    generate_labelling_tool_comparisons,
-    render_labelling_tool_html,
-)
 from splink.internals.splink_dataframe import SplinkDataFrame
 from splink.internals.unlinkables import unlinkables_data
 
@@ -401,6 +397,12 @@ class LinkerEvalution:
                 True.
         """
 
+        # Imported on first use, to keep `import splink` fast
+        from splink.internals.labelling_tool import (
+            generate_labelling_tool_comparisons,
+            render_labelling_tool_html,
+        )
+
         df_comparisons = generate_labelling_tool_comparisons(
             self._linker,
             unique_id,
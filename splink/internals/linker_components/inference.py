@@ -1,13 +1,23 @@
 from __future__ import annotations
 
+import glob
+import hashlib
+import json
 import logging
+import os
+import shutil
 import time
-from typing import TYPE_CHECKING, Any
+from typing import TYPE_CHECKING, Any, Dict, Optional, get_args
 
 from splink.internals.blocking import (
     BlockingRule,
+    ExplodingBlockingRule,
+    SortedNeighbourhoodBlockingRule,
+    available_row_key_column,
     block_using_rules_sqls,
+    deduplication_strategy_options,
     materialise_exploded_id_tables,
+    materialise_skewed_key_tables,
 )
 from splink.internals.blocking_rule_creator import BlockingRuleCreator
 from splink.internals.blocking_rule_creator_utils import to_blocking_rule_creator
@@ -18,10 +28,20 @@ from splink.internals.database_api import AcceptableInputTableType
 from splink.internals.find_matches_to_new_records import (
     add_unique_id_and_source_dataset_cols_if_needed,
 )
+from splink.internals.incremental_predict import (
+    RETRACTED_IDS_TABLENAME,
+    incremental_nodes_sqls,
+    incremental_tf_tablename,
+    merge_predictions_sql,
+    retracted_ids_sql,
+    updated_term_frequencies_sql,
+)
+from splink.internals.input_column import InputColumn
 from splink.internals.misc import (
     ascii_uid,
     ensure_is_list,
 )
+from splink.internals.persistent_cache import table_fingerprint
 from splink.internals.pipeline import CTEPipeline
 from splink.internals.predict import (
     predict_from_comparison_vectors_sqls_using_settings,
@@ -31,10 +51,16 @@ from splink.internals.term_frequencies import (
     _join_new_table_to_df_concat_with_tf_sql,
     colname_to_tf_tablename,
 )
+from splink.internals.unique_id_concat import _composite_unique_id_from_nodes_sql
 from splink.internals.vertically_concatenate import (
+    ROW_KEY_COLUMN_NAME,
+    _check_row_key_is_unique,
+    _row_key_sql,
+    available_blocking_key_columns,
     compute_df_concat_with_tf,
     enqueue_df_concat_with_tf,
     split_df_concat_with_tf_into_two_tables_sqls,
+    vertically_concatenate_sql,
 )
 
 if TYPE_CHECKING:
@@ -51,6 +77,104 @@ class LinkerInference:
     def __init__(self, linker: Linker):
         self._linker = linker
 
+    def _enqueue_blocking_sqls(
+        self,
+        pipeline: CTEPipeline,
+        blocking_key_columns: Dict[str, str],
+        row_key_column: Optional[InputColumn] = None,
+        deduplication_strategy: deduplication_strategy_options = "auto",
+        nodes_with_tf: Optional[SplinkDataFrame] = None,
+    ) -> tuple[list[BlockingRule], list[BlockingRule]]:
+        """Enqueue the SQL to create __splink__blocked_id_pairs from
+        __splink__df_concat_with_tf, materialising any tables of exploded id
+        pairs or skewed keys the blocking rules need.
+
+        Returns the blocking rules with materialised tables, which should be
+        dropped once the blocked pairs have been computed.
+        """
+        materialised_brs = self._materialise_blocking_tables(nodes_with_tf)
+        self._enqueue_blocked_pairs_sqls(
+            pipeline,
+            blocking_key_columns,
+            row_key_column,
+            deduplication_strategy=deduplication_strategy,
+        )
+        return materialised_brs
+
+    def _blocking_link_type(self) -> str:
+        if (
+            len(self._linker._input_tables_dict) == 2
+            and self._linker._settings_obj._link_type == "link_only"
+        ):
+            return "two_dataset_link_only"
+        return self._linker._settings_obj._link_type
+
+    def _materialise_blocking_tables(
+        self, nodes_with_tf: Optional[SplinkDataFrame] = None
+    ) -> tuple[list[BlockingRule], list[BlockingRule]]:
+        """Materialise the tables of exploded id pairs and skewed keys needed by
+        the blocking rules, returning the exploding and adaptive salted rules.
+
+        If the materialised `nodes_with_tf` is given, exploded id pairs are
+        keyed on its row keys where possible"""
+        settings = self._linker._settings_obj
+        exploding_br_with_id_tables = materialise_exploded_id_tables(
+            link_type=self._blocking_link_type(),
+            blocking_rules=settings._blocking_rules_to_generate_predictions,
+            db_api=self._linker._db_api,
+            splink_df_dict=self._linker._input_tables_dict,
+            source_dataset_input_column=settings.column_info_settings.source_dataset_input_column,
+            unique_id_input_column=settings.column_info_settings.unique_id_input_column,
+            nodes_with_tf=nodes_with_tf,
+        )
+
+        adaptive_salted_brs = materialise_skewed_key_tables(
+            blocking_rules=settings._blocking_rules_to_generate_predictions,
+            db_api=self._linker._db_api,
+            splink_df_dict=self._linker._input_tables_dict,
+            source_dataset_input_column=settings.column_info_settings.source_dataset_input_column,
+        )
+        return exploding_br_with_id_tables, adaptive_salted_brs
+
+    def _enqueue_blocked_pairs_sqls(
+        self,
+        pipeline: CTEPipeline,
+        blocking_key_columns: Dict[str, str],
+        row_key_column: Optional[InputColumn] = None,
+        deduplication_strategy: deduplication_strategy_options = "auto",
+        left_record_condition: Optional[str] = None,
+    ) -> None:
+        """Enqueue the SQL to create __splink__blocked_id_pairs, once any tables
+        needed by the blocking rules have been materialised"""
+        settings = self._linker._settings_obj
+        blocking_input_tablename_l = "__splink__df_concat_with_tf"
+        blocking_input_tablename_r = "__splink__df_concat_with_tf"
+
+        link_type = self._blocking_link_type()
+        if link_type == "two_dataset_link_only":
+            sqls = split_df_concat_with_tf_into_two_tables_sqls(
+                "__splink__df_concat_with_tf",
+                settings.column_info_settings.source_dataset_column_name,
+            )
+            pipeline.enqueue_list_of_sqls(sqls)
+
+            blocking_input_tablename_l = "__splink__df_concat_with_tf_left"
+            blocking_input_tablename_r = "__splink__df_concat_with_tf_right"
+
+        sqls = block_using_rules_sqls(
+            input_tablename_l=blocking_input_tablename_l,
+            input_tablename_r=blocking_input_tablename_r,
+            blocking_rules=settings._blocking_rules_to_generate_predictions,
+            link_type=link_type,
+            source_dataset_input_column=settings.column_info_settings.source_dataset_input_column,
+            unique_id_input_column=settings.column_info_settings.unique_id_input_column,
+            deduplication_strategy=deduplication_strategy,
+            blocking_key_columns=blocking_key_columns,
+            row_key_column=row_key_column,
+            left_record_condition=left_record_condition,
+        )
+        pipeline.enqueue_list_of_sqls(sqls)
+
     def deterministic_link(self) -> SplinkDataFrame:
         """Uses the blocking rules specified by
         `blocking_rules_to_generate_predictions` in your settings to
@@ -87,45 +211,21 @@ class LinkerInference:
         # to set the cluster threshold to 1
 
         df_concat_with_tf = compute_df_concat_with_tf(self._linker, pipeline)
-        pipeline = CTEPipeline([df_concat_with_tf])
-        link_type = self._linker._settings_obj._link_type
-
-        blocking_input_tablename_l = "__splink__df_concat_with_tf"
-        blocking_input_tablename_r = "__splink__df_concat_with_tf"
-
-        link_type = self._linker._settings_obj._link_type
-        if (
-            len(self._linker._input_tables_dict) == 2
-            and self._linker._settings_obj._link_type == "link_only"
-        ):
-            sqls = split_df_concat_with_tf_into_two_tables_sqls(
-                "__splink__df_concat_with_tf",
-                self._linker._settings_obj.column_info_settings.source_dataset_column_name,
-            )
-            pipeline.enqueue_list_of_sqls(sqls)
-
-            blocking_input_tablename_l = "__splink__df_concat_with_tf_left"
-            blocking_input_tablename_r = "__splink__df_concat_with_tf_right"
-            link_type = "two_dataset_link_only"
-
-        exploding_br_with_id_tables = materialise_exploded_id_tables(
-            link_type=link_type,
-            blocking_rules=self._linker._settings_obj._blocking_rules_to_generate_predictions,
-            db_api=self._linker._db_api,
-            splink_df_dict=self._linker._input_tables_dict,
-            source_dataset_input_column=self._linker._settings_obj.column_info_settings.source_dataset_input_column,
-            unique_id_input_column=self._linker._settings_obj.column_info_settings.unique_id_input_column,
+        blocking_key_columns = available_blocking_key_columns(
+            self._linker, df_concat_with_tf
+        )
+        row_key_column = available_row_key_column(
+            df_concat_with_tf,
+            self._linker._settings_obj._blocking_rules_to_generate_predictions,
         )
+        pipeline = CTEPipeline([df_concat_with_tf])
 
-        sqls = block_using_rules_sqls(
-            input_tablename_l=blocking_input_tablename_l,
-            input_tablename_r=blocking_input_tablename_r,
-            blocking_rules=self._linker._settings_obj._blocking_rules_to_generate_predictions,
-            link_type=link_type,
-            source_dataset_input_column=self._linker._settings_obj.column_info_settings.source_dataset_input_column,
-            unique_id_input_column=self._linker._settings_obj.column_info_settings.unique_id_input_column,
+        exploding_br_with_id_tables, adaptive_salted_brs = self._enqueue_blocking_sqls(
+            pipeline,
+            blocking_key_columns,
+            row_key_column,
+            nodes_with_tf=df_concat_with_tf,
         )
-        pipeline.enqueue_list_of_sqls(sqls)
         blocked_pairs = self._linker._db_api.sql_pipeline_to_splink_dataframe(pipeline)
 
         pipeline = CTEPipeline([blocked_pairs, df_concat_with_tf])
@@ -137,6 +237,7 @@ class LinkerInference:
             input_tablename_r="__splink__df_concat_with_tf",
             source_dataset_input_column=self._linker._settings_obj.column_info_settings.source_dataset_input_column,
             unique_id_input_column=self._linker._settings_obj.column_info_settings.unique_id_input_column,
+            row_key_column=row_key_column,
         )
         pipeline.enqueue_list_of_sqls(sqls)
 
@@ -146,6 +247,7 @@ class LinkerInference:
         deterministic_link_df.metadata["is_deterministic_link"] = True
 
         [b.drop_materialised_id_pairs_dataframe() for b in exploding_br_with_id_tables]
+        [b.drop_materialised_skewed_keys_dataframe() for b in adaptive_salted_brs]
         blocked_pairs.drop_table_from_database_and_remove_from_cache()
 
         return deterministic_link_df
@@ -156,6 +258,11 @@ class LinkerInference:
         threshold_match_weight: float = None,
         materialise_after_computing_term_frequencies: bool = True,
         materialise_blocked_pairs: bool = True,
+        use_agreement_pattern_lookup: bool = False,
+        use_log2_match_weights: bool = False,
+        top_k_per_record: int = None,
+        top_k_per_record_side: str = "l",
+        deduplication_strategy: deduplication_strategy_options = "auto",
     ) -> SplinkDataFrame:
         """Create a dataframe of scored pairwise comparisons using the parameters
         of the linkage model.
@@ -178,6 +285,32 @@ class LinkerInference:
                 computed as part of a large CTE pipeline.   Defaults to True
             materialise_blocked_pairs: In the blocking phase, materialise the table
                 of pairs of records that will be scored
+            use_agreement_pattern_lookup (bool): If True, score each possible
+                agreement pattern once and join the scores to the comparisons,
+                rather than computing the match weight of every comparison from
+                its Bayes factors. Only available for models without term
+                frequency adjustments. Defaults to False.
+            use_log2_match_weights (bool): If True, sum the log2 Bayes factor of
+                each comparison to give the match weight, and derive the match
+                probability once from that sum, rather than multiplying Bayes
+                factors. This avoids overflow when many comparisons agree.
+                Defaults to False.
+            top_k_per_record (int, optional): If specified, keep only the
+                top_k_per_record highest scoring candidates of each record, as
+                ranked by match_weight. The rank of each pair is returned in a
+                match_rank_l (and/or match_rank_r) column. Defaults to None.
+            top_k_per_record_side (str): Whose candidates are ranked: 'l' ranks
+                the candidates of each left record, 'r' of each right record,
+                and 'either' keeps a pair if it is among the top candidates of
+                either of its records. Defaults to 'l'.
+            deduplication_strategy (str): How pairs generated by more than one
+                blocking rule are deduplicated. 'exclude_preceding_rules' adds
+                conditions to each rule excluding the pairs of the rules before
+                it. 'group_by' combines the pairs of all rules and attributes
+                each pair to the first rule which generated it, in a single
+                aggregation, which is cheaper when there are many rules. 'auto'
+                chooses between these based on the blocking rules. Defaults to
+                'auto'.
 
         Examples:
             ```py
@@ -189,7 +322,26 @@ class LinkerInference:
             SplinkDataFrame: A SplinkDataFrame of the scored pairwise comparisons.
         """
 
+        if deduplication_strategy not in get_args(deduplication_strategy_options):
+            raise ValueError(
+                f"Unknown deduplication_strategy '{deduplication_strategy}'. "
+                "Must be one of 'auto', 'exclude_preceding_rules' or 'group_by'"
+            )
+
+        # Generated up front so that an unusable scoring mode fails before blocking
+        predict_sqls = predict_from_comparison_vectors_sqls_using_settings(
+            self._linker._settings_obj,
+            threshold_match_probability,
+            threshold_match_weight,
+            sql_infinity_expression=self._linker._infinity_expression,
+            use_agreement_pattern_lookup=use_agreement_pattern_lookup,
+            log2_weights=use_log2_match_weights,
+            top_k_per_record=top_k_per_record,
+            top_k_per_record_side=top_k_per_record_side,
+        )
+
         pipeline = CTEPipeline()
+        nodes_with_tf = None
 
         # If materialise_after_computing_term_frequencies=False and the user only
         # calls predict, it runs as a single pipeline with no materialisation
@@ -202,53 +354,30 @@ class LinkerInference:
             or self._linker._sql_dialect == "duckdb"
         ):
             df_concat_with_tf = compute_df_concat_with_tf(self._linker, pipeline)
+            blocking_key_columns = available_blocking_key_columns(
+                self._linker, df_concat_with_tf
+            )
+            row_key_column = available_row_key_column(
+                df_concat_with_tf,
+                self._linker._settings_obj._blocking_rules_to_generate_predictions,
+            )
             pipeline = CTEPipeline([df_concat_with_tf])
+            nodes_with_tf = df_concat_with_tf
         else:
+            blocking_key_columns = available_blocking_key_columns(self._linker)
+            row_key_column = None
             pipeline = enqueue_df_concat_with_tf(self._linker, pipeline)
 
         start_time = time.time()
 
-        blocking_input_tablename_l = "__splink__df_concat_with_tf"
-        blocking_input_tablename_r = "__splink__df_concat_with_tf"
-
-        link_type = self._linker._settings_obj._link_type
-        if (
-            len(self._linker._input_tables_dict) == 2
-            and self._linker._settings_obj._link_type == "link_only"
-        ):
-            sqls = split_df_concat_with_tf_into_two_tables_sqls(
-                "__splink__df_concat_with_tf",
-                self._linker._settings_obj.column_info_settings.source_dataset_column_name,
-            )
-            pipeline.enqueue_list_of_sqls(sqls)
-
-            blocking_input_tablename_l = "__splink__df_concat_with_tf_left"
-            blocking_input_tablename_r = "__splink__df_concat_with_tf_right"
-            link_type = "two_dataset_link_only"
-
-        # If exploded blocking rules exist, we need to materialise
-        # the tables of ID pairs
-
-        exploding_br_with_id_tables = materialise_exploded_id_tables(
-            link_type=link_type,
-            blocking_rules=self._linker._settings_obj._blocking_rules_to_generate_predictions,
-            db_api=self._linker._db_api,
-            splink_df_dict=self._linker._input_tables_dict,
-            source_dataset_input_column=self._linker._settings_obj.column_info_settings.source_dataset_input_column,
-            unique_id_input_column=self._linker._settings_obj.column_info_settings.unique_id_input_column,
-        )
-
-        sqls = block_using_rules_sqls(
-            input_tablename_l=blocking_input_tablename_l,
-            input_tablename_r=blocking_input_tablename_r,
-            blocking_rules=self._linker._settings_obj._blocking_rules_to_generate_predictions,
-            link_type=link_type,
-            source_dataset_input_column=self._linker._settings_obj.column_info_settings.source_dataset_input_column,
-            unique_id_input_column=self._linker._settings_obj.column_info_settings.unique_id_input_column,
+        exploding_br_with_id_tables, adaptive_salted_brs = self._enqueue_blocking_sqls(
+            pipeline,
+            blocking_key_columns,
+            row_key_column,
+            deduplication_strategy=deduplication_strategy,
+            nodes_with_tf=nodes_with_tf,
         )
 
-        pipeline.enqueue_list_of_sqls(sqls)
-
         if materialise_blocked_pairs:
             blocked_pairs = self._linker._db_api.sql_pipeline_to_splink_dataframe(
                 pipeline
@@ -266,16 +395,11 @@ class LinkerInference:
             input_tablename_r="__splink__df_concat_with_tf",
             source_dataset_input_column=self._linker._settings_obj.column_info_settings.source_dataset_input_column,
             unique_id_input_column=self._linker._settings_obj.column_info_settings.unique_id_input_column,
+            row_key_column=row_key_column,
         )
         pipeline.enqueue_list_of_sqls(sqls)
 
-        sqls = predict_from_comparison_vectors_sqls_using_settings(
-            self._linker._settings_obj,
-            threshold_match_probability,
-            threshold_match_weight,
-            sql_infinity_expression=self._linker._infinity_expression,
-        )
-        pipeline.enqueue_list_of_sqls(sqls)
+        pipeline.enqueue_list_of_sqls(predict_sqls)
 
         predictions = self._linker._db_api.sql_pipeline_to_splink_dataframe(pipeline)
 
@@ -285,11 +409,452 @@ class LinkerInference:
         self._linker._predict_warning()
 
         [b.drop_materialised_id_pairs_dataframe() for b in exploding_br_with_id_tables]
+        [b.drop_materialised_skewed_keys_dataframe() for b in adaptive_salted_brs]
         if materialise_blocked_pairs:
             blocked_pairs.drop_table_from_database_and_remove_from_cache()
 
         return predictions
 
+    def predict_to_parquet(
+        self,
+        output_path: str,
+        num_chunks: int = 16,
+        threshold_match_probability: float = None,
+        threshold_match_weight: float = None,
+    ) -> list[str]:
+        """Score pairwise comparisons in chunks, writing each chunk to a parquet
+        file in `output_path`, so that memory use is bounded by the size of a
+        chunk rather than the total number of comparisons.
+
+        The records are split into `num_chunks` partitions using a hash of their
+        unique id.  For each partition in turn, the pairs whose left hand record
+        is in the partition are blocked, scored and written to
+        `{output_path}/part-{chunk}-of-{num_chunks}.parquet`, so the pairs of
+        other chunks are never generated.  This costs a pass over the input
+        records per chunk.  Sorted neighbourhood rules sort all records for
+        each chunk.
+
+        Chunks whose file already exists are skipped, so an interrupted run
+        resumes from the last completed chunk if called again with the same
+        `output_path`.  A manifest of the model, `num_chunks`, thresholds and a
+        fingerprint of the input data is written to
+        `{output_path}/_manifest.json`, and an error is raised rather than
+        resuming if any of these have changed.
+
+        Args:
+            output_path (str): Directory in which to write the parquet files
+            num_chunks (int): The number of chunks into which the comparisons
+                are split.  Defaults to 16.
+            threshold_match_probability (float, optional): If specified,
+                filter the results to include only pairwise comparisons with a
+                match_probability above this threshold. Defaults to None.
+            threshold_match_weight (float, optional): If specified,
+                filter the results to include only pairwise comparisons with a
+                match_weight above this threshold. Defaults to None.
+
+        Examples:
+            ```py
+            paths = linker.inference.predict_to_parquet(
+                "predictions", num_chunks=64, threshold_match_probability=0.5
+            )
+            duckdb.sql("select * from read_parquet('predictions/*.parquet')")
+            ```
+        Returns:
+            list[str]: The paths of the parquet files making up the predictions
+        """
+        if num_chunks < 1:
+            raise ValueError("`num_chunks` must be a positive integer")
+
+        db_api = self._linker._db_api
+        settings = self._linker._settings_obj
+
+        # The linker_uid differs between sessions, even for the same model
+        model_dict = settings.as_dict()
+        model_dict.pop("linker_uid", None)
+        manifest = {
+            "settings_hash": hashlib.sha256(
+                json.dumps(model_dict, sort_keys=True, default=str).encode()
+            ).hexdigest(),
+            "num_chunks": num_chunks,
+            "threshold_match_probability": threshold_match_probability,
+            "threshold_match_weight": threshold_match_weight,
+            "input_fingerprints": [
+                table_fingerprint(df.physical_name, db_api)
+                for df in self._linker._input_tables_dict.values()
+            ],
+        }
+        _check_or_write_predict_manifest(output_path, manifest)
+
+        paths = [
+            os.path.join(output_path, f"part-{chunk:05d}-of-{num_chunks:05d}.parquet")
+            for chunk in range(num_chunks)
+        ]
+        if all(os.path.exists(path) for path in paths):
+            logger.info(f"All chunks in {output_path} are already complete")
+            self._linker._predict_warning()
+            return paths
+
+        pipeline = CTEPipeline()
+        df_concat_with_tf = compute_df_concat_with_tf(self._linker, pipeline)
+        blocking_key_columns = available_blocking_key_columns(
+            self._linker, df_concat_with_tf
+        )
+        row_key_column = available_row_key_column(
+            df_concat_with_tf,
+            self._linker._settings_obj._blocking_rules_to_generate_predictions,
+        )
+        exploding_br_with_id_tables, adaptive_salted_brs = (
+            self._materialise_blocking_tables(df_concat_with_tf)
+        )
+
+        uid_expr_l = _composite_unique_id_from_nodes_sql(
+            settings.column_info_settings.unique_id_input_columns, "l"
+        )
+        partition_expr = db_api.sql_dialect.hash_partition_sql(uid_expr_l, num_chunks)
+
+        in_progress_dir = f"{os.path.normpath(output_path)}_in_progress"
+        for chunk, path in enumerate(paths):
+            if os.path.exists(path):
+                logger.info(f"Skipping completed chunk {path}")
+                continue
+
+            start_time = time.time()
+
+            # Only the pairs whose left record is in this chunk are blocked, so
+            # the pairs of the other chunks are never generated
+            pipeline = CTEPipeline([df_concat_with_tf])
+            self._enqueue_blocked_pairs_sqls(
+                pipeline,
+                blocking_key_columns,
+                row_key_column,
+                left_record_condition=f"{partition_expr} = {chunk}",
+            )
+
+            sqls = compute_comparison_vector_values_from_id_pairs_sqls(
+                settings._columns_to_select_for_blocking,
+                settings._columns_to_select_for_comparison_vector_values,
+                input_tablename_l="__splink__df_concat_with_tf",
+                input_tablename_r="__splink__df_concat_with_tf",
+                source_dataset_input_column=settings.column_info_settings.source_dataset_input_column,
+                unique_id_input_column=settings.column_info_settings.unique_id_input_column,
+                row_key_column=row_key_column,
+            )
+            pipeline.enqueue_list_of_sqls(sqls)
+
+            sqls = predict_from_comparison_vectors_sqls_using_settings(
+                settings,
+                threshold_match_probability,
+                threshold_match_weight,
+                sql_infinity_expression=self._linker._infinity_expression,
+            )
+            pipeline.enqueue_list_of_sqls(sqls)
+
+            predictions = db_api.sql_pipeline_to_splink_dataframe(
+                pipeline, use_cache=False
+            )
+
+            # Write outside of output_path and then move into place, so an
+            # interrupted write does not leave a chunk which looks complete
+            in_progress_path = os.path.join(in_progress_dir, os.path.basename(path))
+            predictions.to_parquet(in_progress_path, overwrite=True)
+            os.replace(in_progress_path, path)
+            predictions.drop_table_from_database_and_remove_from_cache()
+
+            logger.info(f"Wrote chunk {path} in {time.time() - start_time:.2f} seconds")
+
+        self._linker._predict_warning()
+
+        [b.drop_materialised_id_pairs_dataframe() for b in exploding_br_with_id_tables]
+        [b.drop_materialised_skewed_keys_dataframe() for b in adaptive_salted_brs]
+        shutil.rmtree(in_progress_dir, ignore_errors=True)
+
+        return paths
+
+    def predict_incremental(
+        self,
+        records: AcceptableInputTableType | str,
+        predictions: SplinkDataFrame,
+        deleted_records: AcceptableInputTableType | str | None = None,
+        threshold_match_probability: float = None,
+        threshold_match_weight: float = None,
+    ) -> SplinkDataFrame:
+        """Update existing predictions for new, updated and deleted records,
+        scoring only the pairs involving the new and updated records.
+
+        The linker's records must be as they were when `predictions` were
+        computed.  `records` contains new records, and the new versions of any
+        updated records, with the same columns as the input tables.  Afterwards,
+        the linker's records and term frequencies are updated by the changes, so
+        further changes can be applied to the returned predictions.
+
+        The existing pairs of the updated and deleted records are removed from
+        `predictions`.  The new and updated records are blocked against the
+        unchanged records and each other using
+        `blocking_rules_to_generate_predictions`, and the resulting pairs are
+        scored and added.  Term frequencies are updated by the values of the
+        changed records rather than recomputed.  Existing pairs are not rescored,
+        so their term frequency adjustments are those of the original data.
+
+        Blocking rules which rank or explode records (sorted neighbourhood and
+        array-based rules) are not supported.
+
+        Args:
+            records (DataFrame | str): The new and updated records, or the name
+                of a table containing them
+            predictions (SplinkDataFrame): The existing predictions, for instance
+                the output of `linker.inference.predict()`
+            deleted_records (DataFrame | str, optional): A table of the unique ids
+                (and source datasets, if linking) of deleted records. Defaults to
+                None.
+            threshold_match_probability (float, optional): If specified,
+                filter the new pairs to include only those with a
+                match_probability above this threshold. Defaults to None.
+            threshold_match_weight (float, optional): If specified,
+                filter the new pairs to include only those with a
+                match_weight above this threshold. Defaults to None.
+
+        Examples:
+            ```py
+            df_predict = linker.inference.predict(threshold_match_probability=0.9)
+            df_predict = linker.inference.predict_incremental(
+                df_changed, df_predict, threshold_match_probability=0.9
+            )
+            # The next day's changes
+            df_predict = linker.inference.predict_incremental(
+                df_changed_next_day, df_predict, threshold_match_probability=0.9
+            )
+            ```
+
+        Returns:
+            SplinkDataFrame: The updated predictions
+        """
+        db_api = self._linker._db_api
+        settings = self._linker._settings_obj
+        uid_cols = settings.column_info_settings.unique_id_input_columns
+        blocking_rules = settings._blocking_rules_to_generate_predictions
+
+        unsupported = [
+            br
+            for br in blocking_rules
+            if isinstance(br, (ExplodingBlockingRule, SortedNeighbourhoodBlockingRule))
+        ]
+        if unsupported:
+            raise ValueError(
+                "Incremental predictions are not supported for blocking rules "
+                "which rank or explode records: "
+                f"{', '.join(br.blocking_rule_sql for br in unsupported)}"
+            )
+
+        def to_splink_dataframe(table, templated_name):
+            if isinstance(table, str):
+                tablename = table
+            else:
+                tablename = f"{templated_name}_{ascii_uid(8)}"
+                self._linker.table_management.register_table(
+                    table, tablename, overwrite=True
+                )
+            return db_api.table_to_splink_dataframe(templated_name, tablename)
+
+        df_concat_with_tf = compute_df_concat_with_tf(self._linker, CTEPipeline())
+        blocking_key_columns = available_blocking_key_columns(
+            self._linker, df_concat_with_tf
+        )
+        records_df = to_splink_dataframe(records, "__splink__df_incremental_input")
+
+        # Add the same hidden columns as __splink__df_concat_with_tf has
+        pipeline = CTEPipeline()
+        sql = vertically_concatenate_sql(
+            {"__splink__df_incremental_input": records_df},
+            salting_required=settings.salting_required,
+            source_dataset_input_column=settings.column_info_settings.source_dataset_input_column,
+            blocking_key_columns=blocking_key_columns,
+        )
+        pipeline.enqueue_sql(sql, "__splink__df_incremental_records")
+        records_concat = db_api.sql_pipeline_to_splink_dataframe(pipeline)
+
+        tf_cols = settings._term_frequency_columns
+        tf_names = {col.unquote().tf_name for col in tf_cols}
+        node_columns = [
+            col
+            for col in df_concat_with_tf.columns
+            if col.unquote().name not in tf_names | {ROW_KEY_COLUMN_NAME}
+        ]
+        record_column_names = {col.unquote().name for col in records_concat.columns}
+        missing = [
+            col.unquote().name
+            for col in node_columns
+            if col.unquote().name not in record_column_names
+        ]
+        if missing:
+            records_concat.drop_table_from_database_and_remove_from_cache()
+            raise ValueError(
+                f"`records` is missing the columns {missing} of the input tables"
+            )
+
+        retracted_tables = [records_concat]
+        if deleted_records is not None:
+            retracted_tables.append(
+                to_splink_dataframe(deleted_records, "__splink__df_deleted_records")
+            )
+        pipeline = CTEPipeline(retracted_tables)
+        sql = retracted_ids_sql(uid_cols, [t.templated_name for t in retracted_tables])
+        pipeline.enqueue_sql(sql, RETRACTED_IDS_TABLENAME)
+        retracted_ids = db_api.sql_pipeline_to_splink_dataframe(pipeline)
+
+        cache = self._linker._intermediate_table_cache
+        tf_tables = []
+        for tf_col in tf_cols:
+            pipeline = CTEPipeline([df_concat_with_tf, records_concat, retracted_ids])
+            tf_tablename = colname_to_tf_tablename(tf_col)
+            if tf_tablename in cache:
+                pipeline.append_input_dataframe(cache.get_with_logging(tf_tablename))
+            else:
+                sql = f"""
+                select distinct {tf_col.name}, {tf_col.tf_name}
+                from __splink__df_concat_with_tf
+                where {tf_col.name} is not null
+                """
+                pipeline.enqueue_sql(sql, tf_tablename)
+            sql = updated_term_frequencies_sql(tf_col, uid_cols, tf_tablename)
+            pipeline.enqueue_sql(sql, incremental_tf_tablename(tf_col))
+            tf_tables.append(db_api.sql_pipeline_to_splink_dataframe(pipeline))
+
+        # The unchanged and changed records are each used by several pipelines, so
+        # are materialised once
+        input_dataframes = [df_concat_with_tf, records_concat, retracted_ids]
+        input_dataframes.extend(tf_tables)
+        nodes_with_tf = []
+        for sql in incremental_nodes_sqls(node_columns, tf_cols, uid_cols):
+            pipeline = CTEPipeline(input_dataframes)
+            pipeline.enqueue_sql(**sql)
+            nodes_with_tf.append(db_api.sql_pipeline_to_splink_dataframe(pipeline))
+
+        # The updated records, which replace the linker's once the predictions
+        # have been updated, so that the next changes are blocked against, and
+        # scored with, the current data
+        pipeline = CTEPipeline(nodes_with_tf)
+        sql = f"""
+        select *, {_row_key_sql(self._linker)} as {ROW_KEY_COLUMN_NAME}
+        from (
+            select * from __splink__df_incremental_unchanged_with_tf
+            UNION ALL
+            select * from __splink__df_incremental_records_with_tf
+        ) as nodes
+        """
+        pipeline.enqueue_sql(sql, "__splink__df_incremental_concat_with_tf")
+        updated_nodes = db_api.sql_pipeline_to_splink_dataframe(pipeline)
+        _check_row_key_is_unique(self._linker, updated_nodes)
+
+        adaptive_salted_brs = materialise_skewed_key_tables(
+            blocking_rules=blocking_rules,
+            db_api=db_api,
+            splink_df_dict=self._linker._input_tables_dict,
+            source_dataset_input_column=settings.column_info_settings.source_dataset_input_column,
+            nodes_concat=updated_nodes,
+        )
+
+        # Each pair involving a changed record is generated once: either the
+        # changed record is on the left, or an unchanged record is on the left
+        # and a changed record is on the right
+        blocked_pairs = []
+        for input_tablename_l, input_tablename_r in [
+            (
+                "__splink__df_incremental_records_with_tf",
+                "__splink__df_incremental_concat_with_tf",
+            ),
+            (
+                "__splink__df_incremental_unchanged_with_tf",
+                "__splink__df_incremental_records_with_tf",
+            ),
+        ]:
+            pipeline = CTEPipeline(nodes_with_tf + [updated_nodes])
+            sqls = block_using_rules_sqls(
+                input_tablename_l=input_tablename_l,
+                input_tablename_r=input_tablename_r,
+                blocking_rules=blocking_rules,
+                link_type=settings._link_type,
+                source_dataset_input_column=settings.column_info_settings.source_dataset_input_column,
+                unique_id_input_column=settings.column_info_settings.unique_id_input_column,
+                blocking_key_columns=blocking_key_columns,
+            )
+            pipeline.enqueue_list_of_sqls(sqls)
+            pipeline.enqueue_sql(
+                "select * from __splink__blocked_id_pairs",
+                f"__splink__blocked_id_pairs_incremental_{len(blocked_pairs)}",
+            )
+            blocked_pairs.append(db_api.sql_pipeline_to_splink_dataframe(pipeline))
+
+        [b.drop_materialised_skewed_keys_dataframe() for b in adaptive_salted_brs]
+
+        pipeline = CTEPipeline([updated_nodes] + blocked_pairs)
+        sql = " UNION ALL ".join(
+            f"select * from {b.templated_name}" for b in blocked_pairs
+        )
+        pipeline.enqueue_sql(sql, "__splink__blocked_id_pairs")
+
+        sqls = compute_comparison_vector_values_from_id_pairs_sqls(
+            settings._columns_to_select_for_blocking,
+            settings._columns_to_select_for_comparison_vector_values,
+            input_tablename_l="__splink__df_incremental_concat_with_tf",
+            input_tablename_r="__splink__df_incremental_concat_with_tf",
+            source_dataset_input_column=settings.column_info_settings.source_dataset_input_column,
+            unique_id_input_column=settings.column_info_settings.unique_id_input_column,
+        )
+        pipeline.enqueue_list_of_sqls(sqls)
+
+        sqls = predict_from_comparison_vectors_sqls_using_settings(
+            settings,
+            threshold_match_probability,
+            threshold_match_weight,
+            sql_infinity_expression=self._linker._infinity_expression,
+        )
+        sqls[-1]["output_table_name"] = "__splink__df_predict_incremental"
+        pipeline.enqueue_list_of_sqls(sqls)
+        new_predictions = db_api.sql_pipeline_to_splink_dataframe(pipeline)
+
+        intermediate_tables = [records_concat, retracted_ids, new_predictions]
+        intermediate_tables.extend(nodes_with_tf)
+        intermediate_tables.extend(blocked_pairs)
+
+        existing_names = [c.unquote().name for c in predictions.columns]
+        new_names = [c.unquote().name for c in new_predictions.columns]
+        if existing_names != new_names:
+            [
+                t.drop_table_from_database_and_remove_from_cache()
+                for t in intermediate_tables + tf_tables + [updated_nodes]
+            ]
+            raise ValueError(
+                "The columns of `predictions` do not match those of new predictions. "
+                "Were they computed with different settings? "
+                f"Expected {new_names}, got {existing_names}"
+            )
+
+        pipeline = CTEPipeline([retracted_ids, new_predictions])
+        sql = merge_predictions_sql(
+            predictions.columns,
+            uid_cols,
+            predictions.physical_name,
+            "__splink__df_predict_incremental",
+        )
+        pipeline.enqueue_sql(sql, "__splink__df_predict")
+        merged_predictions = db_api.sql_pipeline_to_splink_dataframe(pipeline)
+
+        if "__splink__df_concat" in cache:
+            del cache["__splink__df_concat"]
+        updated_nodes.templated_name = "__splink__df_concat_with_tf"
+        cache["__splink__df_concat_with_tf"] = updated_nodes
+        for tf_col, tf_table in zip(tf_cols, tf_tables):
+            tf_table.templated_name = colname_to_tf_tablename(tf_col)
+            cache[tf_table.templated_name] = tf_table
+
+        [
+            t.drop_table_from_database_and_remove_from_cache()
+            for t in intermediate_tables
+        ]
+
+        self._linker._predict_warning()
+        return merged_predictions
+
     def find_matches_to_new_records(
         self,
         records_or_tablename: AcceptableInputTableType | str,
@@ -612,3 +1177,31 @@ class LinkerInference:
         )
 
         return predictions
+
+
+def _check_or_write_predict_manifest(output_path: str, manifest: dict[str, Any]):
+    """Write `manifest` to `output_path`, or if a previous run of
+    predict_to_parquet wrote one there, check that it is the same so the run can
+    be resumed"""
+    manifest_path = os.path.join(output_path, "_manifest.json")
+    if os.path.exists(manifest_path):
+        with open(manifest_path) as f:
+            existing_manifest = json.load(f)
+        changed = [k for k, v in manifest.items() if existing_manifest.get(k) != v]
+        if changed:
+            raise ValueError(
+                f"Cannot resume writing predictions to '{output_path}', because "
+                f"the {', '.join(changed)} differ from those of the run which "
+                "wrote them. Use a new output_path, or delete the existing one."
+            )
+        return
+
+    if glob.glob(os.path.join(output_path, "**", "*.parquet"), recursive=True):
+        raise ValueError(
+            f"'{output_path}' contains predictions without a manifest, so it is "
+            "not possible to check they were written by the same model and "
+            "data. Use a new output_path, or delete the existing one."
+        )
+    os.makedirs(output_path, exist_ok=True)
+    with open(manifest_path, "w") as f:
+        json.dump(manifest, f, indent=4)
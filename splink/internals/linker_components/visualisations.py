@@ -8,26 +8,19 @@ from splink.internals.charts import (
     parameter_estimate_comparisons,
     waterfall_chart,
 )
-from splink.internals.cluster_studio import (
-    SamplingMethods,
-    render_splink_cluster_studio_html,
-)
 from splink.internals.comparison_vector_distribution import (
     comparison_vector_distribution_sql,
 )
 from splink.internals.match_weights_histogram import histogram_data
 from splink.internals.misc import ensure_is_list
 from splink.internals.pipeline import CTEPipeline
-from splink.internals.splink_comparison_viewer import (
-    comparison_viewer_table_sqls,
-    render_splink_comparison_viewer_html,
-)
 from splink.internals.splink_dataframe import SplinkDataFrame
 from splink.internals.term_frequencies import (
     tf_adjustment_chart,
 )
 
 if TYPE_CHECKING:
+    from splink.internals.cluster_studio import SamplingMethods
     from splink.internals.linker import Linker
 
 
@@ -317,6 +310,12 @@ class LinkerVisualisations:
             ```
 
         """
+        # Dashboards are imported on first use, to keep `import splink` fast
+        from splink.internals.splink_comparison_viewer import (
+            comparison_viewer_table_sqls,
+            render_splink_comparison_viewer_html,
+        )
+
         self._linker._raise_error_if_necessary_waterfall_columns_not_computed()
         pipeline = CTEPipeline([df_predict])
         sql = comparison_vector_distribution_sql(self._linker)
@@ -392,6 +391,8 @@ class LinkerVisualisations:
             IFrame(src="./cluster_studio.html", width="100%", height=1200)
             ```
         """
+        from splink.internals.cluster_studio import render_splink_cluster_studio_html
+
         self._linker._raise_error_if_necessary_waterfall_columns_not_computed()
 
         rendered = render_splink_cluster_studio_html(
@@ -50,7 +50,7 @@ def estimate_m_from_pairwise_labels(linker: "Linker", table_name: str) -> None:
 
     df_params = linker._db_api.sql_pipeline_to_splink_dataframe(pipeline)
 
-    param_records = df_params.as_pandas_dataframe()
+    param_records = df_params._as_arrow_or_pandas()
     param_records = compute_proportions_for_new_parameters(param_records)
 
     m_u_records = [
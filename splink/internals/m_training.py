@@ -81,7 +81,7 @@ def estimate_m_values_from_label_column(linker: "Linker", label_colname: str) ->
 
     df_params = training_linker._db_api.sql_pipeline_to_splink_dataframe(pipeline)
 
-    param_records = df_params.as_pandas_dataframe()
+    param_records = df_params._as_arrow_or_pandas()
     param_records = compute_proportions_for_new_parameters(param_records)
 
     m_u_records = [
@@ -0,0 +1,193 @@
+from __future__ import annotations
+
+import glob
+import hashlib
+import json
+import logging
+import os
+import re
+import shutil
+import time
+from pathlib import Path
+from typing import TYPE_CHECKING, List, Optional
+
+import sqlglot
+from sqlglot import exp
+from sqlglot.errors import ParseError
+
+from splink.internals.misc import ascii_uid
+
+logger = logging.getLogger(__name__)
+
+if TYPE_CHECKING:
+    from splink.internals.database_api import DatabaseAPISubClass
+    from splink.internals.splink_dataframe import SplinkDataFrame
+
+
+class PersistentTableCache:
+    """An on-disk cache of intermediate Splink tables which survives across sessions.
+
+    Tables are keyed on a deterministic fingerprint of the SQL used to create them,
+    in which every table the SQL reads from is replaced by a fingerprint of that
+    table:
+
+    - tables created by Splink while the cache is enabled are fingerprinted by
+        their own key, so fingerprints propagate down the lineage of a pipeline
+    - any other table (e.g. input data) is fingerprinted by its schema, row count
+        and an order-independent hash of its content
+    - files read directly (e.g. `read_parquet('data.parquet')`) are fingerprinted
+        by their path, size and modification time
+
+    Only tables whose templated name matches one of `tables_to_persist` are
+    written to disk, as parquet, in `cache_dir`.
+    """
+
+    default_tables_to_persist = [
+        r"__splink__df_concat_with_tf",
+        r"__splink__df_tf_.+",
+        r"__splink__blocked_id_pairs",
+    ]
+
+    def __init__(
+        self, cache_dir: str | Path, tables_to_persist: Optional[List[str]] = None
+    ):
+        self.cache_dir = Path(cache_dir)
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+
+        if tables_to_persist is None:
+            tables_to_persist = self.default_tables_to_persist
+        self.tables_to_persist = tables_to_persist
+
+        # physical name -> fingerprint, for tables already fingerprinted this session
+        self._fingerprints: dict[str, str] = {}
+
+    def should_persist(self, templated_name: str) -> bool:
+        regex = r"|".join(self.tables_to_persist)
+        return re.fullmatch(regex, templated_name) is not None
+
+    def record_fingerprint(self, physical_name: str, fingerprint: str) -> None:
+        self._fingerprints[physical_name] = fingerprint
+
+    def forget_fingerprint(self, physical_name: str) -> None:
+        self._fingerprints.pop(physical_name, None)
+
+    def key_for_sql(self, sql: str, db_api: DatabaseAPISubClass) -> Optional[str]:
+        """Compute the deterministic cache key for a table created by `sql`.
+
+        Returns None if the SQL cannot be parsed, in which case the table is not
+        eligible for persistent caching.
+        """
+        dialect = db_api.sql_dialect.sqlglot_name
+        try:
+            tree = sqlglot.parse_one(sql, read=dialect)
+        except ParseError:
+            return None
+
+        cte_names = {cte.alias_or_name for cte in tree.find_all(exp.CTE)}
+        file_stamps = []
+
+        for table in list(tree.find_all(exp.Table)):
+            if isinstance(table.this, exp.Identifier):
+                if not table.db and table.name in cte_names:
+                    continue
+                table_name = ".".join(
+                    p for p in (table.catalog, table.db, table.name) if p
+                )
+                fingerprint = self._table_fingerprint(table_name, db_api)
+                table.set("this", exp.to_identifier(f"__fingerprint_{fingerprint}"))
+                table.set("db", None)
+                table.set("catalog", None)
+            else:
+                # Table functions such as read_parquet('path/*.parquet')
+                for literal in table.find_all(exp.Literal):
+                    if literal.is_string:
+                        file_stamps.extend(_file_stamps(literal.this))
+
+        normalised_sql = tree.sql(dialect=dialect)
+        to_hash = "\n".join([normalised_sql] + file_stamps).encode("utf-8")
+        return hashlib.sha256(to_hash).hexdigest()
+
+    def _table_fingerprint(self, table_name: str, db_api: DatabaseAPISubClass) -> str:
+        if table_name in self._fingerprints:
+            return self._fingerprints[table_name]
+
+        fingerprint = table_fingerprint(table_name, db_api)
+        logger.debug(f"Fingerprinted table {table_name} as {fingerprint}")
+        self._fingerprints[table_name] = fingerprint
+        return fingerprint
+
+    def _paths(self, templated_name: str, key: str) -> tuple[Path, Path]:
+        stem = f"{templated_name}_{key[:16]}"
+        return self.cache_dir / f"{stem}.parquet", self.cache_dir / f"{stem}.json"
+
+    def lookup(self, templated_name: str, key: str) -> Optional[str]:
+        """Return the path of the cached parquet file, if a complete one exists"""
+        data_path, marker_path = self._paths(templated_name, key)
+        if not marker_path.exists():
+            return None
+        with open(marker_path, encoding="utf-8") as f:
+            marker = json.load(f)
+        if marker.get("key") != key:
+            return None
+        return str(data_path)
+
+    def save(self, splink_dataframe: SplinkDataFrame, key: str) -> None:
+        templated_name = splink_dataframe.templated_name
+        data_path, marker_path = self._paths(templated_name, key)
+
+        splink_dataframe.to_parquet(str(data_path), overwrite=True)
+
+        # The marker is written last, so that a partially written parquet file
+        # (e.g. from an interrupted run) is never treated as a cache hit
+        marker = {
+            "key": key,
+            "templated_name": templated_name,
+            "created_at": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        }
+        with open(marker_path, "w", encoding="utf-8") as f:
+            json.dump(marker, f)
+        logger.debug(f"Saved {templated_name} to persistent cache at {data_path}")
+
+    def clear(self) -> None:
+        """Delete all files in the persistent cache directory"""
+        for path in self.cache_dir.glob("__splink__*"):
+            if path.is_dir():
+                # e.g. Spark writes parquet as a directory
+                shutil.rmtree(path)
+            else:
+                path.unlink()
+
+
+def table_fingerprint(table_name: str, db_api: DatabaseAPISubClass) -> str:
+    """A fingerprint of the schema, row count and an order-independent hash of the
+    content of `table_name`, which changes if the table's data changes"""
+    columns = db_api.table_to_splink_dataframe(table_name, table_name).columns
+    column_names = sorted(c.unquote().name for c in columns)
+
+    sql = db_api.sql_dialect.table_fingerprint_sql(table_name)
+    fingerprint_df = db_api._sql_to_splink_dataframe(
+        sql,
+        "__splink__table_fingerprint",
+        f"__splink__table_fingerprint_{ascii_uid(8)}",
+    )
+    stats = fingerprint_df.as_record_dict()[0]
+    fingerprint_df.drop_table_from_database_and_remove_from_cache(
+        force_non_splink_table=True
+    )
+
+    to_hash = json.dumps(
+        {
+            "columns": column_names,
+            "row_count": int(stats["row_count"]),
+            "content_hash": str(stats["content_hash"]),
+        }
+    ).encode("utf-8")
+    return hashlib.sha256(to_hash).hexdigest()[:16]
+
+
+def _file_stamps(path_pattern: str) -> list[str]:
+    stamps = []
+    for path in sorted(glob.glob(path_pattern)):
+        stat = os.stat(path)
+        stamps.append(f"{path}:{stat.st_size}:{stat.st_mtime_ns}")
+    return stamps
@@ -3,11 +3,11 @@ from __future__ import annotations
 import logging
 from typing import TYPE_CHECKING, List, Optional
 
-import sqlglot
 from sqlglot.errors import ParseError
 from sqlglot.expressions import Table
 
 from splink.internals.misc import ensure_is_list
+from splink.internals.sqlglot_cache import parse_one_cached
 
 from .splink_dataframe import SplinkDataFrame
 
@@ -25,7 +25,7 @@ class CTE:
     @property
     def _uses_tables(self):
         try:
-            tree = sqlglot.parse_one(self.sql, read=None)
+            tree = parse_one_cached(self.sql, copy=False)
         except ParseError:
             return ["Failure to parse SQL - tablenames not known"]
 
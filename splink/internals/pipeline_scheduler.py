@@ -0,0 +1,152 @@
+from __future__ import annotations
+
+import logging
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Dict, List, Optional
+
+from splink.internals.misc import ensure_is_list
+from splink.internals.pipeline import CTEPipeline
+from splink.internals.splink_dataframe import SplinkDataFrame
+
+logger = logging.getLogger(__name__)
+
+if TYPE_CHECKING:
+    from splink.internals.database_api import DatabaseAPISubClass
+
+
+@dataclass
+class _ScheduledPipeline:
+    name: str
+    pipeline: CTEPipeline
+    depends_on: List[str] = field(default_factory=list)
+    use_cache: bool = True
+
+
+class PipelineScheduler:
+    """Executes a set of SQL pipelines, some of which may depend on the outputs of
+    others, running pipelines whose dependencies are complete concurrently.
+
+    The output of each dependency is added to the dependent pipeline as an input
+    dataframe, so it can be referred to by its templated name.
+
+    The number of pipelines run at once is limited by the `max_concurrent_pipelines`
+    of the DatabaseAPI, unless overridden by `max_workers`.  With a limit of 1
+    pipelines are executed in the calling thread, in the order they were added.
+
+    Examples:
+        ```py
+        scheduler = PipelineScheduler(db_api)
+        scheduler.add_pipeline(pipeline_raw, name="raw")
+        scheduler.add_pipeline(pipeline_top_n, depends_on="raw")
+        scheduler.add_pipeline(pipeline_bottom_n, depends_on="raw")
+        results = scheduler.run()
+        ```
+    """
+
+    def __init__(self, db_api: DatabaseAPISubClass, max_workers: Optional[int] = None):
+        self.db_api = db_api
+        if max_workers is None:
+            max_workers = db_api.max_concurrent_pipelines
+        if db_api.debug_mode:
+            # Debug output would be interleaved
+            max_workers = 1
+        self.max_workers = max(1, max_workers)
+        self._scheduled: Dict[str, _ScheduledPipeline] = {}
+
+    def add_pipeline(
+        self,
+        pipeline: CTEPipeline,
+        name: Optional[str] = None,
+        depends_on: Optional[str | List[str]] = None,
+        use_cache: bool = True,
+    ) -> str:
+        """Add a pipeline to be executed.
+
+        Args:
+            pipeline (CTEPipeline): The pipeline
+            name (str, optional): Name used to refer to the pipeline in `depends_on`
+                and in the results of `run()`. Defaults to the output table name
+                of the pipeline.
+            depends_on (str | list[str], optional): Names of pipelines which must
+                be executed first.
+            use_cache (bool, optional): Passed to
+                `sql_pipeline_to_splink_dataframe`. Defaults to True.
+
+        Returns:
+            str: The name of the pipeline
+        """
+        if name is None:
+            name = pipeline.output_table_name
+        if name in self._scheduled:
+            raise ValueError(f"A pipeline named {name} has already been added")
+
+        depends_on = ensure_is_list(depends_on) if depends_on is not None else []
+        for dependency in depends_on:
+            if dependency not in self._scheduled:
+                raise ValueError(
+                    f"Pipeline {name} depends on {dependency}, which must be added "
+                    "before it"
+                )
+
+        self._scheduled[name] = _ScheduledPipeline(
+            name, pipeline, depends_on, use_cache
+        )
+        return name
+
+    def _execute(
+        self, scheduled: _ScheduledPipeline, results: Dict[str, SplinkDataFrame]
+    ) -> SplinkDataFrame:
+        for dependency in scheduled.depends_on:
+            scheduled.pipeline.append_input_dataframe(results[dependency])
+        return self.db_api.sql_pipeline_to_splink_dataframe(
+            scheduled.pipeline, use_cache=scheduled.use_cache
+        )
+
+    def _execute_in_worker(
+        self, scheduled: _ScheduledPipeline, results: Dict[str, SplinkDataFrame]
+    ) -> SplinkDataFrame:
+        with self.db_api._worker_thread_context():
+            return self._execute(scheduled, results)
+
+    def run(self) -> Dict[str, SplinkDataFrame]:
+        """Execute all pipelines, returning their outputs keyed by name"""
+        results: Dict[str, SplinkDataFrame] = {}
+
+        if self.max_workers == 1:
+            # Dependencies must be added first, so insertion order is a valid
+            # topological order
+            for name, scheduled in self._scheduled.items():
+                results[name] = self._execute(scheduled, results)
+            return results
+
+        pending = dict(self._scheduled)
+        running: Dict[Future[SplinkDataFrame], str] = {}
+
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            while pending or running:
+                ready = [
+                    s
+                    for s in pending.values()
+                    if all(d in results for d in s.depends_on)
+                ]
+                for scheduled in ready:
+                    del pending[scheduled.name]
+                    logger.debug(f"Scheduling pipeline {scheduled.name}")
+                    future = executor.submit(
+                        self._execute_in_worker, scheduled, results
+                    )
+                    running[future] = scheduled.name
+
+                done, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in done:
+                    name = running.pop(future)
+                    # Raises any exception from the worker, cancelling the rest
+                    try:
+                        results[name] = future.result()
+                    except Exception:
+                        for f in running:
+                            f.cancel()
+                        raise
+
+        return results
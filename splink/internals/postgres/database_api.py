@@ -1,10 +1,11 @@
 import logging
-from typing import Any, List, Union
+from contextlib import contextmanager
+from typing import Any, Iterator, List, Union
 
 import duckdb
 import pandas as pd
 from sqlalchemy import CursorResult, text
-from sqlalchemy.engine import Engine
+from sqlalchemy.engine import Connection, Engine
 
 from splink.internals.database_api import DatabaseAPI
 from splink.internals.dialects import (
@@ -21,6 +22,12 @@ logger = logging.getLogger(__name__)
 
 class PostgresAPI(DatabaseAPI[CursorResult[Any]]):
     sql_dialect = PostgresDialect()
+    # each query is executed on its own connection from the engine's pool
+    max_concurrent_pipelines = 4
+    # read tables into Arrow with DuckDB's postgres scanner (which uses binary
+    # COPY) rather than a cursor.  Faster for large tables, but starting DuckDB
+    # and installing its postgres extension has a fixed cost for each table
+    arrow_via_duckdb_scanner: bool = False
 
     def __init__(
         self,
@@ -54,13 +61,7 @@ class PostgresAPI(DatabaseAPI[CursorResult[Any]]):
         try:
             con.execute("INSTALL postgres;")
 
-            url = self._engine.url
-
-            pg_con_str = (
-                f"postgresql://{url.username}:{url.password}"
-                f"@{url.host}:{url.port}/{url.database}"
-            )
-
+            pg_con_str = self._duckdb_postgres_connection_string()
             con.execute(f"ATTACH '{pg_con_str}' AS pg_db (TYPE postgres);")
             con.register("temp_df", input)
             con.execute(
@@ -77,9 +78,24 @@ class PostgresAPI(DatabaseAPI[CursorResult[Any]]):
                 schema=self._db_schema,
             )
 
+    def _duckdb_postgres_connection_string(self) -> str:
+        url = self._engine.url
+        return (
+            f"postgresql://{url.username}:{url.password}"
+            f"@{url.host}:{url.port}/{url.database}"
+        )
+
     def table_to_splink_dataframe(self, templated_name, physical_name):
         return PostgresDataFrame(templated_name, physical_name, self)
 
+    def _cleanup_for_execute_sql(
+        self, table: CursorResult[Any], templated_name: str, physical_name: str
+    ) -> PostgresDataFrame:
+        output_df = self.table_to_splink_dataframe(templated_name, physical_name)
+        # CREATE TABLE AS reports the number of rows it created
+        output_df.metadata["rows_created"] = table.rowcount
+        return output_df
+
     def table_exists_in_database(self, table_name):
         sql = f"""
         SELECT table_name
@@ -90,10 +106,24 @@ class PostgresAPI(DatabaseAPI[CursorResult[Any]]):
         rec = self._execute_sql_against_backend(sql).mappings().all()
         return len(rec) > 0
 
+    @contextmanager
+    def _connection(self) -> Iterator[Connection]:
+        """A connection from the engine's pool, in a transaction which searches the
+        Splink schema first.
+
+        Each query may run on a different connection from the pool, so the
+        search_path is set for each transaction.  It is set with SET LOCAL, so
+        connections returned to the pool, which may be shared with other users
+        of the engine, are unchanged.
+        """
+        with self._engine.begin() as con:
+            con.execute(text(f"SET LOCAL search_path TO {self._search_path};"))
+            yield con
+
     def _execute_sql_against_backend(
         self, final_sql: str, templated_name: str = None, physical_name: str = None
     ) -> CursorResult[Any]:
-        with self._engine.begin() as con:
+        with self._connection() as con:
             res = con.execute(text(final_sql))
         return res
 
@@ -184,9 +214,8 @@ class PostgresAPI(DatabaseAPI[CursorResult[Any]]):
         other_schemas_to_search = ensure_is_list(other_schemas_to_search)
         # always search _db_schema first and public last
         schemas_to_search = [self._db_schema] + other_schemas_to_search + ["public"]
-        search_path = ",".join(schemas_to_search)
+        self._search_path = ",".join(schemas_to_search)
         sql = f"""
         CREATE SCHEMA IF NOT EXISTS {self._db_schema};
-        SET search_path TO {search_path};
         """
         self._execute_sql_against_backend(sql)
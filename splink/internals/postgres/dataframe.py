@@ -1,13 +1,24 @@
 from __future__ import annotations
 
 import logging
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any, Iterator, Optional
+
+import duckdb
+from sqlalchemy import text
 
 from splink.internals.input_column import InputColumn
-from splink.internals.splink_dataframe import SplinkDataFrame
+from splink.internals.splink_dataframe import (
+    BatchOutputType,
+    SplinkDataFrame,
+    _import_pyarrow,
+    _pyarrow_installed,
+)
 
 logger = logging.getLogger(__name__)
 if TYPE_CHECKING:
+    import pyarrow as pa
+    from pandas import DataFrame as PandasDataFrame
+
     from .database_api import PostgresAPI
 
 
@@ -19,17 +30,15 @@ class PostgresDataFrame(SplinkDataFrame):
         self._db_schema = db_api._db_schema
         self.physical_name = f"{self.physical_name}"
 
-    @property
-    def columns(self) -> list[InputColumn]:
+    def _fetch_column_types(self) -> dict[str, str]:
         sql = f"""
-        SELECT column_name
+        SELECT column_name, data_type
         FROM information_schema.columns
-        WHERE table_name = '{self.physical_name}';
+        WHERE table_name = '{self.physical_name}'
+        ORDER BY ordinal_position;
         """
         res = self.db_api._execute_sql_against_backend(sql).mappings().all()
-        cols = [r["column_name"] for r in res]
-
-        return [InputColumn(c, sql_dialect="postgres") for c in cols]
+        return {r["column_name"]: r["data_type"] for r in res}
 
     def validate(self):
         if not isinstance(self.physical_name, str):
@@ -69,3 +78,122 @@ class PostgresDataFrame(SplinkDataFrame):
         sql += ";"
         res = self.db_api._execute_sql_against_backend(sql).mappings().all()
         return [dict(r) for r in res]
+
+    def as_arrow(self, limit=None) -> pa.Table:
+        if self.db_api.arrow_via_duckdb_scanner:
+            return self._as_arrow_from_duckdb_scanner(limit)
+        return self._as_arrow_from_cursor(limit)
+
+    def _as_arrow_or_pandas(self) -> pa.Table | PandasDataFrame:
+        # Only used for small tables, e.g. of m and u counts, for which the cost
+        # of starting DuckDB and attaching the database outweighs any benefit
+        if not _pyarrow_installed():
+            return self.as_pandas_dataframe()
+        return self._as_arrow_from_cursor()
+
+    def _as_arrow_from_duckdb_scanner(self, limit=None) -> pa.Table:
+        # DuckDB's postgres scanner reads the table using binary COPY, and
+        # produces Arrow directly
+        con = duckdb.connect()
+        try:
+            con.execute("INSTALL postgres;")
+            pg_con_str = self.db_api._duckdb_postgres_connection_string()
+            con.execute(f"ATTACH '{pg_con_str}' AS pg_db (TYPE postgres, READ_ONLY);")
+            sql = f"SELECT * FROM pg_db.{self._db_schema}.{self.physical_name}"
+            if limit:
+                sql += f" LIMIT {limit}"
+            return con.sql(sql).arrow()
+        except duckdb.Error as e:
+            # e.g. the extension can't be installed, or the table is not in the
+            # splink schema
+            logger.debug(
+                f"Unable to read {self.physical_name} with DuckDB's postgres "
+                f"scanner, so reading it via a cursor: {e}"
+            )
+            return self._as_arrow_from_cursor(limit)
+        finally:
+            con.close()
+
+    def _as_arrow_from_cursor(self, limit=None) -> pa.Table:
+        pa = _import_pyarrow()
+        sql = f"""
+        SELECT *
+        FROM {self.physical_name}
+        """
+        if limit:
+            sql += f" LIMIT {limit}"
+        sql += ";"
+
+        res = self.db_api._execute_sql_against_backend(sql)
+        column_names = list(res.keys())
+        rows = res.fetchall()
+        # Build column by column, rather than creating a dict per row
+        if not rows:
+            return pa.table({c: pa.array([], pa.null()) for c in column_names})
+        arrays = [pa.array(values) for values in zip(*rows)]
+        return pa.Table.from_arrays(arrays, names=column_names)
+
+    def _iter_batches(
+        self, batch_size: int, output_type: BatchOutputType
+    ) -> Iterator[pa.RecordBatch | PandasDataFrame]:
+        sql = f"""
+        SELECT *
+        FROM {self.physical_name};
+        """
+        # stream_results uses a server-side cursor, so rows are sent by the
+        # database as they are fetched rather than all at once
+        with self.db_api._connection() as con:
+            res = con.execution_options(
+                stream_results=True, max_row_buffer=batch_size
+            ).execute(text(sql))
+            column_names = list(res.keys())
+            row_batches = (
+                [tuple(r) for r in rows] for rows in res.partitions(batch_size)
+            )
+            yield from self._batches_from_rows(column_names, row_batches, output_type)
+
+    def _arrow_types(self) -> dict[str, pa.DataType]:
+        pa = _import_pyarrow()
+        postgres_to_arrow_types = {
+            "smallint": pa.int16(),
+            "integer": pa.int32(),
+            "bigint": pa.int64(),
+            "real": pa.float32(),
+            "double precision": pa.float64(),
+            "boolean": pa.bool_(),
+            "text": pa.string(),
+            "character varying": pa.string(),
+            "character": pa.string(),
+            "date": pa.date32(),
+            "timestamp without time zone": pa.timestamp("us"),
+            "timestamp with time zone": pa.timestamp("us", tz="UTC"),
+        }
+        return {
+            name: postgres_to_arrow_types[data_type]
+            for name, data_type in self.column_types.items()
+            if data_type in postgres_to_arrow_types
+        }
+
+    def _first_non_null_value(self, column_name: str) -> Any:
+        column = InputColumn(
+            column_name, sql_dialect=self.db_api.sql_dialect.sqlglot_name
+        ).name
+        sql = f"""
+        SELECT {column}
+        FROM {self.physical_name}
+        WHERE {column} IS NOT NULL
+        LIMIT 1;
+        """
+        row = self.db_api._execute_sql_against_backend(sql).fetchone()
+        return None if row is None else row[0]
+
+    def _row_count(self) -> int:
+        sql = f"SELECT count(*) AS row_count FROM {self.physical_name};"
+        res = self.db_api._execute_sql_against_backend(sql).mappings().all()
+        return res[0]["row_count"]
+
+    def _stored_size(self) -> tuple[Optional[int], Optional[int]]:
+        sql = f"SELECT pg_total_relation_size('{self.physical_name}') AS bytes;"
+        res = self.db_api._execute_sql_against_backend(sql).mappings().all()
+        # Recorded from the result of the CREATE TABLE AS, for tables Splink created
+        return self.metadata.get("rows_created"), res[0]["bytes"]
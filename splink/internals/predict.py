@@ -2,6 +2,7 @@ from __future__ import annotations
 
 # This is otherwise known as the expectation step of the EM algorithm.
 import logging
+import math
 from typing import List
 
 from splink.internals.comparison import Comparison
@@ -12,6 +13,9 @@ from .settings import CoreModelSettings, Settings
 
 logger = logging.getLogger(__name__)
 
+# The cross product of comparison levels is enumerated in full, so cap its size
+MAX_AGREEMENT_PATTERNS = 100_000
+
 
 def predict_from_comparison_vectors_sqls_using_settings(
     settings_obj: Settings,
@@ -19,9 +23,20 @@ def predict_from_comparison_vectors_sqls_using_settings(
     threshold_match_weight: float = None,
     include_clerical_match_score: bool = False,
     sql_infinity_expression: str = "'infinity'",
+    use_agreement_pattern_lookup: bool = False,
+    log2_weights: bool = False,
+    top_k_per_record: int = None,
+    top_k_per_record_side: str = "l",
 ) -> list[dict[str, str]]:
-    return predict_from_comparison_vectors_sqls(
-        unique_id_input_columns=settings_obj.column_info_settings.unique_id_input_columns,
+    unique_id_input_columns = settings_obj.column_info_settings.unique_id_input_columns
+    if top_k_per_record is not None:
+        # Validate before any sql is generated
+        top_k_sqls = top_k_per_record_sqls(
+            unique_id_input_columns, top_k_per_record, top_k_per_record_side
+        )
+
+    sqls = predict_from_comparison_vectors_sqls(
+        unique_id_input_columns=unique_id_input_columns,
         core_model_settings=settings_obj.core_model_settings,
         sql_dialect=settings_obj._sql_dialect,
         threshold_match_probability=threshold_match_probability,
@@ -33,8 +48,18 @@ def predict_from_comparison_vectors_sqls_using_settings(
         needs_matchkey_column=settings_obj._needs_matchkey_column,
         include_clerical_match_score=include_clerical_match_score,
         sql_infinity_expression=sql_infinity_expression,
+        use_agreement_pattern_lookup=use_agreement_pattern_lookup,
+        log2_weights=log2_weights,
     )
 
+    if top_k_per_record is not None:
+        # The ranked output keeps the __splink__df_predict name, which backends
+        # treat specially
+        sqls[-1]["output_table_name"] = "__splink__df_predict_all_candidates"
+        sqls.extend(top_k_sqls)
+
+    return sqls
+
 
 def predict_from_comparison_vectors_sqls(
     unique_id_input_columns: List[InputColumn],
@@ -50,7 +75,25 @@ def predict_from_comparison_vectors_sqls(
     needs_matchkey_column: bool = False,
     include_clerical_match_score: bool = False,
     sql_infinity_expression: str = "'infinity'",
+    use_agreement_pattern_lookup: bool = False,
+    log2_weights: bool = False,
 ) -> list[dict[str, str]]:
+    if use_agreement_pattern_lookup:
+        return _predict_from_agreement_pattern_lookup_sqls(
+            unique_id_input_columns=unique_id_input_columns,
+            core_model_settings=core_model_settings,
+            threshold_match_probability=threshold_match_probability,
+            threshold_match_weight=threshold_match_weight,
+            retain_matching_columns=retain_matching_columns,
+            retain_intermediate_calculation_columns=retain_intermediate_calculation_columns,
+            training_mode=training_mode,
+            additional_columns_to_retain=additional_columns_to_retain,
+            needs_matchkey_column=needs_matchkey_column,
+            include_clerical_match_score=include_clerical_match_score,
+            sql_infinity_expression=sql_infinity_expression,
+            log2_weights=log2_weights,
+        )
+
     sqls = []
 
     select_cols = Settings.columns_to_select_for_bayes_factor_parts(
@@ -60,6 +103,7 @@ def predict_from_comparison_vectors_sqls(
         retain_intermediate_calculation_columns=retain_intermediate_calculation_columns,
         additional_columns_to_retain=additional_columns_to_retain,
         needs_matchkey_column=needs_matchkey_column,
+        log2_weights=log2_weights,
     )
     select_cols_expr = ",".join(select_cols)
 
@@ -89,31 +133,66 @@ def predict_from_comparison_vectors_sqls(
         needs_matchkey_column=needs_matchkey_column,
     )
     select_cols_expr = ",".join(select_cols)
+    prior = core_model_settings.probability_two_random_records_match
+
+    if log2_weights:
+        weight_terms = []
+        for cc in core_model_settings.comparisons:
+            weight_terms.extend(cc._match_weight_columns_to_sum)
+        match_weight_expr = _sum_prior_and_log2_weights(
+            prior, weight_terms, sql_infinity_expression
+        )
+
+        sql = f"""
+        select
+        {match_weight_expr} as match_weight,
+        {select_cols_expr} {clerical_match_score}
+        from __splink__df_match_weight_parts
+        """
+
+        sql_info = {
+            "sql": sql,
+            "output_table_name": "__splink__df_match_weights",
+        }
+        sqls.append(sql_info)
+
+        threshold_expr = _threshold_expr(
+            "match_weight", threshold_match_probability, threshold_match_weight
+        )
+
+        sql = f"""
+        select
+        match_weight,
+        {_match_probability_from_match_weight_sql("match_weight")}
+            as match_probability,
+        {select_cols_expr} {clerical_match_score}
+        from __splink__df_match_weights
+        {threshold_expr}
+        """
+
+        sql_info = {
+            "sql": sql,
+            "output_table_name": "__splink__df_predict",
+        }
+        sqls.append(sql_info)
+
+        return sqls
+
     bf_terms = []
     for cc in core_model_settings.comparisons:
         bf_terms.extend(cc._match_weight_columns_to_multiply)
 
-    prior = core_model_settings.probability_two_random_records_match
     bayes_factor_expr, match_prob_expr = _combine_prior_and_bfs(
         prior,
         bf_terms,
         sql_infinity_expression,
     )
 
-    # In case user provided both, take the minimum of the two thresholds
-    if threshold_match_probability is not None:
-        thres_prob_as_weight = prob_to_match_weight(threshold_match_probability)
-    else:
-        thres_prob_as_weight = None
-    if threshold_match_probability is not None or threshold_match_weight is not None:
-        thresholds = [
-            thres_prob_as_weight,
-            threshold_match_weight,
-        ]
-        threshold = max([t for t in thresholds if t is not None])
-        threshold_expr = f" where log2({bayes_factor_expr}) >= {threshold} "
-    else:
-        threshold_expr = ""
+    threshold_expr = _threshold_expr(
+        f"log2({bayes_factor_expr})",
+        threshold_match_probability,
+        threshold_match_weight,
+    )
 
     sql = f"""
     select
@@ -133,6 +212,320 @@ def predict_from_comparison_vectors_sqls(
     return sqls
 
 
+def agreement_pattern_lookup_sqls(
+    comparisons: List[Comparison],
+    probability_two_random_records_match: float,
+    sql_infinity_expression: str = "'infinity'",
+    log2_weights: bool = False,
+) -> list[dict[str, str]]:
+    """Score every possible agreement pattern of the model.
+
+    Without term frequency adjustments the match weight of a comparison depends
+    only on its gamma values, so the cross product of each comparison's levels is
+    a small table that can be joined to the comparison vectors in place of
+    evaluating the Bayes factor expressions row by row.
+    """
+    n_patterns = math.prod(len(cc.comparison_levels) for cc in comparisons)
+    if n_patterns > MAX_AGREEMENT_PATTERNS:
+        raise ValueError(
+            f"The model has {n_patterns:,} possible agreement patterns, more than "
+            f"the {MAX_AGREEMENT_PATTERNS:,} that can be scored with a lookup table"
+        )
+
+    sqls = []
+
+    level_tables = []
+    select_cols = []
+    for i, cc in enumerate(comparisons):
+        if cc._has_tf_adjustments:
+            raise ValueError(
+                f"Comparison '{cc.output_column_name}' has term frequency "
+                "adjustments, so its match weights cannot be looked up from "
+                "the agreement pattern alone"
+            )
+        rows = []
+        for cl in cc.comparison_levels:
+            bayes_factor = (
+                cl._bayes_factor if cl._bayes_factor != math.inf else "'Infinity'"
+            )
+            row = (
+                f"select {cl.comparison_vector_value} as {cc._gamma_column_name}, "
+                f"cast({bayes_factor} as float8) as {cc._bf_column_name}"
+            )
+            if log2_weights:
+                row += (
+                    f", {cl._log2_bayes_factor_sql_literal} "
+                    f"as {cc._log2_bf_column_name}"
+                )
+            rows.append(row)
+        level_tables.append(f"({' union all '.join(rows)}) as l_{i}")
+        select_cols.append(f"l_{i}.{cc._gamma_column_name}")
+        select_cols.append(f"l_{i}.{cc._bf_column_name}")
+        if log2_weights:
+            select_cols.append(f"l_{i}.{cc._log2_bf_column_name}")
+
+    select_cols_expr = ", ".join(select_cols)
+    from_expr = " cross join ".join(level_tables)
+
+    sql = f"""
+    select {select_cols_expr}
+    from {from_expr}
+    """
+
+    sql_info = {
+        "sql": sql,
+        "output_table_name": "__splink__agreement_pattern_bayes_factors",
+    }
+    sqls.append(sql_info)
+
+    if log2_weights:
+        match_weight_expr = _sum_prior_and_log2_weights(
+            probability_two_random_records_match,
+            [cc._log2_bf_column_name for cc in comparisons],
+            sql_infinity_expression,
+        )
+
+        sql = f"""
+        select {match_weight_expr} as match_weight, *
+        from __splink__agreement_pattern_bayes_factors
+        """
+
+        sql_info = {
+            "sql": sql,
+            "output_table_name": "__splink__agreement_pattern_match_weights",
+        }
+        sqls.append(sql_info)
+
+        sql = f"""
+        select
+        {_match_probability_from_match_weight_sql("match_weight")}
+            as match_probability,
+        *
+        from __splink__agreement_pattern_match_weights
+        """
+
+        sql_info = {
+            "sql": sql,
+            "output_table_name": "__splink__agreement_pattern_lookup",
+        }
+        sqls.append(sql_info)
+
+        return sqls
+
+    bf_terms = [cc._bf_column_name for cc in comparisons]
+    bayes_factor_expr, match_prob_expr = _combine_prior_and_bfs(
+        probability_two_random_records_match,
+        bf_terms,
+        sql_infinity_expression,
+    )
+
+    sql = f"""
+    select
+    log2({bayes_factor_expr}) as match_weight,
+    {match_prob_expr} as match_probability,
+    *
+    from __splink__agreement_pattern_bayes_factors
+    """
+
+    sql_info = {
+        "sql": sql,
+        "output_table_name": "__splink__agreement_pattern_lookup",
+    }
+    sqls.append(sql_info)
+
+    return sqls
+
+
+def _predict_from_agreement_pattern_lookup_sqls(
+    unique_id_input_columns: List[InputColumn],
+    core_model_settings: CoreModelSettings,
+    threshold_match_probability: float = None,
+    threshold_match_weight: float = None,
+    retain_matching_columns: bool = False,
+    retain_intermediate_calculation_columns: bool = False,
+    training_mode: bool = False,
+    additional_columns_to_retain: List[InputColumn] = [],
+    needs_matchkey_column: bool = False,
+    include_clerical_match_score: bool = False,
+    sql_infinity_expression: str = "'infinity'",
+    log2_weights: bool = False,
+) -> list[dict[str, str]]:
+    comparisons = core_model_settings.comparisons
+
+    sqls = agreement_pattern_lookup_sqls(
+        comparisons,
+        core_model_settings.probability_two_random_records_match,
+        sql_infinity_expression,
+        log2_weights,
+    )
+
+    bf_cols_expr = ", ".join(f"p.{cc._bf_column_name}" for cc in comparisons)
+    join_condition = " and ".join(
+        f"cv.{cc._gamma_column_name} = p.{cc._gamma_column_name}" for cc in comparisons
+    )
+
+    sql = f"""
+    select cv.*, {bf_cols_expr}, p.match_weight, p.match_probability
+    from __splink__df_comparison_vectors as cv
+    left join __splink__agreement_pattern_lookup as p
+    on {join_condition}
+    """
+
+    sql_info = {
+        "sql": sql,
+        "output_table_name": "__splink__df_match_weight_parts",
+    }
+    sqls.append(sql_info)
+
+    select_cols = Settings.columns_to_select_for_predict(
+        unique_id_input_columns=unique_id_input_columns,
+        comparisons=comparisons,
+        retain_matching_columns=retain_matching_columns,
+        retain_intermediate_calculation_columns=retain_intermediate_calculation_columns,
+        training_mode=training_mode,
+        additional_columns_to_retain=additional_columns_to_retain,
+        needs_matchkey_column=needs_matchkey_column,
+    )
+    select_cols_expr = ",".join(select_cols)
+
+    if include_clerical_match_score:
+        clerical_match_score = ", clerical_match_score"
+    else:
+        clerical_match_score = ""
+
+    threshold_expr = _threshold_expr(
+        "match_weight", threshold_match_probability, threshold_match_weight
+    )
+
+    sql = f"""
+    select
+    match_weight,
+    match_probability,
+    {select_cols_expr} {clerical_match_score}
+    from __splink__df_match_weight_parts
+    {threshold_expr}
+    """
+
+    sql_info = {
+        "sql": sql,
+        "output_table_name": "__splink__df_predict",
+    }
+    sqls.append(sql_info)
+
+    return sqls
+
+
+def top_k_per_record_sqls(
+    unique_id_input_columns: List[InputColumn],
+    top_k: int,
+    side: str = "l",
+    input_tablename: str = "__splink__df_predict_all_candidates",
+) -> list[dict[str, str]]:
+    """Keep only the top_k highest scoring candidates of each record.
+
+    Candidates are ranked per left record (side="l"), per right record
+    (side="r"), or per record whichever side of the pair it is on ("either").
+    With "either", the candidates of each record are ranked together across
+    the pairs in which it is the left and the right record, and a pair is kept
+    if it is among the top_k candidates of either of its records.  The rank of
+    each pair is retained in match_rank_l and/or match_rank_r.
+    """
+    if not isinstance(top_k, int) or top_k < 1:
+        raise ValueError("`top_k_per_record` must be a positive integer")
+    if side not in ("l", "r", "either"):
+        raise ValueError(
+            f"`top_k_per_record_side` must be 'l', 'r' or 'either', not '{side}'"
+        )
+
+    id_cols = {
+        "l": [col.name_l for col in unique_id_input_columns],
+        "r": [col.name_r for col in unique_id_input_columns],
+    }
+
+    if side == "either":
+        return _top_k_per_record_either_side_sqls(id_cols, top_k, input_tablename)
+
+    other = "r" if side == "l" else "l"
+    # Ties are broken on the candidate's id so the result is deterministic
+    sql = f"""
+    select *
+    from (
+        select *,
+        row_number() over (partition by {", ".join(id_cols[side])}
+        order by match_weight desc nulls last, {", ".join(id_cols[other])})
+        as match_rank_{side}
+        from {input_tablename}
+    ) as __splink__ranked_candidates
+    where match_rank_{side} <= {top_k}
+    """
+
+    return [{"sql": sql, "output_table_name": "__splink__df_predict"}]
+
+
+def _top_k_per_record_either_side_sqls(
+    id_cols: dict[str, list[str]],
+    top_k: int,
+    input_tablename: str,
+) -> list[dict[str, str]]:
+    sqls = []
+
+    # Unpivot each pair into a row for each of its records, so that a record's
+    # candidates are ranked together whichever side of the pair it is on
+    num_id_cols = len(id_cols["l"])
+    record_cols = [f"__splink__record_{i}" for i in range(num_id_cols)]
+    candidate_cols = [f"__splink__candidate_{i}" for i in range(num_id_cols)]
+    unpivoted = []
+    for lr, other in [("l", "r"), ("r", "l")]:
+        select_cols = [
+            f"{c} as {alias}" for c, alias in zip(id_cols[lr], record_cols)
+        ] + [f"{c} as {alias}" for c, alias in zip(id_cols[other], candidate_cols)]
+        unpivoted.append(
+            f"""
+            select '{lr}' as __splink__side, {", ".join(select_cols)}, match_weight
+            from {input_tablename}
+            """
+        )
+    sql = f"""
+    select
+        __splink__side,
+        {", ".join(record_cols + candidate_cols)},
+        row_number() over (partition by {", ".join(record_cols)}
+        order by match_weight desc nulls last, {", ".join(candidate_cols)})
+        as __splink__match_rank
+    from ({" union all ".join(unpivoted)}) as __splink__candidates_by_record
+    """
+    sqls.append({"sql": sql, "output_table_name": "__splink__candidate_ranks"})
+
+    joins = []
+    for lr, other in [("l", "r"), ("r", "l")]:
+        on = " and ".join(
+            [f"{lr}_rank.__splink__side = '{lr}'"]
+            + [
+                f"{lr}_rank.{alias} = p.{c}"
+                for c, alias in zip(id_cols[lr], record_cols)
+            ]
+            + [
+                f"{lr}_rank.{alias} = p.{c}"
+                for c, alias in zip(id_cols[other], candidate_cols)
+            ]
+        )
+        joins.append(f"inner join __splink__candidate_ranks as {lr}_rank on {on}")
+
+    sql = f"""
+    select
+        p.*,
+        l_rank.__splink__match_rank as match_rank_l,
+        r_rank.__splink__match_rank as match_rank_r
+    from {input_tablename} as p
+    {" ".join(joins)}
+    where l_rank.__splink__match_rank <= {top_k}
+    or r_rank.__splink__match_rank <= {top_k}
+    """
+    sqls.append({"sql": sql, "output_table_name": "__splink__df_predict"})
+
+    return sqls
+
+
 def predict_from_agreement_pattern_counts_sqls(
     comparisons: List[Comparison],
     probability_two_random_records_match: float,
@@ -196,6 +589,60 @@ def predict_from_agreement_pattern_counts_sqls(
     return sqls
 
 
+def _threshold_expr(
+    match_weight_expr: str,
+    threshold_match_probability: float = None,
+    threshold_match_weight: float = None,
+) -> str:
+    # In case user provided both, take the minimum of the two thresholds
+    if threshold_match_probability is not None:
+        thres_prob_as_weight = prob_to_match_weight(threshold_match_probability)
+    else:
+        thres_prob_as_weight = None
+    if threshold_match_probability is not None or threshold_match_weight is not None:
+        thresholds = [
+            thres_prob_as_weight,
+            threshold_match_weight,
+        ]
+        threshold = max([t for t in thresholds if t is not None])
+        return f" where {match_weight_expr} >= {threshold} "
+    return ""
+
+
+def _sum_prior_and_log2_weights(
+    prior: float, weight_terms: list[str], sql_infinity_expr: str
+) -> str:
+    """Compute the match weight expression as a sum of log2 Bayes factors"""
+    if prior == 1.0:
+        return sql_infinity_expr
+    if prior == 0.0:
+        prior_weight = "cast('-Infinity' as float8)"
+    else:
+        prior_weight = f"cast({prob_to_match_weight(prior)} as float8)"
+    sum_expr = " + ".join([prior_weight, *weight_terms])
+    if not weight_terms:
+        return sum_expr
+
+    # As when multiplying Bayes factors, a pair with an infinite Bayes factor is
+    # a match, even if another is zero and the sum would be Infinity - Infinity
+    any_term_inf = " OR ".join(f"{term} = {sql_infinity_expr}" for term in weight_terms)
+    inf_weight = "cast('Infinity' as float8)"
+    return f"CASE WHEN {any_term_inf} THEN {inf_weight} ELSE {sum_expr} END"
+
+
+def _match_probability_from_match_weight_sql(match_weight_column: str) -> str:
+    # Equal to bf / (1 + bf) with bf = 2^weight. Beyond +/-1000 the probability
+    # is 1 or 0 to double precision, and some backends raise on POW overflow
+    mw = match_weight_column
+    return f"""
+    CASE
+    WHEN {mw} > 1000 THEN cast(1 as float8)
+    WHEN {mw} < -1000 THEN cast(0 as float8)
+    ELSE 1 / (1 + POW(cast(2 as float8), -{mw}))
+    END
+    """
+
+
 def _combine_prior_and_bfs(
     prior: float, bf_terms: list[str], sql_infinity_expr: str
 ) -> tuple[str, str]:
@@ -12,6 +12,7 @@ from splink.internals.column_expression import ColumnExpression
 from splink.internals.database_api import AcceptableInputTableType, DatabaseAPISubClass
 from splink.internals.misc import ensure_is_list
 from splink.internals.pipeline import CTEPipeline
+from splink.internals.pipeline_scheduler import PipelineScheduler
 from splink.internals.vertically_concatenate import vertically_concatenate_sql
 
 logger = logging.getLogger(__name__)
@@ -280,26 +281,31 @@ def profile_columns(
     )
 
     pipeline.enqueue_sql(sql, "__splink__df_all_column_value_frequencies")
-    df_raw = db_api.sql_pipeline_to_splink_dataframe(pipeline)
 
-    pipeline = CTEPipeline(input_dataframes=[df_raw])
+    # The percentile, top n and bottom n queries are independent of each other,
+    # so may be run concurrently
+    scheduler = PipelineScheduler(db_api)
+    raw_name = scheduler.add_pipeline(pipeline)
+
+    pipeline = CTEPipeline()
     sqls = _get_df_percentiles()
     pipeline.enqueue_list_of_sqls(sqls)
+    percentiles_name = scheduler.add_pipeline(pipeline, depends_on=raw_name)
 
-    df_percentiles = db_api.sql_pipeline_to_splink_dataframe(pipeline)
-    percentile_rows_all = df_percentiles.as_record_dict()
-
-    pipeline = CTEPipeline(input_dataframes=[df_raw])
+    pipeline = CTEPipeline()
     sql = _get_df_top_bottom_n(column_expressions_as_sql, top_n, "desc")
     pipeline.enqueue_sql(sql, "__splink__df_top_n")
-    df_top_n = db_api.sql_pipeline_to_splink_dataframe(pipeline)
-    top_n_rows_all = df_top_n.as_record_dict()
+    top_n_name = scheduler.add_pipeline(pipeline, depends_on=raw_name)
 
-    pipeline = CTEPipeline(input_dataframes=[df_raw])
+    pipeline = CTEPipeline()
     sql = _get_df_top_bottom_n(column_expressions_as_sql, bottom_n, "asc")
     pipeline.enqueue_sql(sql, "__splink__df_bottom_n")
-    df_bottom_n = db_api.sql_pipeline_to_splink_dataframe(pipeline)
-    bottom_n_rows_all = df_bottom_n.as_record_dict()
+    bottom_n_name = scheduler.add_pipeline(pipeline, depends_on=raw_name)
+
+    results = scheduler.run()
+    percentile_rows_all = results[percentiles_name].as_record_dict()
+    top_n_rows_all = results[top_n_name].as_record_dict()
+    bottom_n_rows_all = results[bottom_n_name].as_record_dict()
 
     inner_charts = []
 
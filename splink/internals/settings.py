@@ -7,7 +7,9 @@ from typing import Any, List, Literal, Sequence, TypedDict
 
 from splink.internals.blocking import (
     BlockingRule,
+    MinHashLSHBlockingRule,
     SaltedBlockingRule,
+    blocking_key_columns,
     blocking_rule_to_obj,
 )
 from splink.internals.charts import m_u_parameters_chart, match_weights_chart
@@ -296,8 +298,16 @@ class Settings:
             # Want to add any columns not already by the model
             used_by_brs = []
             for br in self._blocking_rules_to_generate_predictions:
+                blocking_rule_sql = br.blocking_rule_sql
+                if isinstance(br, MinHashLSHBlockingRule):
+                    # The band keys are computed from the column, so are not
+                    # input columns
+                    blocking_rule_sql = br.filter_condition_sql
+                    used_by_brs.extend(
+                        get_columns_used_from_sql(br.column, br.sql_dialect)
+                    )
                 used_by_brs.extend(
-                    get_columns_used_from_sql(br.blocking_rule_sql, br.sql_dialect)
+                    get_columns_used_from_sql(blocking_rule_sql, br.sql_dialect)
                 )
 
             used_by_brs = [
@@ -432,6 +442,7 @@ class Settings:
         retain_intermediate_calculation_columns: bool,
         additional_columns_to_retain: List[InputColumn],
         needs_matchkey_column: bool,
+        log2_weights: bool = False,
     ) -> List[str]:
         cols = []
 
@@ -443,6 +454,7 @@ class Settings:
                 cc._columns_to_select_for_bayes_factor_parts(
                     retain_matching_columns,
                     retain_intermediate_calculation_columns,
+                    log2_weights,
                 )
             )
 
@@ -688,6 +700,12 @@ class Settings:
         )
         return desc
 
+    @property
+    def _blocking_key_columns(self) -> dict[str, str]:
+        """Key expressions of the prediction blocking rules which are computed
+        once per record, as hidden columns of the concatenated input tables"""
+        return blocking_key_columns(self._blocking_rules_to_generate_predictions)
+
     @property
     def salting_required(self):
         # see https://github.com/duckdb/duckdb/discussions/9710
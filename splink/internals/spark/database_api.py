@@ -4,7 +4,6 @@ import os
 import re
 
 import pandas as pd
-import sqlglot
 from numpy import nan
 from pyspark.sql.dataframe import DataFrame as spark_df
 from pyspark.sql.utils import AnalysisException
@@ -17,6 +16,7 @@ from splink.internals.dialects import (
 from splink.internals.misc import (
     major_minor_version_greater_equal_than,
 )
+from splink.internals.sqlglot_cache import transpile_cached
 
 from .dataframe import SparkDataFrame
 from .jar_location import get_scala_udfs
@@ -26,6 +26,7 @@ logger = logging.getLogger(__name__)
 
 class SparkAPI(DatabaseAPI[spark_df]):
     sql_dialect = SparkDialect()
+    max_concurrent_pipelines = 4
 
     def __init__(
         self,
@@ -103,7 +104,7 @@ class SparkAPI(DatabaseAPI[spark_df]):
             return False
 
     def _setup_for_execute_sql(self, sql: str, physical_name: str) -> str:
-        sql = sqlglot.transpile(sql, read="spark", write="customspark", pretty=True)[0]
+        sql = transpile_cached(sql, read="spark", write="customspark", pretty=True)
         return sql
 
     def _cleanup_for_execute_sql(
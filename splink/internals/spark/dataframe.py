@@ -1,12 +1,16 @@
 from __future__ import annotations
 
 import logging
-from typing import TYPE_CHECKING
+from itertools import islice
+from typing import TYPE_CHECKING, Iterator, Optional
 
 from pandas import DataFrame as PandasDataFrame
 
-from splink.internals.input_column import InputColumn
-from splink.internals.splink_dataframe import SplinkDataFrame
+from splink.internals.splink_dataframe import (
+    BatchOutputType,
+    SplinkDataFrame,
+    _import_pyarrow,
+)
 
 from .spark_helpers.custom_spark_dialect import Dialect
 
@@ -14,19 +18,19 @@ logger = logging.getLogger(__name__)
 
 Dialect["customspark"]
 if TYPE_CHECKING:
+    import pyarrow as pa
+
     from .database_api import SparkAPI
 
 
 class SparkDataFrame(SplinkDataFrame):
     db_api: SparkAPI
 
-    @property
-    def columns(self) -> list[InputColumn]:
+    def _fetch_column_types(self) -> dict[str, str]:
         sql = f"select * from {self.physical_name} limit 1"
         spark_df = self.db_api._execute_sql_against_backend(sql)
 
-        col_strings = list(spark_df.columns)
-        return [InputColumn(c, sql_dialect="spark") for c in col_strings]
+        return dict(spark_df.dtypes)
 
     def validate(self):
         pass
@@ -52,6 +56,71 @@ class SparkDataFrame(SplinkDataFrame):
 
         return self.db_api._execute_sql_against_backend(sql).toPandas()
 
+    def as_arrow(self, limit: int = None) -> pa.Table:
+        sql = f"select * from {self.physical_name}"
+        if limit:
+            sql += f" limit {limit}"
+
+        spark_df = self.db_api._execute_sql_against_backend(sql)
+        if hasattr(spark_df, "toArrow"):
+            # pyspark >= 4.0
+            return spark_df.toArrow()
+
+        # Earlier versions only expose the Arrow collection used by toPandas()
+        pa = _import_pyarrow()
+        batches = spark_df._collect_as_arrow()
+        if not batches:
+            return pa.Table.from_pandas(spark_df.toPandas(), preserve_index=False)
+        return pa.Table.from_batches(batches)
+
+    def _iter_batches(
+        self, batch_size: int, output_type: BatchOutputType
+    ) -> Iterator[pa.RecordBatch | PandasDataFrame]:
+        spark_df = self.as_spark_dataframe()
+        column_names = spark_df.columns
+        # toLocalIterator collects one partition at a time to the driver, so
+        # memory use is bounded by the largest partition rather than the table
+        rows = spark_df.toLocalIterator()
+        row_batches = iter(lambda: list(islice(rows, batch_size)), [])
+        yield from self._batches_from_rows(column_names, row_batches, output_type)
+
+    def _arrow_types(self) -> dict[str, pa.DataType]:
+        from pyspark.sql.pandas.types import to_arrow_type
+
+        pa = _import_pyarrow()
+        arrow_types = {}
+        for field in self.as_spark_dataframe().schema.fields:
+            try:
+                arrow_type = to_arrow_type(field.dataType)
+            except TypeError:
+                # Types Arrow can't represent are left to inference
+                continue
+            # Rows hold timestamps as naive datetimes in the session time zone
+            if pa.types.is_timestamp(arrow_type):
+                arrow_type = pa.timestamp(arrow_type.unit)
+            if pa.types.is_struct(arrow_type) or pa.types.is_map(arrow_type):
+                # Structs are returned as Rows and maps as dicts, which
+                # inference converts
+                continue
+            arrow_types[field.name] = arrow_type
+        return arrow_types
+
+    def _row_count(self) -> int:
+        sql = f"select count(*) from {self.physical_name}"
+        return self.db_api._execute_sql_against_backend(sql).collect()[0][0]
+
+    def _stored_size(self) -> tuple[Optional[int], Optional[int]]:
+        # Most tables are lazily evaluated views, whose plan statistics are only
+        # estimates.  Tables read from files, such as those whose lineage was
+        # broken by writing them to parquet, have the size of the files
+        plan = self.as_spark_dataframe()._jdf.queryExecution().optimizedPlan()
+        if plan.getClass().getSimpleName() != "LogicalRelation":
+            return None, None
+        stats = plan.stats()
+        row_count = stats.rowCount()
+        rows = int(row_count.get().toString()) if row_count.isDefined() else None
+        return rows, int(stats.sizeInBytes().toString())
+
     def as_spark_dataframe(self):
         return self.db_api.spark.table(self.physical_name)
 
@@ -4,8 +4,6 @@ import json
 import os
 from typing import TYPE_CHECKING, Any
 
-from jinja2 import Template
-
 from splink.internals.misc import EverythingEncoder, read_resource
 
 from .predict import _combine_prior_and_bfs
@@ -121,6 +119,9 @@ def render_splink_comparison_viewer_html(
     # rather than bundling the whole thing into the html
     bundle_observable_notebook = True
 
+    # jinja2 is only imported when a dashboard is rendered
+    from jinja2 import Template
+
     template_path = "internals/files/splink_comparison_viewer/template.j2"
     template = Template(read_resource(template_path))
 
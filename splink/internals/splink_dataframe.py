@@ -1,19 +1,79 @@
 from __future__ import annotations
 
 import logging
-from abc import ABC, abstractmethod, abstractproperty
+from abc import ABC, abstractmethod
+from dataclasses import dataclass
 from pathlib import Path
-from typing import TYPE_CHECKING, Any, Optional
+from typing import TYPE_CHECKING, Any, Iterator, Literal, Optional, Sequence
 
+from splink.internals.exceptions import MissingDependencyException
 from splink.internals.input_column import InputColumn
 
 logger = logging.getLogger(__name__)
 
 # https://stackoverflow.com/questions/39740632/python-type-hinting-without-cyclic-imports
 if TYPE_CHECKING:
+    import polars as pl
+    import pyarrow as pa
+    from pandas import DataFrame as PandasDataFrame
+
     from splink.internals.database_api import DatabaseAPI
 
 
+def _import_pyarrow():
+    try:
+        import pyarrow as pa
+    except ImportError:
+        raise MissingDependencyException(
+            "You need to install the 'pyarrow' package to retrieve results "
+            "in Arrow format."
+        ) from None
+    return pa
+
+
+BatchOutputType = Literal["arrow", "pandas"]
+
+
+def _pyarrow_installed() -> bool:
+    try:
+        import pyarrow  # noqa: F401
+    except ImportError:
+        return False
+    return True
+
+
+def _rows_to_batch(
+    column_names: list[str],
+    rows: Sequence[Sequence[Any]],
+    output_type: BatchOutputType,
+    schema: Optional[pa.Schema] = None,
+) -> pa.RecordBatch | PandasDataFrame:
+    """Build a batch from a non-empty list of row tuples.  If `schema` is given,
+    the Arrow batch has that schema rather than types inferred from `rows`"""
+    if output_type == "pandas":
+        import pandas as pd
+
+        return pd.DataFrame.from_records(rows, columns=column_names)
+
+    pa = _import_pyarrow()
+    # Build column by column, rather than creating a dict per row
+    if schema is None:
+        arrays = [pa.array(values) for values in zip(*rows)]
+        return pa.RecordBatch.from_arrays(arrays, names=column_names)
+    arrays = [
+        pa.array(values, type=field.type) for values, field in zip(zip(*rows), schema)
+    ]
+    return pa.RecordBatch.from_arrays(arrays, schema=schema)
+
+
+@dataclass(frozen=True)
+class TableSchema:
+    """The columns of a table in the database, and their types"""
+
+    column_types: dict[str, str]
+    columns: list[InputColumn]
+
+
 class SplinkDataFrame(ABC):
     """Abstraction over dataframe to handle basic operations like retrieving data and
     retrieving column names, which need different implementations depending on whether
@@ -36,8 +96,35 @@ class SplinkDataFrame(ABC):
         self.sql_used_to_create: str | None = None
         self.metadata = metadata or {}
 
-    @abstractproperty
+    @property
     def columns(self) -> list[InputColumn]:
+        return list(self._schema.columns)
+
+    @property
+    def column_types(self) -> dict[str, str]:
+        """The names of the columns, mapped to their types in the database"""
+        return dict(self._schema.column_types)
+
+    @property
+    def _schema(self) -> TableSchema:
+        # Cached on the DatabaseAPI, keyed on physical name, so that it is shared
+        # by all SplinkDataFrames referring to the table.  The DatabaseAPI
+        # forgets it when the table is dropped, created or registered
+        schemas = self.db_api._table_schemas
+        schema = schemas.get(self.physical_name)
+        if schema is None:
+            column_types = self._fetch_column_types()
+            sqlglot_dialect = self.db_api.sql_dialect.sqlglot_name
+            columns = [
+                InputColumn(c, sql_dialect=sqlglot_dialect) for c in column_types
+            ]
+            schema = TableSchema(column_types, columns)
+            schemas[self.physical_name] = schema
+        return schema
+
+    @abstractmethod
+    def _fetch_column_types(self) -> dict[str, str]:
+        """Query the database for the names and types of the columns"""
         pass
 
     @property
@@ -115,6 +202,16 @@ class SplinkDataFrame(ABC):
         """
         raise NotImplementedError("as_record_dict not implemented for this linker")
 
+    def _row_count(self) -> int:
+        """The number of rows in the table"""
+        raise NotImplementedError("_row_count not implemented for this linker")
+
+    def _stored_size(self) -> tuple[Optional[int], Optional[int]]:
+        """The number of rows and bytes in the table, from metadata the backend
+        already holds about it rather than by scanning it.  Either is None if the
+        backend does not record it"""
+        return None, None
+
     def as_pandas_dataframe(self, limit=None):
         """Return the dataframe as a pandas dataframe.
 
@@ -136,6 +233,153 @@ class SplinkDataFrame(ABC):
 
         return pd.DataFrame(self.as_record_dict(limit=limit))
 
+    def as_arrow(self, limit: Optional[int] = None) -> pa.Table:
+        """Return the dataframe as a pyarrow Table.
+
+        Where the backend supports it, data is transferred in Arrow format
+        directly, without conversion to pandas or Python objects, so this is
+        more efficient than `as_pandas_dataframe()` for large tables.
+
+        Examples:
+            ```py
+            df_predict = linker.inference.predict()
+            arrow_table = df_predict.as_arrow()
+            ```
+        Args:
+            limit (int, optional): If provided, return this number of rows (equivalent
+                to a limit statement in SQL). Defaults to None, meaning return all rows
+
+        Returns:
+            pyarrow.Table: pyarrow Table
+        """
+        pa = _import_pyarrow()
+        return pa.Table.from_pylist(self.as_record_dict(limit=limit))
+
+    def as_polars(self, limit: Optional[int] = None) -> pl.DataFrame:
+        """Return the dataframe as a polars DataFrame, via `as_arrow()`.
+
+        Examples:
+            ```py
+            df_predict = linker.inference.predict()
+            df_polars = df_predict.as_polars()
+            ```
+        Args:
+            limit (int, optional): If provided, return this number of rows (equivalent
+                to a limit statement in SQL). Defaults to None, meaning return all rows
+
+        Returns:
+            polars.DataFrame: polars DataFrame
+        """
+        try:
+            import polars as pl
+        except ImportError:
+            raise MissingDependencyException(
+                "You need to install the 'polars' package to retrieve results "
+                "as a polars DataFrame."
+            ) from None
+        return pl.from_arrow(self.as_arrow(limit=limit))
+
+    def _as_arrow_or_pandas(self) -> pa.Table | PandasDataFrame:
+        """For internal consumers which accept either: uses Arrow if pyarrow
+        is installed, avoiding the cost of building a pandas DataFrame"""
+        if not _pyarrow_installed():
+            return self.as_pandas_dataframe()
+        return self.as_arrow()
+
+    def iter_batches(
+        self, batch_size: int = 100_000, output_type: BatchOutputType = "arrow"
+    ) -> Iterator[pa.RecordBatch | PandasDataFrame]:
+        """Iterate over the rows of the dataframe in batches, so that large
+        results (e.g. the output of `predict()`) can be consumed without loading
+        them fully into memory.
+
+        Where the backend supports it, rows are streamed from the database
+        (DuckDB record batches, Postgres server-side cursors, Spark's
+        `toLocalIterator`), so only around one batch is held in memory at a time.
+
+        Examples:
+            ```py
+            df_predict = linker.inference.predict()
+            for batch in df_predict.iter_batches(batch_size=50_000):
+                write_to_downstream_system(batch)
+            ```
+        Args:
+            batch_size (int, optional): The maximum number of rows in each batch.
+                Defaults to 100,000.
+            output_type (str, optional): 'arrow' to yield `pyarrow.RecordBatch`es,
+                or 'pandas' to yield pandas DataFrames. Defaults to 'arrow'.
+
+        Returns:
+            Iterator[pyarrow.RecordBatch | pandas.DataFrame]: The batches
+        """
+        if output_type not in ("arrow", "pandas"):
+            raise ValueError(
+                f"output_type must be 'arrow' or 'pandas', not '{output_type}'"
+            )
+        if batch_size < 1:
+            raise ValueError(f"batch_size must be at least 1, not {batch_size}")
+        # Validation happens eagerly, only the fetching is deferred
+        return self._iter_batches(int(batch_size), output_type)
+
+    def _batches_from_rows(
+        self,
+        column_names: list[str],
+        row_batches: Iterator[Sequence[Sequence[Any]]],
+        output_type: BatchOutputType,
+    ) -> Iterator[pa.RecordBatch | PandasDataFrame]:
+        """Build a batch from each list of row tuples in `row_batches`.  Arrow
+        batches all have the schema determined from the first, so that they can
+        be combined into a single table or file"""
+        schema = None
+        for rows in row_batches:
+            if output_type == "arrow" and schema is None:
+                schema = self._arrow_schema_for_rows(column_names, rows)
+            yield _rows_to_batch(column_names, rows, output_type, schema)
+
+    def _arrow_schema_for_rows(
+        self, column_names: list[str], rows: Sequence[Sequence[Any]]
+    ) -> pa.Schema:
+        """The Arrow schema of the table, using the types known to the backend
+        (see `_arrow_types()`) and otherwise the types of the values in `rows`.
+
+        A column with no non-null values in `rows` takes the type of its first
+        non-null value in the table, if the backend can find one."""
+        pa = _import_pyarrow()
+        known_types = self._arrow_types()
+        fields = []
+        for name, values in zip(column_names, zip(*rows)):
+            arrow_type = known_types.get(name)
+            if arrow_type is None:
+                arrow_type = pa.array(values).type
+            if pa.types.is_null(arrow_type):
+                sample = self._first_non_null_value(name)
+                if sample is not None:
+                    arrow_type = pa.array([sample]).type
+            fields.append(pa.field(name, arrow_type))
+        return pa.schema(fields)
+
+    def _arrow_types(self) -> dict[str, pa.DataType]:
+        """The Arrow types of the columns whose type the backend knows exactly"""
+        return {}
+
+    def _first_non_null_value(self, column_name: str) -> Any:
+        """A non-null value of the column, or None if it has none or the backend
+        can't look it up"""
+        return None
+
+    def _iter_batches(
+        self, batch_size: int, output_type: BatchOutputType
+    ) -> Iterator[pa.RecordBatch | PandasDataFrame]:
+        # Backends without a streaming interface fetch the whole table, and
+        # split it into batches
+        if output_type == "arrow":
+            yield from self.as_arrow().to_batches(max_chunksize=batch_size)
+            return
+
+        df = self.as_pandas_dataframe()
+        for start in range(0, len(df), batch_size):
+            yield df.iloc[start : start + batch_size].reset_index(drop=True)
+
     def _repr_pretty_(self, p, cycle):
         msg = (
             f"Table name in database: `{self.physical_name}`\n"
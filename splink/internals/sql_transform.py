@@ -3,9 +3,12 @@ from typing import TypeVar
 import sqlglot
 import sqlglot.expressions as exp
 
+from splink.internals.sqlglot_cache import parse_one_cached
+
 
 def sqlglot_transform_sql(sql, func, dialect=None):
-    syntax_tree = sqlglot.parse_one(sql, read=dialect)
+    # transform() copies the tree, so the cached tree is not modified
+    syntax_tree = parse_one_cached(sql, dialect=dialect, copy=False)
     transformed_tree = syntax_tree.transform(func)
     return transformed_tree.sql(dialect)
 
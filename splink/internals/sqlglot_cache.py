@@ -0,0 +1,117 @@
+from __future__ import annotations
+
+import threading
+from collections import OrderedDict
+from typing import Callable, Dict, Hashable, Optional, Type, TypeVar
+
+import sqlglot
+from sqlglot import exp
+from sqlglot.optimizer import optimize
+
+T = TypeVar("T")
+
+
+class MemoCache:
+    """A bounded, thread-safe, least recently used memo cache, which counts hits
+    and misses"""
+
+    def __init__(self, maxsize: int = 4096):
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._data: OrderedDict[Hashable, object] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get_or_compute(self, key: Hashable, compute: Callable[[], T]) -> T:
+        with self._lock:
+            if key in self._data:
+                self.hits += 1
+                self._data.move_to_end(key)
+                return self._data[key]  # type: ignore[return-value]
+            self.misses += 1
+
+        # Computed outside the lock, so a slow parse does not block other threads.
+        # Exceptions (e.g. ParseError) propagate and are not cached
+        value = compute()
+
+        with self._lock:
+            self._data[key] = value
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+        return value
+
+    def clear(self) -> None:
+        with self._lock:
+            self._data.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def info(self) -> Dict[str, int]:
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "size": len(self._data),
+                "maxsize": self.maxsize,
+            }
+
+
+_parse_cache = MemoCache()
+_transpile_cache = MemoCache()
+_optimize_cache = MemoCache()
+
+
+def parse_one_cached(
+    sql: str,
+    dialect: Optional[str] = None,
+    into: Optional[Type[exp.Expression]] = None,
+    copy: bool = True,
+) -> exp.Expression:
+    """`sqlglot.parse_one`, memoised on (sql, dialect, into).
+
+    sqlglot trees are mutable, so by default a copy of the cached tree is returned.
+    Callers which only read the tree (or which transform it with `copy=True`) can
+    pass `copy=False` to avoid the cost of copying.
+    """
+    tree = _parse_cache.get_or_compute(
+        (sql, dialect, into),
+        lambda: sqlglot.parse_one(sql, read=dialect, into=into),
+    )
+    return tree.copy() if copy else tree
+
+
+def transpile_cached(
+    sql: str, read: Optional[str] = None, write: Optional[str] = None, **opts
+) -> str:
+    """The first statement of `sqlglot.transpile`, memoised on its arguments"""
+    key = (sql, read, write, tuple(sorted(opts.items())))
+    return _transpile_cache.get_or_compute(
+        key, lambda: sqlglot.transpile(sql, read=read, write=write, **opts)[0]
+    )
+
+
+def optimize_cached(
+    expression: exp.Expression, dialect: Optional[str] = None
+) -> exp.Expression:
+    """`sqlglot.optimizer.optimize`, memoised on the sql of the expression.
+    Returns a copy of the cached result."""
+    key = (expression.sql(dialect=dialect), dialect)
+    optimized = _optimize_cache.get_or_compute(
+        key, lambda: optimize(expression.copy(), dialect=dialect)
+    )
+    return optimized.copy()
+
+
+def sqlglot_cache_info() -> Dict[str, Dict[str, int]]:
+    """Hit and miss counts of the memoised sqlglot operations"""
+    return {
+        "parse": _parse_cache.info(),
+        "transpile": _transpile_cache.info(),
+        "optimize": _optimize_cache.info(),
+    }
+
+
+def clear_sqlglot_caches() -> None:
+    for cache in (_parse_cache, _transpile_cache, _optimize_cache):
+        cache.clear()
@@ -1,13 +1,19 @@
 from __future__ import annotations
 
 import logging
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Iterator, Optional
 
-from splink.internals.input_column import InputColumn
-from splink.internals.splink_dataframe import SplinkDataFrame
+from splink.internals.splink_dataframe import (
+    BatchOutputType,
+    SplinkDataFrame,
+    _import_pyarrow,
+)
 
 logger = logging.getLogger(__name__)
 if TYPE_CHECKING:
+    import pyarrow as pa
+    from pandas import DataFrame as PandasDataFrame
+
     from .database_api import SQLiteAPI
 
 
@@ -21,15 +27,12 @@ def dict_factory(cursor, row):
 class SQLiteDataFrame(SplinkDataFrame):
     db_api: SQLiteAPI
 
-    @property
-    def columns(self) -> list[InputColumn]:
+    def _fetch_column_types(self) -> dict[str, str]:
         sql = f"""
         PRAGMA table_info({self.physical_name});
         """
         pragma_result = self.db_api._execute_sql_against_backend(sql).fetchall()
-        cols = [r["name"] for r in pragma_result]
-
-        return [InputColumn(c, sql_dialect="sqlite") for c in cols]
+        return {r["name"]: r["type"] for r in pragma_result}
 
     def validate(self):
         if not isinstance(self.physical_name, str):
@@ -74,3 +77,70 @@ class SQLiteDataFrame(SplinkDataFrame):
         sql += ";"
         cur = self.db_api.con.cursor()
         return cur.execute(sql).fetchall()
+
+    def _iter_batches(
+        self, batch_size: int, output_type: BatchOutputType
+    ) -> Iterator[pa.RecordBatch | PandasDataFrame]:
+        sql = f"""
+        select *
+        from {self.physical_name};
+        """
+        cur = self.db_api.con.cursor()
+        # Plain tuples, rather than a dict per row
+        cur.row_factory = None
+        try:
+            cur.execute(sql)
+            column_names = [d[0] for d in cur.description]
+            yield from self._batches_from_rows(
+                column_names, iter(lambda: cur.fetchmany(batch_size), []), output_type
+            )
+        finally:
+            cur.close()
+
+    def _arrow_types(self) -> dict[str, pa.DataType]:
+        # SQLite is dynamically typed, and columns computed by Splink often have
+        # no declared type, so the storage classes of each column's values are
+        # looked up instead, in a single pass over the table
+        pa = _import_pyarrow()
+        columns = self.columns
+        storage_classes_sql = ", ".join(
+            f"group_concat(distinct typeof({c.name}))" for c in columns
+        )
+        sql = f"select {storage_classes_sql} from {self.physical_name}"
+        cur = self.db_api.con.cursor()
+        cur.row_factory = None
+        try:
+            row = cur.execute(sql).fetchone()
+        finally:
+            cur.close()
+
+        arrow_types = {}
+        for c, storage_classes in zip(columns, row):
+            classes = set((storage_classes or "").split(",")) - {"", "null"}
+            if not classes:
+                arrow_type = pa.null()
+            elif classes == {"integer"}:
+                arrow_type = pa.int64()
+            elif classes <= {"integer", "real"}:
+                arrow_type = pa.float64()
+            elif classes == {"text"}:
+                arrow_type = pa.string()
+            elif classes == {"blob"}:
+                arrow_type = pa.binary()
+            else:
+                # Mixed types are left to inference
+                continue
+            arrow_types[c.unquote().name] = arrow_type
+        return arrow_types
+
+    def _row_count(self) -> int:
+        sql = f"select count(*) as row_count from {self.physical_name};"
+        return self.db_api._execute_sql_against_backend(sql).fetchone()["row_count"]
+
+    def _stored_size(self) -> tuple[Optional[int], Optional[int]]:
+        # The dbstat table, if SQLite was compiled with it, has the size of each
+        # page of the table.  SQLite does not keep a row count
+        sql = f"""
+        select sum(pgsize) as bytes from dbstat where name = '{self.physical_name}';
+        """
+        return None, self.db_api._execute_sql_against_backend(sql).fetchone()["bytes"]
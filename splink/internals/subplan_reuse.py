@@ -0,0 +1,203 @@
+from __future__ import annotations
+
+import hashlib
+import logging
+import re
+from collections import Counter
+from typing import TYPE_CHECKING, Dict, List, Optional
+
+import sqlglot
+from sqlglot import exp
+from sqlglot.errors import ParseError
+
+from splink.internals.pipeline import CTE, CTEPipeline
+
+logger = logging.getLogger(__name__)
+
+if TYPE_CHECKING:
+    from splink.internals.database_api import DatabaseAPISubClass
+    from splink.internals.splink_dataframe import SplinkDataFrame
+
+
+class _PlannedCTE:
+    def __init__(self, cte: CTE, tree: exp.Expression, dialect: str):
+        self.cte = cte
+        self.normalised_sql = tree.sql(dialect=dialect)
+        # Names of tables read, with one entry per reference (e.g. a self join
+        # reads the same table twice)
+        self.table_references = [
+            t.name
+            for t in tree.find_all(exp.Table)
+            if isinstance(t.this, exp.Identifier) and not t.db
+        ]
+        self.key: str = ""
+
+    @property
+    def name(self) -> str:
+        return self.cte.output_table_name
+
+    @property
+    def is_trivial(self) -> bool:
+        """A plain `select * from table`, e.g. the aliasing of an input dataframe,
+        which is never worth materialising"""
+        return re.fullmatch(r"SELECT \* FROM [^\s]+", self.normalised_sql) is not None
+
+
+class SubplanPlanner:
+    """Rewrites CTE pipelines so that repeated subplans are computed only once.
+
+    Each CTE in a pipeline is keyed on its normalised SQL together with the keys of
+    the CTEs it reads from, so that two CTEs share a key only if they compute the
+    same result.  Then:
+
+    - a CTE identical to an earlier CTE in the same pipeline is replaced by a
+        `select *` from the earlier one
+    - a CTE read `min_references` or more times by later CTEs in the pipeline
+        is materialised, so that engines which inline CTEs do not evaluate it
+        repeatedly
+    - a CTE which has already been seen in a previous pipeline is materialised,
+        so that this and any future pipeline containing it can reuse the table
+        from the intermediate table cache
+
+    Materialised CTEs are passed to the rewritten pipeline as input dataframes.
+    """
+
+    def __init__(self, min_references: int = 2):
+        self.min_references = min_references
+        # key -> number of pipelines in which the subplan has been seen
+        self._seen: Counter[str] = Counter()
+
+    def reset(self) -> None:
+        self._seen.clear()
+
+    def plan(self, pipeline: CTEPipeline, db_api: DatabaseAPISubClass) -> CTEPipeline:
+        """Return a pipeline equivalent to `pipeline` in which repeated subplans
+        are reused.  Materialises tables as a side effect."""
+        planned = self._parse(pipeline.ctes_pipeline(), db_api.sql_dialect.sqlglot_name)
+        if planned is None or len(planned) < 2:
+            return pipeline
+
+        self._assign_keys(planned)
+        deduplicated = self._deduplicate(planned)
+        to_materialise = self._choose_tables_to_materialise(planned)
+
+        for key in {p.key for p in planned[:-1] if not p.is_trivial}:
+            self._seen[key] += 1
+
+        if not deduplicated and not to_materialise:
+            return pipeline
+
+        materialised: Dict[str, SplinkDataFrame] = {}
+        for p in planned:
+            if p.name in to_materialise:
+                materialised[p.name] = self._materialise(
+                    p, planned, materialised, db_api
+                )
+
+        pipeline.spent = True
+        new_pipeline = CTEPipeline(
+            input_dataframes=pipeline.input_dataframes + list(materialised.values())
+        )
+        # The aliases of input dataframes are regenerated by the new pipeline
+        for p in planned[len(planned) - len(pipeline.queue) :]:
+            if p.name not in materialised:
+                new_pipeline.enqueue_sql(p.cte.sql, p.name)
+        return new_pipeline
+
+    def _parse(self, ctes: List[CTE], dialect: str) -> Optional[List[_PlannedCTE]]:
+        planned = []
+        for cte in ctes:
+            try:
+                tree = sqlglot.parse_one(cte.sql, read=dialect)
+            except ParseError:
+                logger.debug(
+                    f"Unable to parse SQL for {cte.output_table_name}, "
+                    "so pipeline will not be checked for repeated subplans"
+                )
+                return None
+            planned.append(_PlannedCTE(cte, tree, dialect))
+        return planned
+
+    def _assign_keys(self, planned: List[_PlannedCTE]) -> None:
+        keys_by_name: Dict[str, str] = {}
+        for p in planned:
+            dependency_keys = sorted(
+                f"{name}:{keys_by_name[name]}"
+                for name in set(p.table_references)
+                if name in keys_by_name
+            )
+            to_hash = "\n".join([p.normalised_sql] + dependency_keys)
+            p.key = hashlib.sha256(to_hash.encode("utf-8")).hexdigest()
+            keys_by_name[p.name] = p.key
+
+    def _deduplicate(self, planned: List[_PlannedCTE]) -> bool:
+        deduplicated = False
+        first_with_key: Dict[str, str] = {}
+        for p in planned[:-1]:
+            if p.is_trivial:
+                continue
+            if p.key in first_with_key:
+                original = first_with_key[p.key]
+                logger.debug(f"CTE {p.name} is identical to {original}, reusing it")
+                p.cte = CTE(f"select * from {original}", p.name)
+                p.normalised_sql = f"SELECT * FROM {original}"
+                p.table_references = [original]
+                deduplicated = True
+            else:
+                first_with_key[p.key] = p.name
+        return deduplicated
+
+    def _choose_tables_to_materialise(self, planned: List[_PlannedCTE]) -> set[str]:
+        reference_counts: Counter[str] = Counter()
+        for p in planned:
+            reference_counts.update(p.table_references)
+
+        to_materialise = set()
+        for p in planned[:-1]:
+            if p.is_trivial:
+                continue
+            if reference_counts[p.name] >= self.min_references:
+                logger.debug(
+                    f"Materialising {p.name}, which is read "
+                    f"{reference_counts[p.name]} times in the pipeline"
+                )
+                to_materialise.add(p.name)
+            elif self._seen[p.key] > 0:
+                logger.debug(
+                    f"Materialising {p.name}, which was computed by an earlier "
+                    "pipeline"
+                )
+                to_materialise.add(p.name)
+        return to_materialise
+
+    def _materialise(
+        self,
+        target: _PlannedCTE,
+        planned: List[_PlannedCTE],
+        materialised: Dict[str, SplinkDataFrame],
+        db_api: DatabaseAPISubClass,
+    ) -> SplinkDataFrame:
+        by_name = {p.name: p for p in planned}
+
+        # Collect the CTEs the target depends on, stopping at tables which have
+        # already been materialised
+        required = {target.name}
+        to_visit = [target]
+        while to_visit:
+            for name in to_visit.pop().table_references:
+                if name in by_name and name not in required:
+                    required.add(name)
+                    if name not in materialised:
+                        to_visit.append(by_name[name])
+
+        sub_pipeline = CTEPipeline(
+            input_dataframes=[df for n, df in materialised.items() if n in required]
+        )
+        for p in planned:
+            if p.name in required and p.name not in materialised:
+                sub_pipeline.enqueue_sql(p.cte.sql, p.name)
+
+        # Use the cache directly, since the sub pipeline needs no further planning
+        return db_api.sql_to_splink_dataframe_checking_cache(
+            sub_pipeline.generate_cte_pipeline_sql(), target.name
+        )
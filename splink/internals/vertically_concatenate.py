@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 import logging
-from typing import TYPE_CHECKING, Dict
+from typing import TYPE_CHECKING, Dict, Optional
 
 from splink.internals.input_column import InputColumn
 from splink.internals.pipeline import CTEPipeline
@@ -11,6 +11,9 @@ from .term_frequencies import compute_all_term_frequencies_sqls
 
 logger = logging.getLogger(__name__)
 
+ROW_KEY_COLUMN_NAME = "__splink__row_key"
+BLOCKING_KEY_COLUMN_PREFIX = "__splink__bk_"
+
 # https://stackoverflow.com/questions/39740632/python-type-hinting-without-cyclic-imports
 if TYPE_CHECKING:
     from splink.internals.linker import Linker
@@ -20,6 +23,8 @@ def vertically_concatenate_sql(
     input_tables: Dict[str, SplinkDataFrame],
     salting_required: bool,
     source_dataset_input_column: InputColumn = None,
+    blocking_key_columns: Optional[Dict[str, str]] = None,
+    row_key_sql: Optional[str] = None,
 ) -> str:
     """
     Using `input_tables`, create a single table with the columns and
@@ -33,6 +38,14 @@ def vertically_concatenate_sql(
     is created.  This is used to uniquely identify rows in the vertical concatenation.
     Without it, ID collisions would be possible leading to ambiguity e.g. if several
     of the input tables have the same ID.
+
+    `blocking_key_columns` maps SQL expressions to the names of hidden columns
+    to compute them in, so blocking rules can join on the precomputed values.
+
+    If `row_key_sql` is given, it is computed in the hidden integer column
+    __splink__row_key, which identifies rows more cheaply than the (composite)
+    unique id.  Unless it is a hash of the unique id, it is only consistent
+    within one materialisation of the table.
     """
 
     # Use column order from first table in dict
@@ -79,9 +92,75 @@ def vertically_concatenate_sql(
             from {df_obj.physical_name}
             """
 
+    if blocking_key_columns:
+        key_columns_sql = ", ".join(
+            f"{expression} as {column_name}"
+            for expression, column_name in blocking_key_columns.items()
+        )
+        sql = f"""
+        select *, {key_columns_sql}
+        from ({sql}) as __splink__df_concat_without_blocking_keys
+        """
+
+    if row_key_sql:
+        sql = f"""
+        select *, {row_key_sql} as {ROW_KEY_COLUMN_NAME}
+        from ({sql}) as __splink__df_concat_without_row_key
+        """
+
     return sql
 
 
+def is_hidden_column(column_name: str) -> bool:
+    """Whether a column of `__splink__df_concat(_with_tf)` is only for Splink's
+    internal use, so must not appear in the tables returned to the user"""
+    return column_name == ROW_KEY_COLUMN_NAME or column_name.startswith(
+        BLOCKING_KEY_COLUMN_PREFIX
+    )
+
+
+def visible_columns_sql(
+    splink_df: SplinkDataFrame, table_alias: Optional[str] = None
+) -> str:
+    """The columns of `splink_df` to select, excluding the hidden columns"""
+    prefix = f"{table_alias}." if table_alias else ""
+    return ", ".join(
+        f"{prefix}{c.name}"
+        for c in splink_df.columns
+        if not is_hidden_column(c.unquote().name)
+    )
+
+
+def _row_key_sql(linker: Linker) -> str:
+    uid_cols = linker._settings_obj.column_info_settings.unique_id_input_columns
+    return linker._db_api.sql_dialect.row_key_sql([c.name for c in uid_cols])
+
+
+def _check_row_key_is_unique(linker: Linker, nodes: SplinkDataFrame) -> None:
+    """If the row key is a hash, which may collide, record whether it is unique
+    in the metadata of `nodes`.  If it is not, the unique id columns are used"""
+    db_api = linker._db_api
+    if not db_api.sql_dialect.row_key_may_collide:
+        return
+
+    sql = f"""
+    select count(*) - count(distinct {ROW_KEY_COLUMN_NAME}) as collisions
+    from {nodes.physical_name}
+    """
+    pipeline = CTEPipeline()
+    pipeline.enqueue_sql(sql, "__splink__df_row_key_collisions")
+    collisions_df = db_api.sql_pipeline_to_splink_dataframe(pipeline, use_cache=False)
+    collisions = collisions_df.as_record_dict()[0]["collisions"]
+    collisions_df.drop_table_from_database_and_remove_from_cache()
+
+    if collisions > 0:
+        logger.info(
+            f"{collisions} records of {nodes.templated_name} share a row key, so "
+            "the unique id columns will be used to identify records"
+        )
+    nodes.metadata["row_key_is_unique"] = collisions == 0
+
+
 def enqueue_df_concat_with_tf(linker: Linker, pipeline: CTEPipeline) -> CTEPipeline:
     cache = linker._intermediate_table_cache
     if "__splink__df_concat_with_tf" in cache:
@@ -95,6 +174,7 @@ def enqueue_df_concat_with_tf(linker: Linker, pipeline: CTEPipeline) -> CTEPipel
         input_tables=linker._input_tables_dict,
         salting_required=linker._settings_obj.salting_required,
         source_dataset_input_column=sds_ic,
+        blocking_key_columns=linker._settings_obj._blocking_key_columns,
     )
     pipeline.enqueue_sql(sql, "__splink__df_concat")
 
@@ -117,6 +197,9 @@ def compute_df_concat_with_tf(linker: Linker, pipeline: CTEPipeline) -> SplinkDa
         input_tables=linker._input_tables_dict,
         salting_required=linker._settings_obj.salting_required,
         source_dataset_input_column=sds_ic,
+        blocking_key_columns=linker._settings_obj._blocking_key_columns,
+        # Row keys are only assigned to materialised tables, so they are stable
+        row_key_sql=_row_key_sql(linker),
     )
     pipeline.enqueue_sql(sql, "__splink__df_concat")
 
@@ -124,10 +207,39 @@ def compute_df_concat_with_tf(linker: Linker, pipeline: CTEPipeline) -> SplinkDa
     pipeline.enqueue_list_of_sqls(sqls)
 
     nodes_with_tf = db_api.sql_pipeline_to_splink_dataframe(pipeline)
+    _check_row_key_is_unique(linker, nodes_with_tf)
     cache["__splink__df_concat_with_tf"] = nodes_with_tf
     return nodes_with_tf
 
 
+def available_blocking_key_columns(
+    linker: Linker, nodes_with_tf: Optional[SplinkDataFrame] = None
+) -> Dict[str, str]:
+    """The blocking key columns of the settings which exist on
+    `__splink__df_concat_with_tf`.  They may not, for instance if the table was
+    registered with `register_table_input_nodes_concat_with_tf()`.
+
+    If `nodes_with_tf` is not given, it is the cached table or, if there is none,
+    the table computed by `enqueue_df_concat_with_tf()`
+    """
+    key_columns = linker._settings_obj._blocking_key_columns
+    if not key_columns:
+        return {}
+
+    if nodes_with_tf is None:
+        cache = linker._intermediate_table_cache
+        if "__splink__df_concat_with_tf" not in cache:
+            return key_columns
+        nodes_with_tf = cache["__splink__df_concat_with_tf"]
+
+    present = {c.unquote().name for c in nodes_with_tf.columns}
+    return {
+        expression: column_name
+        for expression, column_name in key_columns.items()
+        if column_name in present
+    }
+
+
 def enqueue_df_concat(linker: Linker, pipeline: CTEPipeline) -> CTEPipeline:
     cache = linker._intermediate_table_cache
 
@@ -150,6 +262,7 @@ def enqueue_df_concat(linker: Linker, pipeline: CTEPipeline) -> CTEPipeline:
         input_tables=linker._input_tables_dict,
         salting_required=linker._settings_obj.salting_required,
         source_dataset_input_column=sds_ic,
+        blocking_key_columns=linker._settings_obj._blocking_key_columns,
     )
     pipeline.enqueue_sql(sql, "__splink__df_concat")
 
@@ -173,10 +286,13 @@ def compute_df_concat(linker: Linker, pipeline: CTEPipeline) -> SplinkDataFrame:
         input_tables=linker._input_tables_dict,
         salting_required=linker._settings_obj.salting_required,
         source_dataset_input_column=sds_ic,
+        blocking_key_columns=linker._settings_obj._blocking_key_columns,
+        row_key_sql=_row_key_sql(linker),
     )
     pipeline.enqueue_sql(sql, "__splink__df_concat")
 
     nodes_with_tf = db_api.sql_pipeline_to_splink_dataframe(pipeline)
+    _check_row_key_is_unique(linker, nodes_with_tf)
     cache["__splink__df_concat"] = nodes_with_tf
     return nodes_with_tf
 
@@ -0,0 +1,69 @@
+import pandas as pd
+import pytest
+
+import splink.internals.comparison_library as cl
+from splink.internals.linker import Linker
+
+from .decorator import mark_with_dialects_excluding
+
+
+@mark_with_dialects_excluding()
+def test_agreement_pattern_lookup_matches_predict(test_helpers, dialect):
+    helper = test_helpers[dialect]
+    df = helper.load_frame_from_csv("./tests/datasets/fake_1000_from_splink_demos.csv")
+
+    settings = {
+        "link_type": "dedupe_only",
+        "comparisons": [
+            cl.ExactMatch("first_name"),
+            cl.LevenshteinAtThresholds("surname", [1, 2]),
+            cl.ExactMatch("dob"),
+            cl.ExactMatch("city").configure(
+                m_probabilities=[0.8, 0.2], u_probabilities=[0.1, 0.9]
+            ),
+        ],
+        "blocking_rules_to_generate_predictions": [
+            "l.surname = r.surname",
+            "l.dob = r.dob",
+        ],
+        "retain_intermediate_calculation_columns": True,
+    }
+    linker = Linker(df, settings, **helper.extra_linker_args())
+
+    sort_cols = ["unique_id_l", "unique_id_r"]
+    for threshold in [None, 0.5]:
+        results = []
+        for use_agreement_pattern_lookup, use_log2_match_weights in [
+            (False, False),
+            (True, False),
+            (True, True),
+        ]:
+            df_predict = linker.inference.predict(
+                threshold_match_probability=threshold,
+                use_agreement_pattern_lookup=use_agreement_pattern_lookup,
+                use_log2_match_weights=use_log2_match_weights,
+            ).as_pandas_dataframe()
+            results.append(df_predict.sort_values(sort_cols).reset_index(drop=True))
+
+        for result in results[1:]:
+            assert list(result.columns) == list(results[0].columns)
+            pd.testing.assert_frame_equal(result, results[0], check_dtype=False)
+
+
+@mark_with_dialects_excluding()
+def test_agreement_pattern_lookup_requires_no_tf_adjustments(test_helpers, dialect):
+    helper = test_helpers[dialect]
+    df = helper.load_frame_from_csv("./tests/datasets/fake_1000_from_splink_demos.csv")
+
+    settings = {
+        "link_type": "dedupe_only",
+        "comparisons": [
+            cl.ExactMatch("first_name").configure(term_frequency_adjustments=True),
+            cl.ExactMatch("surname"),
+        ],
+        "blocking_rules_to_generate_predictions": ["l.dob = r.dob"],
+    }
+    linker = Linker(df, settings, **helper.extra_linker_args())
+
+    with pytest.raises(ValueError, match="term frequency adjustments"):
+        linker.inference.predict(use_agreement_pattern_lookup=True)
@@ -1,6 +1,10 @@
 import duckdb
 import pandas as pd
+import pytest
 
+import splink.internals.blocking_analysis as blocking_analysis
+import splink.internals.comparison_library as cl
+import splink.internals.find_brs_with_comparison_counts_below_threshold as find_brs
 from splink.blocking_analysis import (
     count_comparisons_from_blocking_rule,
     cumulative_comparisons_to_be_scored_from_blocking_rules_chart,
@@ -8,8 +12,18 @@ from splink.blocking_analysis import (
     n_largest_blocks,
 )
 from splink.internals.blocking import BlockingRule
-from splink.internals.blocking_rule_library import CustomRule, Or, block_on
+from splink.internals.blocking_rule_library import (
+    CustomRule,
+    Or,
+    block_on,
+    sorted_neighbourhood,
+)
 from splink.internals.duckdb.database_api import DuckDBAPI
+from splink.internals.find_brs_with_comparison_counts_below_threshold import (
+    _comparison_counts_by_level,
+    _generate_blocking_rule,
+    _search_tree_for_blocking_rules_below_threshold_count,
+)
 
 from .decorator import mark_with_dialects_excluding, mark_with_dialects_including
 
@@ -814,3 +828,197 @@ def test_n_largest_blocks(test_helpers, dialect):
             ["key_0", "key_1"]
         ).reset_index(drop=True),
     )
+
+
+@mark_with_dialects_excluding()
+def test_sorted_neighbourhood_counts(test_helpers, dialect):
+    helper = test_helpers[dialect]
+    df = helper.load_frame_from_csv("./tests/datasets/fake_1000_from_splink_demos.csv")
+    n_non_null = len(
+        pd.read_csv("./tests/datasets/fake_1000_from_splink_demos.csv").dropna(
+            subset=["surname"]
+        )
+    )
+
+    db_api = helper.DatabaseAPI(**helper.db_api_args())
+    args = {"link_type": "dedupe_only", "db_api": db_api}
+
+    res_dict = count_comparisons_from_blocking_rule(
+        table_or_tables=df,
+        blocking_rule=sorted_neighbourhood("surname", window_size=5),
+        **args,
+    )
+    expected = n_non_null * 5 - 15
+    assert res_dict["number_of_comparisons_generated_pre_filter_conditions"] == (
+        expected
+    )
+    assert res_dict["number_of_comparisons_to_be_scored_post_filter_conditions"] == (
+        expected
+    )
+
+    res_dict = count_comparisons_from_blocking_rule(
+        table_or_tables=df,
+        blocking_rule=sorted_neighbourhood(
+            "surname", window_size=5, filter_condition="l.dob = r.dob"
+        ),
+        **args,
+    )
+    post_filter_count = res_dict[
+        "number_of_comparisons_to_be_scored_post_filter_conditions"
+    ]
+    assert 0 < post_filter_count < expected
+
+    blocking_rules = [
+        block_on("first_name"),
+        sorted_neighbourhood("surname", window_size=5),
+    ]
+    df_cumulative = cumulative_comparisons_to_be_scored_from_blocking_rules_data(
+        table_or_tables=df, blocking_rules=blocking_rules, **args
+    )
+    # The pairs of the sorted neighbourhood rule exclude those of block_on
+    assert df_cumulative["row_count"][1] < expected
+
+
+@mark_with_dialects_including("duckdb", "spark", pass_dialect=True)
+def test_approximate_counts(test_helpers, dialect):
+    helper = test_helpers[dialect]
+    df = helper.load_frame_from_csv("./tests/datasets/fake_1000_from_splink_demos.csv")
+
+    db_api = helper.DatabaseAPI(**helper.db_api_args())
+    args = {"table_or_tables": df, "link_type": "dedupe_only", "db_api": db_api}
+
+    for blocking_rule in [
+        block_on("first_name"),
+        block_on("surname", "dob"),
+        "l.first_name = r.first_name and levenshtein(l.surname, r.surname) < 3",
+    ]:
+        exact = count_comparisons_from_blocking_rule(
+            blocking_rule=blocking_rule, **args
+        )
+        approx = count_comparisons_from_blocking_rule(
+            blocking_rule=blocking_rule, approximate=True, sample_fraction=0.5, **args
+        )
+
+        # Count-min sketches only ever overestimate
+        key = "number_of_comparisons_generated_pre_filter_conditions"
+        assert exact[key] <= approx[key] <= exact[key] + approx[f"{key}_error_bound"]
+
+        key = "number_of_comparisons_to_be_scored_post_filter_conditions"
+        standard_error = approx[f"{key}_standard_error"]
+        assert abs(approx[key] - exact[key]) <= 4 * standard_error + 1
+
+    with pytest.raises(ValueError):
+        count_comparisons_from_blocking_rule(
+            blocking_rule="1=1", approximate=True, **args
+        )
+
+
+@mark_with_dialects_excluding("sqlite")
+def test_find_blocking_rules_below_threshold_batched_counts(test_helpers, dialect):
+    helper = test_helpers[dialect]
+    df = helper.load_frame_from_csv("./tests/datasets/fake_1000_from_splink_demos.csv")
+    columns = ["first_name", "surname", "dob", "city"]
+    settings = {
+        "link_type": "dedupe_only",
+        "comparisons": [cl.ExactMatch(c) for c in columns],
+    }
+    linker = helper.Linker(df, settings, **helper.extra_linker_args())
+
+    comparison_counts = _comparison_counts_by_level(linker, columns, 3000)
+    for combination, count in comparison_counts.items():
+        br = _generate_blocking_rule(linker._db_api, list(combination))
+        expected = count_comparisons_from_blocking_rule(
+            table_or_tables=df,
+            blocking_rule=br.blocking_rule_sql,
+            link_type="dedupe_only",
+            db_api=linker._db_api,
+            compute_post_filter_count=False,
+        )["number_of_comparisons_generated_pre_filter_conditions"]
+        assert count == expected
+
+    batched = _search_tree_for_blocking_rules_below_threshold_count(
+        linker, columns, 3000, comparison_counts=comparison_counts
+    )
+    unbatched = _search_tree_for_blocking_rules_below_threshold_count(
+        linker, columns, 3000
+    )
+    assert [r["blocking_columns_sanitised"] for r in batched] == [
+        r["blocking_columns_sanitised"] for r in unbatched
+    ]
+
+
+@mark_with_dialects_excluding("sqlite")
+def test_pair_free_cumulative_counts(test_helpers, dialect, monkeypatch):
+    helper = test_helpers[dialect]
+    db_api = helper.DatabaseAPI(**helper.db_api_args())
+    df = pd.read_csv("./tests/datasets/fake_1000_from_splink_demos.csv")
+
+    blocking_rules = [
+        block_on("first_name"),
+        block_on("surname"),
+        block_on("dob", "city"),
+        block_on("substr(surname, 1, 2)", "dob"),
+        "1=1",
+    ]
+    for tables, link_type in [
+        (df, "dedupe_only"),
+        ([df[df["unique_id"] % 3 == i] for i in range(2)], "link_only"),
+        ([df[df["unique_id"] % 3 == i] for i in range(3)], "link_only"),
+        ([df[df["unique_id"] % 3 == i] for i in range(2)], "link_and_dedupe"),
+    ]:
+        args = {
+            "table_or_tables": tables,
+            "blocking_rules": blocking_rules,
+            "link_type": link_type,
+            "db_api": db_api,
+        }
+        with monkeypatch.context() as m:
+            m.setattr(
+                blocking_analysis,
+                "_marginal_key_sets_by_inclusion_exclusion",
+                lambda blocking_rules: None,
+            )
+            from_pairs = cumulative_comparisons_to_be_scored_from_blocking_rules_data(
+                **args
+            )
+        pair_free = cumulative_comparisons_to_be_scored_from_blocking_rules_data(**args)
+        pd.testing.assert_frame_equal(pair_free, from_pairs)
+
+
+@mark_with_dialects_excluding("sqlite")
+def test_find_blocking_rules_batched_counts_respect_max_results(
+    test_helpers, dialect, monkeypatch
+):
+    helper = test_helpers[dialect]
+    df = helper.load_frame_from_csv("./tests/datasets/fake_1000_from_splink_demos.csv")
+    columns = ["first_name", "surname", "dob", "city"]
+    settings = {
+        "link_type": "dedupe_only",
+        "comparisons": [cl.ExactMatch(c) for c in columns],
+    }
+    linker = helper.Linker(df, settings, **helper.extra_linker_args())
+
+    all_counts = _comparison_counts_by_level(linker, columns, 3000)
+
+    # Splitting a level over several queries gives the same counts
+    monkeypatch.setattr(find_brs, "MAX_GROUPING_SETS_PER_QUERY", 2)
+    assert _comparison_counts_by_level(linker, columns, 3000) == all_counts
+
+    # Levels beyond the one where max_results is reached are not counted, and
+    # the search counts any combinations it needs which are missing
+    limited_counts = _comparison_counts_by_level(linker, columns, 6000, max_results=1)
+    assert max(len(c) for c in limited_counts) == 1
+    assert len(limited_counts) < len(all_counts)
+
+    batched = _search_tree_for_blocking_rules_below_threshold_count(
+        linker, columns, 6000, max_results=2, comparison_counts=limited_counts
+    )
+    unbatched = _search_tree_for_blocking_rules_below_threshold_count(
+        linker, columns, 6000, max_results=2
+    )
+    assert [r["blocking_columns_sanitised"] for r in batched] == [
+        r["blocking_columns_sanitised"] for r in unbatched
+    ]
+    assert [r["comparison_count"] for r in batched] == [
+        r["comparison_count"] for r in unbatched
+    ]
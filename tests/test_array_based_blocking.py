@@ -3,6 +3,11 @@ import random
 import pandas as pd
 
 import splink.internals.comparison_library as cl
+from splink.blocking_analysis import count_comparisons_from_blocking_rule
+from splink.internals.blocking import materialise_exploded_id_tables
+from splink.internals.blocking_rule_library import minhash_lsh
+from splink.internals.pipeline import CTEPipeline
+from splink.internals.vertically_concatenate import compute_df_concat_with_tf
 from tests.decorator import mark_with_dialects_including
 
 
@@ -53,6 +58,138 @@ def test_simple_example_link_only(test_helpers, dialect):
     assert expected_triples == returned_triples
 
 
+@mark_with_dialects_including("duckdb", "spark", pass_dialect=True)
+def test_exploding_rules_sharing_arrays(test_helpers, dialect):
+    data = pd.DataFrame.from_dict(
+        [
+            {"unique_id": 1, "gender": "m", "postcode": ["2612", "2000"]},
+            {"unique_id": 2, "gender": "m", "postcode": ["2612", "2617"]},
+            {"unique_id": 3, "gender": "f", "postcode": ["2617"]},
+            {"unique_id": 4, "gender": "m", "postcode": ["2617", "2600"]},
+            {"unique_id": 5, "gender": "f", "postcode": ["2000"]},
+        ]
+    )
+    helper = test_helpers[dialect]
+    settings = {
+        "link_type": "dedupe_only",
+        "blocking_rules_to_generate_predictions": [
+            {
+                "blocking_rule": "l.gender = r.gender and l.postcode = r.postcode",
+                "arrays_to_explode": ["postcode"],
+            },
+            {
+                "blocking_rule": "l.postcode = r.postcode",
+                "arrays_to_explode": ["postcode"],
+            },
+            "l.gender = r.gender",
+        ],
+        "comparisons": [cl.ArrayIntersectAtSizes("postcode", [1])],
+    }
+    linker = helper.Linker(data, settings, **helper.extra_linker_args())
+    df = linker.inference.predict().as_pandas_dataframe()
+    returned_triples = set(zip(df.unique_id_l, df.unique_id_r, df.match_key))
+    expected_triples = {
+        (1, 2, "0"),
+        (2, 4, "0"),
+        (1, 5, "1"),
+        (2, 3, "1"),
+        (3, 4, "1"),
+        (1, 4, "2"),
+        (3, 5, "2"),
+    }
+    assert expected_triples == returned_triples
+
+    # The rules share one materialised unnested table
+    templated_names = list(linker._db_api.execution_stats()["templated_name"])
+    assert templated_names.count("__splink__df_concat_unnested") == 1
+
+    # An unnested table used by a single rule is not materialised
+    settings["blocking_rules_to_generate_predictions"] = [
+        {
+            "blocking_rule": "l.postcode = r.postcode",
+            "arrays_to_explode": ["postcode"],
+        },
+        "l.gender = r.gender",
+    ]
+    linker = helper.Linker(data, settings, **helper.extra_linker_args())
+    df = linker.inference.predict().as_pandas_dataframe()
+    assert len(df) == 7
+    templated_names = list(linker._db_api.execution_stats()["templated_name"])
+    assert "__splink__df_concat_unnested" not in templated_names
+
+
+@mark_with_dialects_including("duckdb", pass_dialect=True)
+def test_exploded_id_pairs_keyed_on_row_keys(test_helpers, dialect):
+    data = pd.DataFrame.from_dict(
+        [
+            {"unique_id": 1, "gender": "m", "postcode": ["2612", "2000"]},
+            {"unique_id": 2, "gender": "m", "postcode": ["2612", "2617"]},
+            {"unique_id": 3, "gender": "f", "postcode": ["2617"]},
+            {"unique_id": 4, "gender": "m", "postcode": ["2617", "2600"]},
+            {"unique_id": 5, "gender": "f", "postcode": ["2000"]},
+        ]
+    )
+    helper = test_helpers[dialect]
+    settings = {
+        "link_type": "dedupe_only",
+        "blocking_rules_to_generate_predictions": [
+            {
+                "blocking_rule": "l.gender = r.gender and l.postcode = r.postcode",
+                "arrays_to_explode": ["postcode"],
+            },
+            {
+                "blocking_rule": "l.postcode = r.postcode",
+                "arrays_to_explode": ["postcode"],
+            },
+        ],
+        "comparisons": [cl.ArrayIntersectAtSizes("postcode", [1])],
+    }
+    linker = helper.Linker(data, settings, **helper.extra_linker_args())
+    settings_obj = linker._settings_obj
+    column_info = settings_obj.column_info_settings
+    nodes_with_tf = compute_df_concat_with_tf(linker, CTEPipeline())
+
+    def exploded_id_pairs(nodes_with_tf):
+        brs = materialise_exploded_id_tables(
+            link_type="dedupe_only",
+            blocking_rules=settings_obj._blocking_rules_to_generate_predictions,
+            db_api=linker._db_api,
+            splink_df_dict=linker._input_tables_dict,
+            source_dataset_input_column=column_info.source_dataset_input_column,
+            unique_id_input_column=column_info.unique_id_input_column,
+            nodes_with_tf=nodes_with_tf,
+        )
+        tables = [br.exploded_id_pair_table.as_pandas_dataframe() for br in brs]
+        [br.drop_materialised_id_pairs_dataframe() for br in brs]
+        return tables
+
+    keyed_tables = exploded_id_pairs(nodes_with_tf)
+    assert "__splink__row_key_l" in keyed_tables[1].columns
+
+    # Pairs of the preceding rule are excluded on their row keys, giving the
+    # same pairs as comparing unique ids
+    uid_tables = exploded_id_pairs(None)
+    assert "__splink__row_key_l" not in uid_tables[1].columns
+    for keyed, by_uid in zip(keyed_tables, uid_tables):
+        assert set(zip(keyed.unique_id_l, keyed.unique_id_r)) == set(
+            zip(by_uid.unique_id_l, by_uid.unique_id_r)
+        )
+    assert set(zip(keyed_tables[1].unique_id_l, keyed_tables[1].unique_id_r)) == {
+        (1, 5),
+        (2, 3),
+        (3, 4),
+    }
+
+    df = linker.inference.predict().as_pandas_dataframe()
+    assert set(zip(df.unique_id_l, df.unique_id_r, df.match_key)) == {
+        (1, 2, "0"),
+        (2, 4, "0"),
+        (1, 5, "1"),
+        (2, 3, "1"),
+        (3, 4, "1"),
+    }
+
+
 def generate_array_based_datasets_helper(
     n_rows=1000, n_array_based_columns=3, n_distinct_values=1000, array_size=3, seed=1
 ):
@@ -256,3 +393,82 @@ def test_link_only_unique_id_ambiguity(test_helpers, dialect):
 
     all_tuples = rule1_tuples.union(rule2_tuples)
     assert actual_triples == all_tuples
+
+
+@mark_with_dialects_including("duckdb", "spark", pass_dialect=True)
+def test_minhash_lsh_blocking(test_helpers, dialect):
+    helper = test_helpers[dialect]
+    df = pd.DataFrame.from_dict(
+        [
+            {"unique_id": 1, "tokens": ["a", "b", "c", "d"], "address": "1 high st"},
+            {
+                "unique_id": 2,
+                "tokens": ["a", "b", "c", "d"],
+                "address": "1 high street",
+            },
+            {"unique_id": 3, "tokens": ["w", "x", "y", "z"], "address": "22 low road"},
+            {"unique_id": 4, "tokens": ["e", "f", None], "address": None},
+            {"unique_id": 5, "tokens": [], "address": "mill lane"},
+        ]
+    )
+
+    settings = {
+        "link_type": "dedupe_only",
+        "blocking_rules_to_generate_predictions": [
+            minhash_lsh("tokens", bands=20, rows=2),
+            minhash_lsh("address", bands=20, rows=2, ngram_size=3),
+        ],
+        "comparisons": [cl.ExactMatch("address")],
+    }
+    linker = helper.Linker(df, settings, **helper.extra_linker_args())
+    df_predict = linker.inference.predict().as_pandas_dataframe()
+
+    # Records with the same tokens are always compared, and records with no
+    # tokens in common are never compared.  The addresses are similar enough
+    # to be compared with very high probability
+    returned_triples = set(
+        zip(df_predict.unique_id_l, df_predict.unique_id_r, df_predict.match_key)
+    )
+    assert returned_triples == {(1, 2, "0")}
+
+    db_api = helper.DatabaseAPI(**helper.db_api_args())
+    res = count_comparisons_from_blocking_rule(
+        table_or_tables=df,
+        blocking_rule=minhash_lsh("address", bands=20, rows=2, ngram_size=3),
+        link_type="dedupe_only",
+        db_api=db_api,
+    )
+    assert res["number_of_comparisons_to_be_scored_post_filter_conditions"] == 1
+
+
+@mark_with_dialects_including("duckdb", "spark", pass_dialect=True)
+def test_minhash_lsh_blocking_null_and_empty_values(test_helpers, dialect):
+    helper = test_helpers[dialect]
+    df = pd.DataFrame.from_dict(
+        [
+            {"unique_id": 1, "tokens": None, "address": None},
+            {"unique_id": 2, "tokens": None, "address": None},
+            {"unique_id": 3, "tokens": [], "address": ""},
+            {"unique_id": 4, "tokens": [], "address": ""},
+            {"unique_id": 5, "tokens": [None], "address": None},
+            {"unique_id": 6, "tokens": [None, None], "address": ""},
+            {"unique_id": 7, "tokens": ["a", "b"], "address": "1 high st"},
+            {"unique_id": 8, "tokens": ["a", "b"], "address": "1 high st"},
+        ]
+    )
+
+    for blocking_rule in [
+        minhash_lsh("tokens", bands=20, rows=2),
+        minhash_lsh("address", bands=20, rows=2, ngram_size=3),
+    ]:
+        settings = {
+            "link_type": "dedupe_only",
+            "blocking_rules_to_generate_predictions": [blocking_rule],
+            "comparisons": [cl.ExactMatch("address")],
+        }
+        linker = helper.Linker(df, settings, **helper.extra_linker_args())
+        df_predict = linker.inference.predict().as_pandas_dataframe()
+
+        # Null and empty values have no tokens, so are never compared
+        pairs = set(zip(df_predict.unique_id_l, df_predict.unique_id_r))
+        assert pairs == {(7, 8)}
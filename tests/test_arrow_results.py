@@ -0,0 +1,127 @@
+import pandas as pd
+import pyarrow as pa
+import pytest
+
+import splink.internals.comparison_library as cl
+from splink.internals.linker import Linker
+from splink.internals.pipeline import CTEPipeline
+
+from .decorator import mark_with_dialects_excluding
+
+settings = {
+    "link_type": "dedupe_only",
+    "comparisons": [cl.ExactMatch("first_name"), cl.ExactMatch("surname")],
+    "blocking_rules_to_generate_predictions": ["l.dob = r.dob"],
+}
+
+
+@mark_with_dialects_excluding()
+def test_as_arrow_matches_as_pandas_dataframe(dialect, test_helpers):
+    helper = test_helpers[dialect]
+    df = helper.load_frame_from_csv("./tests/datasets/fake_1000_from_splink_demos.csv")
+
+    linker = Linker(df, settings, helper.DatabaseAPI(**helper.db_api_args()))
+    linker.training.estimate_parameters_using_expectation_maximisation(
+        "l.email = r.email"
+    )
+    df_predict = linker.inference.predict()
+
+    arrow_table = df_predict.as_arrow()
+    assert isinstance(arrow_table, pa.Table)
+
+    sort_cols = ["unique_id_l", "unique_id_r"]
+    expected = df_predict.as_pandas_dataframe().sort_values(sort_cols)
+    actual = arrow_table.to_pandas().sort_values(sort_cols)
+    assert list(actual.columns) == list(expected.columns)
+    pd.testing.assert_frame_equal(
+        actual.reset_index(drop=True),
+        expected.reset_index(drop=True),
+        check_dtype=False,
+    )
+
+    assert df_predict.as_arrow(limit=3).num_rows == 3
+
+
+@mark_with_dialects_excluding()
+def test_as_polars(dialect, test_helpers):
+    pl = pytest.importorskip("polars")
+    helper = test_helpers[dialect]
+    df = helper.load_frame_from_csv("./tests/datasets/fake_1000_from_splink_demos.csv")
+
+    linker = Linker(df, settings, helper.DatabaseAPI(**helper.db_api_args()))
+    df_predict = linker.inference.predict()
+
+    df_polars = df_predict.as_polars(limit=5)
+    assert isinstance(df_polars, pl.DataFrame)
+    assert df_polars.height == 5
+
+
+@mark_with_dialects_excluding()
+def test_iter_batches(dialect, test_helpers):
+    helper = test_helpers[dialect]
+    df = helper.load_frame_from_csv("./tests/datasets/fake_1000_from_splink_demos.csv")
+
+    linker = Linker(df, settings, helper.DatabaseAPI(**helper.db_api_args()))
+    df_predict = linker.inference.predict()
+
+    sort_cols = ["unique_id_l", "unique_id_r"]
+    expected = df_predict.as_pandas_dataframe().sort_values(sort_cols)
+    expected = expected.reset_index(drop=True)
+
+    batches = list(df_predict.iter_batches(batch_size=500))
+    assert all(isinstance(b, pa.RecordBatch) for b in batches)
+    assert all(b.num_rows <= 500 for b in batches)
+    actual = pa.Table.from_batches(batches).to_pandas().sort_values(sort_cols)
+    pd.testing.assert_frame_equal(
+        actual.reset_index(drop=True), expected, check_dtype=False
+    )
+
+    chunks = list(df_predict.iter_batches(batch_size=500, output_type="pandas"))
+    assert all(isinstance(c, pd.DataFrame) for c in chunks)
+    assert sum(len(c) for c in chunks) == len(expected)
+    actual = pd.concat(chunks).sort_values(sort_cols)
+    pd.testing.assert_frame_equal(
+        actual.reset_index(drop=True), expected, check_dtype=False
+    )
+
+    with pytest.raises(ValueError):
+        df_predict.iter_batches(output_type="numpy")
+
+
+@mark_with_dialects_excluding()
+def test_iter_batches_schema_with_leading_nulls(dialect, test_helpers):
+    helper = test_helpers[dialect]
+    db_api = helper.DatabaseAPI(**helper.db_api_args())
+
+    records = [{"id": i, "x": i} for i in range(10)]
+    input_table = db_api.register_table(records, "__splink__leading_nulls_input")
+    pipeline = CTEPipeline([input_table])
+    sql = """
+    select
+        id,
+        case when id < 5 then null else x end as int_value,
+        case when id < 5 then null when id < 8 then x else x * 0.5 end
+            as mixed_value,
+        case when id < 5 then null else 'a' end as str_value
+    from __splink__leading_nulls_input
+    order by id
+    """
+    pipeline.enqueue_sql(sql, "__splink__leading_nulls")
+    table = db_api.sql_pipeline_to_splink_dataframe(pipeline)
+
+    # Every batch has the same schema, although the values of the first are null
+    batches = list(table.iter_batches(batch_size=3))
+    assert len(batches) == 4
+    assert all(b.schema == batches[0].schema for b in batches)
+    assert all(not pa.types.is_null(t) for t in batches[0].schema.types)
+
+    actual = pa.Table.from_batches(batches).to_pandas().sort_values("id")
+    assert actual["str_value"].isna().sum() == 5
+    assert list(actual["int_value"].dropna()) == [5, 6, 7, 8, 9]
+    assert list(actual["mixed_value"].dropna().astype(float)) == [
+        5.0,
+        6.0,
+        7.0,
+        4.0,
+        4.5,
+    ]
@@ -1,8 +1,24 @@
-from splink.internals.blocking import BlockingRule, blocking_rule_to_obj
-from splink.internals.blocking_rule_library import block_on
+import pandas as pd
+import pytest
+
+from splink.internals.blocking import (
+    BlockingRule,
+    SortedNeighbourhoodBlockingRule,
+    _choose_deduplication_strategy,
+    block_using_rules_sqls,
+    blocking_rule_to_obj,
+)
+from splink.internals.blocking_rule_library import block_on, sorted_neighbourhood
 from splink.internals.input_column import _get_dialect_quotes
 from splink.internals.linker import Linker
+from splink.internals.linker_components import clustering, inference
+from splink.internals.pipeline import CTEPipeline
 from splink.internals.settings_creator import SettingsCreator
+from splink.internals.vertically_concatenate import (
+    ROW_KEY_COLUMN_NAME,
+    available_blocking_key_columns,
+    compute_df_concat_with_tf,
+)
 
 from .basic_settings import get_settings_dict
 from .decorator import mark_with_dialects_excluding
@@ -73,3 +89,311 @@ def test_simple_end_to_end(test_helpers, dialect):
     linker.training.estimate_parameters_using_expectation_maximisation(block_on("dob"))
 
     linker.inference.predict()
+
+
+@mark_with_dialects_excluding()
+def test_deduplication_strategies_generate_same_pairs(test_helpers, dialect):
+    helper = test_helpers[dialect]
+    df = helper.load_frame_from_csv("./tests/datasets/fake_1000_from_splink_demos.csv")
+
+    settings = get_settings_dict()
+    settings["blocking_rules_to_generate_predictions"] = [
+        block_on("first_name"),
+        block_on("surname"),
+        block_on("dob"),
+        "l.city = r.city and substr(l.first_name, 1, 1) = substr(r.first_name, 1, 1)",
+        block_on("email"),
+    ]
+    linker = Linker(df, settings, **helper.extra_linker_args())
+    settings_obj = linker._settings_obj
+    blocking_rules = settings_obj._blocking_rules_to_generate_predictions
+    assert _choose_deduplication_strategy(blocking_rules) == "group_by"
+    assert _choose_deduplication_strategy(blocking_rules[:3]) == (
+        "exclude_preceding_rules"
+    )
+
+    df_concat_with_tf = compute_df_concat_with_tf(linker, CTEPipeline())
+
+    results = {}
+    for strategy in ["exclude_preceding_rules", "group_by"]:
+        pipeline = CTEPipeline([df_concat_with_tf])
+        sqls = block_using_rules_sqls(
+            input_tablename_l="__splink__df_concat_with_tf",
+            input_tablename_r="__splink__df_concat_with_tf",
+            blocking_rules=blocking_rules,
+            link_type=settings_obj._link_type,
+            source_dataset_input_column=settings_obj.column_info_settings.source_dataset_input_column,
+            unique_id_input_column=settings_obj.column_info_settings.unique_id_input_column,
+            deduplication_strategy=strategy,
+        )
+        pipeline.enqueue_list_of_sqls(sqls)
+        pairs = linker._db_api.sql_pipeline_to_splink_dataframe(pipeline)
+        results[strategy] = (
+            pairs.as_pandas_dataframe()
+            .sort_values(["join_key_l", "join_key_r"])
+            .reset_index(drop=True)
+        )
+
+    assert results["group_by"]["match_key"].nunique() == len(blocking_rules)
+    pd.testing.assert_frame_equal(
+        results["group_by"], results["exclude_preceding_rules"], check_dtype=False
+    )
+
+
+@mark_with_dialects_excluding()
+def test_predict_deduplication_strategy(test_helpers, dialect):
+    helper = test_helpers[dialect]
+    df = helper.load_frame_from_csv("./tests/datasets/fake_1000_from_splink_demos.csv")
+
+    settings = get_settings_dict()
+    settings["blocking_rules_to_generate_predictions"] = [
+        block_on("first_name"),
+        block_on("surname"),
+        block_on("dob"),
+    ]
+    linker = Linker(df, settings, **helper.extra_linker_args())
+
+    results = {}
+    for strategy in ["exclude_preceding_rules", "group_by"]:
+        predictions = linker.inference.predict(deduplication_strategy=strategy)
+        results[strategy] = (
+            predictions.as_pandas_dataframe()
+            .sort_values(["unique_id_l", "unique_id_r"])
+            .reset_index(drop=True)
+        )
+
+    pd.testing.assert_frame_equal(
+        results["group_by"], results["exclude_preceding_rules"], check_dtype=False
+    )
+
+    with pytest.raises(ValueError, match="deduplication_strategy"):
+        linker.inference.predict(deduplication_strategy="distinct")
+
+
+@mark_with_dialects_excluding()
+def test_blocking_key_columns_generate_same_pairs(test_helpers, dialect):
+    helper = test_helpers[dialect]
+    df = helper.load_frame_from_csv("./tests/datasets/fake_1000_from_splink_demos.csv")
+
+    settings = get_settings_dict()
+    settings["blocking_rules_to_generate_predictions"] = [
+        "substr(l.first_name, 1, 2) = substr(r.first_name, 1, 2)",
+        "l.city = r.city and substr(l.surname, 1, 3) = substr(r.surname, 1, 3)",
+        block_on("dob"),
+    ]
+    linker = Linker(df, settings, **helper.extra_linker_args())
+    settings_obj = linker._settings_obj
+    blocking_rules = settings_obj._blocking_rules_to_generate_predictions
+
+    key_columns = settings_obj._blocking_key_columns
+    # city is a plain column, and dob is blocked on directly
+    assert len(key_columns) == 2
+
+    df_concat_with_tf = compute_df_concat_with_tf(linker, CTEPipeline())
+    assert available_blocking_key_columns(linker, df_concat_with_tf) == key_columns
+
+    results = []
+    for blocking_key_columns in [None, key_columns]:
+        pipeline = CTEPipeline([df_concat_with_tf])
+        sqls = block_using_rules_sqls(
+            input_tablename_l="__splink__df_concat_with_tf",
+            input_tablename_r="__splink__df_concat_with_tf",
+            blocking_rules=blocking_rules,
+            link_type=settings_obj._link_type,
+            source_dataset_input_column=settings_obj.column_info_settings.source_dataset_input_column,
+            unique_id_input_column=settings_obj.column_info_settings.unique_id_input_column,
+            blocking_key_columns=blocking_key_columns,
+        )
+        if blocking_key_columns:
+            assert "__splink__bk_" in sqls[0]["sql"]
+        pipeline.enqueue_list_of_sqls(sqls)
+        pairs = linker._db_api.sql_pipeline_to_splink_dataframe(pipeline)
+        results.append(
+            pairs.as_pandas_dataframe()
+            .sort_values(["join_key_l", "join_key_r"])
+            .reset_index(drop=True)
+        )
+
+    pd.testing.assert_frame_equal(*results, check_dtype=False)
+
+    # Blocking on the key columns is transparent to predict
+    df_predict = linker.inference.predict().as_pandas_dataframe()
+    assert len(df_predict) == len(results[0])
+
+
+@mark_with_dialects_excluding()
+def test_hidden_columns_not_in_clustering_output(test_helpers, dialect):
+    helper = test_helpers[dialect]
+    df = helper.load_frame_from_csv("./tests/datasets/fake_1000_from_splink_demos.csv")
+
+    settings = get_settings_dict()
+    settings["blocking_rules_to_generate_predictions"] = [
+        "substr(l.first_name, 1, 2) = substr(r.first_name, 1, 2)",
+    ]
+    linker = Linker(df, settings, **helper.extra_linker_args())
+    assert len(linker._settings_obj._blocking_key_columns) == 1
+
+    df_concat_with_tf = compute_df_concat_with_tf(linker, CTEPipeline())
+    nodes_columns = [c.unquote().name for c in df_concat_with_tf.columns]
+    assert any(c.startswith("__splink__bk_") for c in nodes_columns)
+    assert ROW_KEY_COLUMN_NAME in nodes_columns
+
+    df_predict = linker.inference.predict()
+    df_clustered = linker.clustering.cluster_pairwise_predictions_at_threshold(
+        df_predict, 0.95
+    )
+    expected_columns = ["cluster_id"] + [
+        c for c in nodes_columns if not c.startswith("__splink__")
+    ]
+    assert [c.unquote().name for c in df_clustered.columns] == expected_columns
+
+
+@mark_with_dialects_excluding()
+def test_sorted_neighbourhood_blocking(test_helpers, dialect):
+    helper = test_helpers[dialect]
+    df = helper.load_frame_from_csv("./tests/datasets/fake_1000_from_splink_demos.csv")
+
+    window_size = 3
+    settings = get_settings_dict()
+    settings["blocking_rules_to_generate_predictions"] = [
+        sorted_neighbourhood("surname", "first_name", window_size=window_size),
+        block_on("dob"),
+    ]
+    linker = Linker(df, settings, **helper.extra_linker_args())
+    blocking_rules = linker._settings_obj._blocking_rules_to_generate_predictions
+
+    sn_br = blocking_rules[0]
+    assert isinstance(sn_br, SortedNeighbourhoodBlockingRule)
+    assert isinstance(blocking_rule_to_obj(sn_br.as_dict()), type(sn_br))
+    assert _choose_deduplication_strategy(blocking_rules) == "group_by"
+
+    df_predict = linker.inference.predict().as_pandas_dataframe()
+    pairs = set(zip(df_predict["unique_id_l"], df_predict["unique_id_r"]))
+    assert len(pairs) == len(df_predict)
+
+    # Each record is paired with the window_size records which follow it
+    df_pd = pd.read_csv("./tests/datasets/fake_1000_from_splink_demos.csv")
+    df_pd = df_pd.dropna(subset=["surname", "first_name"]).sort_values(
+        ["surname", "first_name", "unique_id"]
+    )
+    ids = list(df_pd["unique_id"])
+    expected_sn_pairs = {
+        (min(ids[i], ids[j]), max(ids[i], ids[j]))
+        for i in range(len(ids))
+        for j in range(i + 1, min(i + window_size + 1, len(ids)))
+    }
+    sn_pairs = df_predict[df_predict["match_key"] == "0"]
+    assert set(zip(sn_pairs["unique_id_l"], sn_pairs["unique_id_r"])) == (
+        expected_sn_pairs
+    )
+    assert len(expected_sn_pairs) == len(ids) * window_size - 6
+
+
+@mark_with_dialects_excluding()
+def test_row_key_generates_same_predictions(test_helpers, dialect, monkeypatch):
+    helper = test_helpers[dialect]
+    df = pd.read_csv("./tests/datasets/fake_1000_from_splink_demos.csv")
+    # unique_id is only unique within each source dataset
+    df_l = df[df["unique_id"] % 2 == 0].copy()
+    df_r = df[df["unique_id"] % 2 == 1].copy()
+    df_r["unique_id"] = df_r["unique_id"] - 1
+
+    settings = get_settings_dict()
+    settings["link_type"] = "link_and_dedupe"
+    settings["blocking_rules_to_generate_predictions"] = [
+        block_on("surname", salting_partitions=2),
+        "l.first_name = r.first_name and l.dob = r.dob",
+    ]
+    linker = Linker(
+        [helper.convert_frame(df_l), helper.convert_frame(df_r)],
+        settings,
+        **helper.extra_linker_args(),
+    )
+    blocking_rules = linker._settings_obj._blocking_rules_to_generate_predictions
+
+    df_concat_with_tf = compute_df_concat_with_tf(linker, CTEPipeline())
+    row_key_column = inference.available_row_key_column(
+        df_concat_with_tf, blocking_rules
+    )
+    assert row_key_column is not None
+    assert row_key_column.unquote().name == ROW_KEY_COLUMN_NAME
+
+    sort_cols = ["source_dataset_l", "unique_id_l", "source_dataset_r", "unique_id_r"]
+    results = []
+    for use_row_key in [True, False]:
+        with monkeypatch.context() as m:
+            if not use_row_key:
+                m.setattr(
+                    inference,
+                    "available_row_key_column",
+                    lambda nodes_with_tf, blocking_rules: None,
+                )
+            df_predict = linker.inference.predict().as_pandas_dataframe()
+        results.append(df_predict.sort_values(sort_cols).reset_index(drop=True))
+
+    assert ROW_KEY_COLUMN_NAME not in results[0].columns
+    pd.testing.assert_frame_equal(*results, check_dtype=False)
+
+
+@mark_with_dialects_excluding()
+def test_row_key_generates_same_clusters(test_helpers, dialect, monkeypatch):
+    helper = test_helpers[dialect]
+    df = pd.read_csv("./tests/datasets/fake_1000_from_splink_demos.csv")
+    df_l = df[df["unique_id"] % 2 == 0].copy()
+    df_r = df[df["unique_id"] % 2 == 1].copy()
+    df_r["unique_id"] = df_r["unique_id"] - 1
+
+    settings = get_settings_dict()
+    settings["link_type"] = "link_and_dedupe"
+    linker = Linker(
+        [helper.convert_frame(df_l), helper.convert_frame(df_r)],
+        settings,
+        **helper.extra_linker_args(),
+    )
+    df_predict = linker.inference.predict()
+
+    sort_cols = ["source_dataset", "unique_id"]
+    results = []
+    for use_row_key in [True, False]:
+        with monkeypatch.context() as m:
+            if not use_row_key:
+                m.setattr(
+                    clustering,
+                    "available_row_key_column",
+                    lambda nodes_with_tf, blocking_rules: None,
+                )
+            df_clustered = linker.clustering.cluster_pairwise_predictions_at_threshold(
+                df_predict, 0.9
+            ).as_pandas_dataframe()
+        results.append(df_clustered.sort_values(sort_cols).reset_index(drop=True))
+
+    assert results[0]["cluster_id"].nunique() < len(results[0])
+    pd.testing.assert_frame_equal(*results, check_dtype=False)
+
+
+@mark_with_dialects_excluding()
+def test_colliding_row_key_is_not_used(test_helpers, dialect, monkeypatch):
+    helper = test_helpers[dialect]
+    df = helper.load_frame_from_csv("./tests/datasets/fake_1000_from_splink_demos.csv")
+    settings = get_settings_dict()
+
+    linker = Linker(df, settings, **helper.extra_linker_args())
+    df_expected = linker.inference.predict().as_pandas_dataframe()
+
+    # A hash row key which collides for every record
+    dialect_type = type(linker._db_api.sql_dialect)
+    monkeypatch.setattr(dialect_type, "row_key_sql", lambda self, uid_cols: "1")
+    monkeypatch.setattr(dialect_type, "row_key_may_collide", True)
+
+    linker = Linker(df, settings, **helper.extra_linker_args())
+    df_concat_with_tf = compute_df_concat_with_tf(linker, CTEPipeline())
+    assert df_concat_with_tf.metadata["row_key_is_unique"] is False
+    assert inference.available_row_key_column(df_concat_with_tf, []) is None
+
+    sort_cols = ["unique_id_l", "unique_id_r"]
+    df_predict = linker.inference.predict().as_pandas_dataframe()
+    pd.testing.assert_frame_equal(
+        df_predict.sort_values(sort_cols).reset_index(drop=True),
+        df_expected.sort_values(sort_cols).reset_index(drop=True),
+        check_dtype=False,
+    )
@@ -265,3 +265,40 @@ def test_cache_register_compute_tf_table(debug_mode):
         # now this should be cached, as I have manually registered
         linker.table_management.compute_tf_table("first_name")
         mockexecute_sql_pipeline.assert_not_called()
+
+
+def test_persistent_cache_reused_across_sessions(tmp_path):
+    cache_dir = os.path.join(tmp_path, "splink_cache")
+    settings = get_settings_dict()
+
+    db_api = DuckDBAPI()
+    db_api.enable_persistent_cache(cache_dir)
+    linker = Linker(df, settings, db_api=db_api)
+    df_predict_1 = linker.inference.predict().as_pandas_dataframe()
+
+    cache = db_api._intermediate_table_cache
+    assert cache.is_in_executed_queries("__splink__df_concat_with_tf")
+    assert any(f.endswith(".parquet") for f in os.listdir(cache_dir))
+
+    # A fresh session should read the persisted tables rather than recompute
+    db_api = DuckDBAPI()
+    db_api.enable_persistent_cache(cache_dir)
+    linker = Linker(df, settings, db_api=db_api)
+    df_predict_2 = linker.inference.predict().as_pandas_dataframe()
+
+    cache = db_api._intermediate_table_cache
+    assert not cache.is_in_executed_queries("__splink__df_concat_with_tf")
+    assert cache.is_in_queries_retrieved_from_cache("__splink__df_concat_with_tf")
+    assert not cache.is_in_executed_queries("__splink__blocked_id_pairs")
+    assert len(df_predict_1) == len(df_predict_2)
+
+    # Changing the input data changes the fingerprint, so tables are recomputed
+    df_changed = df.copy()
+    df_changed.loc[0, "first_name"] = "a_new_name"
+    db_api = DuckDBAPI()
+    db_api.enable_persistent_cache(cache_dir)
+    linker = Linker(df_changed, settings, db_api=db_api)
+    linker.inference.predict()
+
+    cache = db_api._intermediate_table_cache
+    assert cache.is_in_executed_queries("__splink__df_concat_with_tf")
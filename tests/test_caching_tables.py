@@ -1,9 +1,14 @@
+from unittest.mock import patch
+
 import duckdb
 import pandas as pd
 
 from splink.internals.comparison_library import ExactMatch, LevenshteinAtThresholds
 from splink.internals.duckdb.database_api import DuckDBAPI
+from splink.internals.duckdb.dataframe import DuckDBDataFrame
 from splink.internals.linker import Linker
+from splink.internals.pipeline import CTEPipeline
+from splink.internals.sqlite.database_api import SQLiteAPI
 
 
 def get_duckdb_table_names_as_list(con):
@@ -343,3 +348,183 @@ def test_single_deletion():
     # Check it is no longer in the cache or database
     assert table_name not in get_duckdb_table_names_as_list(db_api._con)
     assert "__splink__df_tf_name" not in cache
+
+
+def test_cache_budget_evicts_tables_no_longer_in_use():
+    data = [
+        {"unique_id": 1, "name": "Amanda"},
+        {"unique_id": 2, "name": "Robin"},
+        {"unique_id": 3, "name": "Robyn"},
+    ]
+    df = pd.DataFrame(data)
+
+    settings = {
+        "link_type": "dedupe_only",
+        "comparisons": [ExactMatch("name").configure(term_frequency_adjustments=True)],
+        "blocking_rules_to_generate_predictions": ["l.name = r.name"],
+    }
+
+    db_api = DuckDBAPI()
+    linker = Linker(df, settings, db_api=db_api)
+    expected = linker.inference.predict().as_pandas_dataframe()
+
+    db_api = DuckDBAPI()
+    db_api.set_cache_budget(max_rows=0)
+    linker = Linker(df, settings, db_api=db_api)
+
+    tf_table = linker.table_management.compute_tf_table("name")
+    df_predict = linker.inference.predict()
+    pd.testing.assert_frame_equal(df_predict.as_pandas_dataframe(), expected)
+
+    # Intermediate tables are dropped as soon as they are no longer referenced
+    db_api.set_cache_budget(max_rows=0)
+    table_names = set(get_duckdb_table_names_as_list(db_api._con))
+    assert table_names == {
+        "__splink__input_table_0",
+        tf_table.physical_name,
+        df_predict.physical_name,
+    }
+
+    # Pinned tables are retained even when no longer referenced
+    cache = linker._intermediate_table_cache
+    cache.pin(df_predict)
+    predict_table_name = df_predict.physical_name
+    del df_predict, tf_table
+    db_api.set_cache_budget(max_rows=0)
+    table_names = set(get_duckdb_table_names_as_list(db_api._con))
+    assert table_names == {"__splink__input_table_0", predict_table_name}
+
+
+def test_scoped_tables_are_dropped_on_exit():
+    data = [
+        {"unique_id": 1, "name": "Amanda"},
+        {"unique_id": 2, "name": "Robin"},
+        {"unique_id": 3, "name": "Robyn"},
+    ]
+    df = pd.DataFrame(data)
+
+    settings = {
+        "link_type": "dedupe_only",
+        "comparisons": [LevenshteinAtThresholds("name", 2)],
+        "blocking_rules_to_generate_predictions": ["l.name = r.name"],
+    }
+
+    db_api = DuckDBAPI()
+    linker = Linker(df, settings, db_api=db_api)
+    cache = linker._intermediate_table_cache
+
+    with db_api.scoped_tables() as scope:
+        linker.table_management.compute_tf_table("name")
+        df_predict = scope.keep(linker.inference.predict())
+
+    table_names = set(get_duckdb_table_names_as_list(db_api._con))
+    assert table_names == {"__splink__input_table_0", df_predict.physical_name}
+    assert "__splink__df_tf_name" not in cache
+    assert "__splink__df_concat_with_tf" not in cache
+
+
+def test_execution_stats_recorded():
+    data = [
+        {"unique_id": 1, "name": "Amanda"},
+        {"unique_id": 2, "name": "Robin"},
+        {"unique_id": 3, "name": "Robin"},
+    ]
+    df = pd.DataFrame(data)
+
+    settings = {
+        "link_type": "dedupe_only",
+        "comparisons": [LevenshteinAtThresholds("name", 2)],
+        "blocking_rules_to_generate_predictions": ["l.name = r.name"],
+    }
+
+    db_api = DuckDBAPI()
+    linker = Linker(df, settings, db_api=db_api)
+    tf_table = linker.table_management.compute_tf_table("name")
+    linker.inference.predict()
+
+    # Executing the same SQL again retrieves the table from the cache
+    sql = f"select count(*) as n from {tf_table.physical_name}"
+    for _ in range(2):
+        pipeline = CTEPipeline()
+        pipeline.enqueue_sql(sql, "n")
+        db_api.sql_pipeline_to_splink_dataframe(pipeline)
+
+    stats = db_api.execution_stats()
+    assert list(stats.columns) == [
+        "templated_name",
+        "physical_name",
+        "backend",
+        "cache_status",
+        "started_at",
+        "duration_seconds",
+        "rows_out",
+        "bytes_out",
+    ]
+    assert (stats["backend"] == "duckdb").all()
+    assert (stats["duration_seconds"] >= 0).all()
+    # DuckDB records the rows of each table, but not its size in bytes
+    assert stats["bytes_out"].isna().all()
+
+    tf_stats = stats[stats["templated_name"] == "__splink__df_tf_name"]
+    assert list(tf_stats["cache_status"]) == ["miss"]
+    assert tf_stats["rows_out"].iloc[0] == 2
+
+    count_stats = stats[stats["templated_name"] == "n"]
+    assert list(count_stats["cache_status"]) == ["miss", "hit"]
+    assert count_stats["rows_out"].iloc[0] == 1
+    assert pd.isna(count_stats["rows_out"].iloc[1])
+
+    predict_stats = stats[stats["templated_name"] == "__splink__df_predict"]
+    assert list(predict_stats["cache_status"]) == ["miss"]
+    assert predict_stats["rows_out"].iloc[0] == 1
+
+    db_api.reset_execution_stats()
+    assert len(db_api.execution_stats()) == 0
+
+
+def test_execution_stats_rows_counted_only_if_not_recorded():
+    # SQLite does not record the number of rows in a table
+    db_api = SQLiteAPI()
+    pipeline = CTEPipeline()
+    pipeline.enqueue_sql("select 1 as n union all select 2 as n", "n")
+    db_api.sql_pipeline_to_splink_dataframe(pipeline)
+
+    stats = db_api.execution_stats()
+    assert list(stats["cache_status"]) == ["miss"]
+    assert stats["rows_out"].isna().all()
+
+    db_api.execution_stats_count_rows = True
+    pipeline = CTEPipeline()
+    pipeline.enqueue_sql("select 1 as n", "n")
+    db_api.sql_pipeline_to_splink_dataframe(pipeline)
+    assert db_api.execution_stats()["rows_out"].iloc[-1] == 1
+
+
+def test_table_schema_cached_until_table_replaced():
+    db_api = DuckDBAPI()
+    df = pd.DataFrame({"unique_id": [1, 2], "first_name": ["a", "b"]})
+    sdf = db_api.register_table(df, "people")
+
+    assert [c.unquote().name for c in sdf.columns] == ["unique_id", "first_name"]
+    assert sdf.column_types == {"unique_id": "BIGINT", "first_name": "VARCHAR"}
+
+    # The schema is shared with other SplinkDataFrames for the same table, and
+    # is not fetched again
+    with patch.object(
+        DuckDBDataFrame, "_fetch_column_types", side_effect=AssertionError
+    ):
+        other = db_api.table_to_splink_dataframe("people", "people")
+        assert other.column_types == sdf.column_types
+
+    # Re-registering the table invalidates the cached schema
+    df_new = pd.DataFrame({"unique_id": [1], "surname": ["c"]})
+    db_api.register_table(df_new, "people", overwrite=True)
+    assert [c.unquote().name for c in sdf.columns] == ["unique_id", "surname"]
+
+    # As does creating a table via SQL
+    pipeline = CTEPipeline()
+    pipeline.enqueue_sql("select 1 as x", "__splink__x")
+    created = db_api.sql_pipeline_to_splink_dataframe(pipeline)
+    assert created.column_types == {"x": "INTEGER"}
+    created.drop_table_from_database_and_remove_from_cache()
+    assert created.physical_name not in db_api._table_schemas
@@ -0,0 +1,57 @@
+import subprocess
+import sys
+
+import pytest
+
+
+def _modules_imported_by(statement, modules):
+    check = (
+        f"{statement}\n"
+        "import sys\n"
+        f"print(','.join(m for m in {modules!r} if m in sys.modules))"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", check], check=True, capture_output=True, text=True
+    )
+    return [m for m in result.stdout.strip().split(",") if m]
+
+
+def test_import_splink_is_lazy():
+    heavy_modules = ["altair", "jinja2", "pandas", "sqlglot", "duckdb", "igraph"]
+    assert _modules_imported_by("import splink", heavy_modules) == []
+
+
+def test_linker_does_not_import_charts_or_dashboards():
+    modules = [
+        "altair",
+        "jinja2",
+        "splink.internals.cluster_studio",
+        "splink.internals.labelling_tool",
+        "splink.internals.splink_comparison_viewer",
+    ]
+    assert _modules_imported_by("from splink import Linker, DuckDBAPI", modules) == []
+
+
+@pytest.mark.parametrize(
+    "name",
+    [
+        "block_on",
+        "ColumnExpression",
+        "DuckDBAPI",
+        "Linker",
+        "SettingsCreator",
+        "splink_datasets",
+    ],
+)
+def test_lazy_top_level_names(name):
+    import splink
+
+    assert getattr(splink, name) is not None
+    assert name in dir(splink)
+
+
+def test_unknown_top_level_name():
+    import splink
+
+    with pytest.raises(AttributeError):
+        splink.not_a_name  # noqa: B018
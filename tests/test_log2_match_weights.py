@@ -0,0 +1,108 @@
+import pandas as pd
+
+import splink.internals.comparison_library as cl
+from splink.internals.linker import Linker
+
+from .decorator import mark_with_dialects_excluding
+
+
+@mark_with_dialects_excluding()
+def test_log2_match_weights_match_predict(test_helpers, dialect):
+    helper = test_helpers[dialect]
+    df = helper.load_frame_from_csv("./tests/datasets/fake_1000_from_splink_demos.csv")
+
+    settings = {
+        "link_type": "dedupe_only",
+        "comparisons": [
+            cl.ExactMatch("first_name").configure(term_frequency_adjustments=True),
+            cl.LevenshteinAtThresholds("surname", [1, 2]).configure(
+                term_frequency_adjustments=True
+            ),
+            cl.ExactMatch("dob"),
+            cl.ExactMatch("city").configure(
+                m_probabilities=[0.8, 0.2], u_probabilities=[0.1, 0.9]
+            ),
+        ],
+        "blocking_rules_to_generate_predictions": [
+            "l.surname = r.surname",
+            "l.dob = r.dob",
+        ],
+        "retain_intermediate_calculation_columns": True,
+    }
+    linker = Linker(df, settings, **helper.extra_linker_args())
+
+    sort_cols = ["unique_id_l", "unique_id_r"]
+    for threshold in [None, 0.5]:
+        results = []
+        for use_log2_match_weights in [False, True]:
+            df_predict = linker.inference.predict(
+                threshold_match_probability=threshold,
+                use_log2_match_weights=use_log2_match_weights,
+            ).as_pandas_dataframe()
+            results.append(df_predict.sort_values(sort_cols).reset_index(drop=True))
+
+        assert list(results[0].columns) == list(results[1].columns)
+        pd.testing.assert_frame_equal(*results, check_dtype=False)
+
+
+@mark_with_dialects_excluding()
+def test_log2_match_weights_do_not_overflow(test_helpers, dialect):
+    helper = test_helpers[dialect]
+    df = helper.load_frame_from_csv("./tests/datasets/fake_1000_from_splink_demos.csv")
+
+    # Each agreeing comparison has a Bayes factor of 2^300, so a pair agreeing on
+    # all four overflows a product of Bayes factors
+    comparisons = [
+        cl.ExactMatch(col).configure(
+            m_probabilities=[0.5, 0.5], u_probabilities=[2**-301, 1 - 2**-301]
+        )
+        for col in ["first_name", "surname", "dob", "city"]
+    ]
+    settings = {
+        "link_type": "dedupe_only",
+        "comparisons": comparisons,
+        "blocking_rules_to_generate_predictions": [
+            "l.first_name = r.first_name and l.surname = r.surname "
+            "and l.dob = r.dob and l.city = r.city"
+        ],
+    }
+    linker = Linker(df, settings, **helper.extra_linker_args())
+
+    df_predict = linker.inference.predict(
+        use_log2_match_weights=True
+    ).as_pandas_dataframe()
+    assert len(df_predict) > 0
+    assert (df_predict["match_weight"] > 1100).all()
+    assert (df_predict["match_probability"] == 1.0).all()
+
+
+# SQLite casts 'Infinity' to 0, so has no infinite Bayes factors
+@mark_with_dialects_excluding("sqlite")
+def test_log2_match_weights_infinite_and_zero_bayes_factors(test_helpers, dialect):
+    helper = test_helpers[dialect]
+    df = helper.load_frame_from_csv("./tests/datasets/fake_1000_from_splink_demos.csv")
+
+    # Agreeing on surname has an infinite Bayes factor, and disagreeing on dob a
+    # Bayes factor of zero
+    settings = {
+        "link_type": "dedupe_only",
+        "comparisons": [
+            cl.ExactMatch("surname").configure(
+                m_probabilities=[0.5, 0.5], u_probabilities=[0.0, 1.0]
+            ),
+            cl.ExactMatch("dob").configure(
+                m_probabilities=[1.0, 0.0], u_probabilities=[0.5, 0.5]
+            ),
+        ],
+        "blocking_rules_to_generate_predictions": ["l.surname = r.surname"],
+    }
+    linker = Linker(df, settings, **helper.extra_linker_args())
+
+    df_predict = linker.inference.predict(
+        use_log2_match_weights=True
+    ).as_pandas_dataframe()
+    assert (df_predict["dob_l"] != df_predict["dob_r"]).any()
+    # As when multiplying Bayes factors, any infinite Bayes factor gives a match,
+    # rather than a sum of Infinity - Infinity
+    assert (df_predict["match_weight"] == float("inf")).all()
+    assert (df_predict["match_probability"] == 1.0).all()
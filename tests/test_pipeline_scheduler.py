@@ -0,0 +1,157 @@
+import pandas as pd
+import pytest
+
+from splink.exploratory import profile_columns
+from splink.internals.duckdb.database_api import DuckDBAPI
+from splink.internals.pipeline import CTEPipeline
+from splink.internals.pipeline_scheduler import PipelineScheduler
+
+df = pd.read_csv("./tests/datasets/fake_1000_from_splink_demos.csv")
+
+
+def _schedule_pipelines(scheduler):
+    pipeline = CTEPipeline()
+    pipeline.enqueue_sql(
+        """
+        select first_name, count(*) as n from input
+        where first_name is not null group by first_name
+        """,
+        "__splink__first_name_counts",
+    )
+    counts = scheduler.add_pipeline(pipeline)
+
+    names = []
+    for i, order in enumerate(["desc", "asc"]):
+        pipeline = CTEPipeline()
+        pipeline.enqueue_sql(
+            f"""
+            select * from __splink__first_name_counts
+            order by n {order}, first_name limit 3
+            """,
+            f"__splink__first_name_counts_{i}",
+        )
+        names.append(scheduler.add_pipeline(pipeline, depends_on=counts))
+
+    pipeline = CTEPipeline()
+    pipeline.enqueue_sql(
+        """
+        select * from __splink__first_name_counts_0
+        union all
+        select * from __splink__first_name_counts_1
+        """,
+        "__splink__first_name_extremes",
+    )
+    return scheduler.add_pipeline(pipeline, depends_on=names)
+
+
+@pytest.mark.parametrize("max_workers", [1, 4])
+def test_pipeline_scheduler_respects_dependencies(max_workers):
+    db_api = DuckDBAPI()
+    db_api.register_table(df, "input")
+
+    scheduler = PipelineScheduler(db_api, max_workers=max_workers)
+    final = _schedule_pipelines(scheduler)
+    results = scheduler.run()
+
+    assert len(results) == 4
+    extremes = results[final].as_pandas_dataframe()
+    expected = (
+        df.groupby("first_name", as_index=False)
+        .size()
+        .rename(columns={"size": "n"})
+        .sort_values(["n", "first_name"], ascending=[False, True])
+    )
+    expected_names = list(expected["first_name"][:3]) + list(
+        expected.sort_values(["n", "first_name"])["first_name"][:3]
+    )
+    assert sorted(extremes["first_name"]) == sorted(expected_names)
+
+
+def test_pipeline_scheduler_rejects_unknown_dependency():
+    scheduler = PipelineScheduler(DuckDBAPI())
+    pipeline = CTEPipeline()
+    pipeline.enqueue_sql("select 1 as x", "__splink__x")
+    with pytest.raises(ValueError):
+        scheduler.add_pipeline(pipeline, depends_on="__splink__missing")
+
+
+def test_profile_columns_concurrently():
+    db_api = DuckDBAPI()
+    db_api.max_concurrent_pipelines = 4
+    profile_columns(df, db_api=db_api, column_expressions=["first_name", "city"])
+
+
+def test_identical_pipelines_create_table_once():
+    db_api = DuckDBAPI()
+    db_api.register_table(df, "input")
+
+    scheduler = PipelineScheduler(db_api, max_workers=4)
+    for i in range(4):
+        pipeline = CTEPipeline()
+        pipeline.enqueue_sql(
+            "select first_name, count(*) as n from input group by first_name",
+            "__splink__first_name_counts",
+        )
+        scheduler.add_pipeline(pipeline, name=f"counts_{i}")
+    results = scheduler.run()
+
+    assert len({df.physical_name for df in results.values()}) == 1
+    stats = db_api.execution_stats()
+    assert list(stats["cache_status"]).count("miss") == 1
+
+
+def test_blocking_tables_materialised_concurrently():
+    import splink.comparison_library as cl
+    from splink import Linker, SettingsCreator, block_on
+
+    df_arrays = df.assign(
+        first_names=df["first_name"].map(lambda x: [x, "shared"]),
+        surnames=df["surname"].map(lambda x: [x]),
+    )
+    settings = SettingsCreator(
+        link_type="dedupe_only",
+        blocking_rules_to_generate_predictions=[
+            {
+                "blocking_rule": "l.first_names = r.first_names and l.dob = r.dob",
+                "arrays_to_explode": ["first_names"],
+            },
+            {
+                "blocking_rule": "l.surnames = r.surnames",
+                "arrays_to_explode": ["surnames"],
+            },
+            block_on("city", salting_partitions=3, salting_min_comparisons=100),
+            block_on("email", salting_partitions=3, salting_min_comparisons=100),
+        ],
+        comparisons=[cl.ExactMatch("first_name"), cl.ExactMatch("surname")],
+    )
+
+    def predicted_pairs(max_concurrent_pipelines):
+        db_api = DuckDBAPI()
+        db_api.max_concurrent_pipelines = max_concurrent_pipelines
+        linker = Linker(df_arrays, settings, db_api=db_api)
+        predictions = linker.inference.predict().as_pandas_dataframe()
+        return set(
+            zip(predictions.unique_id_l, predictions.unique_id_r, predictions.match_key)
+        )
+
+    assert predicted_pairs(4) == predicted_pairs(1)
+
+
+def test_approximate_count_sketches_computed_concurrently():
+    from splink.blocking_analysis import count_comparisons_from_blocking_rule
+
+    counts = []
+    for max_concurrent_pipelines in [1, 4]:
+        db_api = DuckDBAPI()
+        db_api.max_concurrent_pipelines = max_concurrent_pipelines
+        counts.append(
+            count_comparisons_from_blocking_rule(
+                table_or_tables=df,
+                blocking_rule="l.surname = r.surname",
+                link_type="dedupe_only",
+                db_api=db_api,
+                approximate=True,
+            )
+        )
+    key = "number_of_comparisons_generated_pre_filter_conditions"
+    assert counts[0][key] == counts[1][key]
@@ -0,0 +1,211 @@
+from unittest.mock import patch
+
+import pandas as pd
+import pytest
+
+import splink.internals.comparison_library as cl
+from splink.internals.blocking import AdaptiveSaltedBlockingRule
+from splink.internals.blocking_rule_library import block_on, sorted_neighbourhood
+from splink.internals.linker import Linker
+
+from .decorator import mark_with_dialects_excluding
+
+
+def _settings(term_frequency_adjustments):
+    return {
+        "link_type": "dedupe_only",
+        "comparisons": [
+            cl.ExactMatch("first_name").configure(
+                term_frequency_adjustments=term_frequency_adjustments
+            ),
+            cl.ExactMatch("surname").configure(
+                term_frequency_adjustments=term_frequency_adjustments
+            ),
+            cl.ExactMatch("dob"),
+            cl.ExactMatch("city"),
+        ],
+        "blocking_rules_to_generate_predictions": [
+            block_on("surname"),
+            block_on("dob"),
+            block_on("city", "first_name", salting_partitions=2),
+        ],
+        "probability_two_random_records_match": 0.01,
+    }
+
+
+def _changes():
+    df = pd.read_csv("./tests/datasets/fake_1000_from_splink_demos.csv")
+    original = df[df["unique_id"] < 950]
+    new = df[df["unique_id"] >= 950]
+    updated = original[original["unique_id"] % 37 == 0].copy()
+    updated["surname"] = updated["surname"].str.upper()
+    deleted = original[original["unique_id"] % 41 == 1][["unique_id"]]
+
+    unchanged = original[
+        ~original["unique_id"].isin(updated["unique_id"])
+        & ~original["unique_id"].isin(deleted["unique_id"])
+    ]
+    final = pd.concat([unchanged, updated, new])
+    changed_ids = set(updated["unique_id"]) | set(new["unique_id"])
+    return original, pd.concat([updated, new]), deleted, final, changed_ids
+
+
+@mark_with_dialects_excluding()
+@pytest.mark.parametrize("term_frequency_adjustments", [False, True])
+def test_predict_incremental_matches_predict(
+    test_helpers, dialect, term_frequency_adjustments
+):
+    helper = test_helpers[dialect]
+    original, records, deleted, final, changed_ids = _changes()
+    settings = _settings(term_frequency_adjustments)
+
+    linker = Linker(
+        helper.convert_frame(original), settings, **helper.extra_linker_args()
+    )
+    df_predict = linker.inference.predict()
+    df_incremental = linker.inference.predict_incremental(
+        helper.convert_frame(records),
+        df_predict,
+        deleted_records=helper.convert_frame(deleted),
+    ).as_pandas_dataframe()
+
+    linker_final = Linker(
+        helper.convert_frame(final), settings, **helper.extra_linker_args()
+    )
+    df_expected = linker_final.inference.predict().as_pandas_dataframe()
+
+    sort_cols = ["unique_id_l", "unique_id_r"]
+    df_incremental = df_incremental.sort_values(sort_cols).reset_index(drop=True)
+    df_expected = df_expected.sort_values(sort_cols).reset_index(drop=True)
+    assert list(df_incremental.columns) == list(df_expected.columns)
+    pd.testing.assert_frame_equal(
+        df_incremental[sort_cols], df_expected[sort_cols], check_dtype=False
+    )
+
+    # Pairs of changed records are scored with the updated term frequencies, but
+    # the pairs of unchanged records keep the scores they had
+    if term_frequency_adjustments:
+        is_changed = df_expected["unique_id_l"].isin(changed_ids) | df_expected[
+            "unique_id_r"
+        ].isin(changed_ids)
+        df_incremental = df_incremental[is_changed]
+        df_expected = df_expected[is_changed]
+    pd.testing.assert_frame_equal(df_incremental, df_expected, check_dtype=False)
+
+
+@mark_with_dialects_excluding()
+def test_predict_incremental_unsupported_blocking_rules(test_helpers, dialect):
+    helper = test_helpers[dialect]
+    original, records, _, _, _ = _changes()
+    settings = _settings(False)
+    settings["blocking_rules_to_generate_predictions"] = [
+        sorted_neighbourhood("surname", window_size=3)
+    ]
+
+    linker = Linker(
+        helper.convert_frame(original), settings, **helper.extra_linker_args()
+    )
+    df_predict = linker.inference.predict()
+    with pytest.raises(ValueError, match="not supported"):
+        linker.inference.predict_incremental(helper.convert_frame(records), df_predict)
+
+
+@mark_with_dialects_excluding()
+def test_predict_incremental_successive_changes(test_helpers, dialect):
+    helper = test_helpers[dialect]
+    df = pd.read_csv("./tests/datasets/fake_1000_from_splink_demos.csv")
+    settings = _settings(True)
+
+    # Records 900-949 are added on the first day, and records 950 onwards on the
+    # second day, when some of the first day's records are updated or deleted
+    original = df[df["unique_id"] < 900]
+    day_1 = df[(df["unique_id"] >= 900) & (df["unique_id"] < 950)]
+    updated = day_1[day_1["unique_id"] % 3 == 0].copy()
+    updated["surname"] = updated["surname"].str.upper()
+    deleted = day_1[day_1["unique_id"] % 3 == 1][["unique_id"]]
+    day_2 = pd.concat([updated, df[df["unique_id"] >= 950]])
+
+    linker = Linker(
+        helper.convert_frame(original), settings, **helper.extra_linker_args()
+    )
+    df_predict = linker.inference.predict()
+    df_predict = linker.inference.predict_incremental(
+        helper.convert_frame(day_1), df_predict
+    )
+    df_predict = linker.inference.predict_incremental(
+        helper.convert_frame(day_2),
+        df_predict,
+        deleted_records=helper.convert_frame(deleted),
+    ).as_pandas_dataframe()
+
+    final = pd.concat([original, day_1, day_2]).drop_duplicates(
+        "unique_id", keep="last"
+    )
+    final = final[~final["unique_id"].isin(deleted["unique_id"])]
+    linker_final = Linker(
+        helper.convert_frame(final), settings, **helper.extra_linker_args()
+    )
+    df_expected = linker_final.inference.predict().as_pandas_dataframe()
+
+    # Pairs of the second day's records are scored with the term frequencies of
+    # all the records, including the first day's
+    sort_cols = ["unique_id_l", "unique_id_r"]
+    assert set(zip(df_predict.unique_id_l, df_predict.unique_id_r)) == set(
+        zip(df_expected.unique_id_l, df_expected.unique_id_r)
+    )
+    df_predict = df_predict.sort_values(sort_cols).reset_index(drop=True)
+    df_expected = df_expected.sort_values(sort_cols).reset_index(drop=True)
+    day_2_ids = set(day_2["unique_id"])
+    is_day_2 = df_expected["unique_id_l"].isin(day_2_ids) & df_expected[
+        "unique_id_r"
+    ].isin(day_2_ids)
+    pd.testing.assert_frame_equal(
+        df_predict[is_day_2], df_expected[is_day_2], check_dtype=False
+    )
+
+
+@mark_with_dialects_excluding()
+def test_predict_incremental_uses_updated_records(test_helpers, dialect):
+    helper = test_helpers[dialect]
+    df = pd.read_csv("./tests/datasets/fake_1000_from_splink_demos.csv")
+    settings = _settings(True)
+    settings["blocking_rules_to_generate_predictions"] = [
+        block_on("city", salting_partitions=2, salting_min_comparisons=2000)
+    ]
+
+    original = df[df["unique_id"] < 900]
+    new = df[df["unique_id"] >= 900].assign(city="Newtown")
+    linker = Linker(
+        helper.convert_frame(original), settings, **helper.extra_linker_args()
+    )
+    df_predict = linker.inference.predict()
+
+    skewed_keys = []
+    drop_skewed_keys = (
+        AdaptiveSaltedBlockingRule.drop_materialised_skewed_keys_dataframe
+    )
+
+    def record_skewed_keys(br):
+        skewed_keys.append(set(br.skewed_keys_table.as_pandas_dataframe()["key_0"]))
+        drop_skewed_keys(br)
+
+    db_api = linker._db_api
+    db_api.reset_execution_stats()
+    with patch.object(
+        AdaptiveSaltedBlockingRule,
+        "drop_materialised_skewed_keys_dataframe",
+        autospec=True,
+        side_effect=record_skewed_keys,
+    ):
+        linker.inference.predict_incremental(helper.convert_frame(new), df_predict)
+
+    # The block of new records is skewed once they are added
+    assert skewed_keys == [{"London", "Newtown"}]
+
+    # The records joined to the updated term frequencies are computed once
+    templated_names = list(db_api.execution_stats()["templated_name"])
+    for templated_name in [
+        "__splink__df_incremental_unchanged_with_tf",
+        "__splink__df_incremental_records_with_tf",
+    ]:
+        assert templated_names.count(templated_name) == 1
@@ -0,0 +1,136 @@
+import os
+
+import pandas as pd
+import pytest
+
+import splink.internals.comparison_library as cl
+from splink.internals.blocking_rule_library import block_on, sorted_neighbourhood
+from splink.internals.linker import Linker
+
+from .decorator import mark_with_dialects_including
+
+settings = {
+    "link_type": "dedupe_only",
+    "comparisons": [cl.ExactMatch("first_name"), cl.ExactMatch("surname")],
+    "blocking_rules_to_generate_predictions": [
+        "l.dob = r.dob",
+        "l.city = r.city and l.surname = r.surname",
+    ],
+}
+
+
+@mark_with_dialects_including("duckdb", pass_dialect=True)
+def test_predict_to_parquet_matches_predict(dialect, test_helpers, tmp_path):
+    helper = test_helpers[dialect]
+    df = helper.load_frame_from_csv("./tests/datasets/fake_1000_from_splink_demos.csv")
+
+    linker = Linker(df, settings, helper.DatabaseAPI(**helper.db_api_args()))
+    sort_cols = ["unique_id_l", "unique_id_r"]
+    expected = linker.inference.predict().as_pandas_dataframe()
+    expected = expected.sort_values(sort_cols).reset_index(drop=True)
+
+    output_path = str(tmp_path / "predictions")
+    db_api = linker._db_api
+    db_api.reset_execution_stats()
+    paths = linker.inference.predict_to_parquet(output_path, num_chunks=4)
+    assert len(paths) == 4
+    # The blocked pairs of all chunks are never materialised together
+    templated_names = set(db_api.execution_stats()["templated_name"])
+    assert "__splink__blocked_id_pairs" not in templated_names
+    assert all(os.path.exists(p) for p in paths)
+    assert not os.path.exists(f"{output_path}_in_progress")
+
+    def read_chunks():
+        actual = pd.concat([pd.read_parquet(p) for p in paths])
+        return actual.sort_values(sort_cols).reset_index(drop=True)
+
+    actual = read_chunks()
+    assert list(actual.columns) == list(expected.columns)
+    pd.testing.assert_frame_equal(actual, expected, check_dtype=False)
+
+    # Simulate an interrupted run: only the missing chunk is recomputed
+    modified_times = {p: os.path.getmtime(p) for p in paths}
+    os.remove(paths[2])
+    linker.inference.predict_to_parquet(output_path, num_chunks=4)
+    assert all(
+        os.path.getmtime(p) == t for p, t in modified_times.items() if p != paths[2]
+    )
+    pd.testing.assert_frame_equal(read_chunks(), expected, check_dtype=False)
+
+
+@mark_with_dialects_including("duckdb", pass_dialect=True)
+def test_predict_to_parquet_refuses_to_resume_changed_run(
+    dialect, test_helpers, tmp_path
+):
+    helper = test_helpers[dialect]
+    df = helper.load_frame_from_csv("./tests/datasets/fake_1000_from_splink_demos.csv")
+
+    db_api = helper.DatabaseAPI(**helper.db_api_args())
+    linker = Linker(df, settings, db_api)
+    output_path = str(tmp_path / "predictions")
+    paths = linker.inference.predict_to_parquet(output_path, num_chunks=4)
+    assert os.path.exists(os.path.join(output_path, "_manifest.json"))
+
+    # Once all chunks exist, blocking is skipped
+    db_api.reset_execution_stats()
+    assert linker.inference.predict_to_parquet(output_path, num_chunks=4) == paths
+    templated_names = set(db_api.execution_stats()["templated_name"])
+    assert "__splink__blocked_id_pairs" not in templated_names
+
+    with pytest.raises(ValueError, match="num_chunks"):
+        linker.inference.predict_to_parquet(output_path, num_chunks=8)
+
+    with pytest.raises(ValueError, match="threshold_match_probability"):
+        linker.inference.predict_to_parquet(
+            output_path, num_chunks=4, threshold_match_probability=0.5
+        )
+
+    # A new linker with the same model and data can resume
+    same_linker = Linker(df, settings, db_api)
+    assert same_linker.inference.predict_to_parquet(output_path, num_chunks=4) == paths
+
+    changed_model = Linker(df, settings, db_api)
+    changed_model._settings_obj._probability_two_random_records_match = 0.01
+    with pytest.raises(ValueError, match="settings_hash"):
+        changed_model.inference.predict_to_parquet(output_path, num_chunks=4)
+
+    changed_data = df.copy()
+    changed_data.loc[0, "first_name"] = "changed"
+    changed_data_linker = Linker(changed_data, settings, db_api)
+    with pytest.raises(ValueError, match="input_fingerprints"):
+        changed_data_linker.inference.predict_to_parquet(output_path, num_chunks=4)
+
+    # Output written before manifests existed can't be checked
+    os.remove(os.path.join(output_path, "_manifest.json"))
+    with pytest.raises(ValueError, match="without a manifest"):
+        linker.inference.predict_to_parquet(output_path, num_chunks=4)
+
+
+@mark_with_dialects_including("duckdb", pass_dialect=True)
+def test_predict_to_parquet_chunks_each_blocking_rule_type(
+    dialect, test_helpers, tmp_path
+):
+    helper = test_helpers[dialect]
+    df = helper.load_frame_from_csv("./tests/datasets/fake_1000_from_splink_demos.csv")
+    df["postcodes"] = [[c, e] for c, e in zip(df["city"], df["email"])]
+
+    chunk_settings = {
+        **settings,
+        "blocking_rules_to_generate_predictions": [
+            block_on("postcodes", arrays_to_explode=["postcodes"]),
+            sorted_neighbourhood("surname", window_size=2),
+            block_on("dob", salting_partitions=3),
+            "l.first_name = r.first_name",
+        ],
+    }
+    linker = Linker(df, chunk_settings, helper.DatabaseAPI(**helper.db_api_args()))
+    sort_cols = ["unique_id_l", "unique_id_r"]
+    expected = linker.inference.predict().as_pandas_dataframe()
+    expected = expected.sort_values(sort_cols).reset_index(drop=True)
+
+    paths = linker.inference.predict_to_parquet(
+        str(tmp_path / "predictions"), num_chunks=3
+    )
+    actual = pd.concat([pd.read_parquet(p) for p in paths])
+    actual = actual.sort_values(sort_cols).reset_index(drop=True)
+    pd.testing.assert_frame_equal(actual, expected, check_dtype=False)
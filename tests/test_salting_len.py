@@ -1,10 +1,16 @@
+import pandas as pd
 import pytest
 
+from splink.internals.blocking import (
+    AdaptiveSaltedBlockingRule,
+    blocking_rule_to_obj,
+    materialise_skewed_key_tables,
+)
 from splink.internals.blocking_rule_library import block_on
 from splink.internals.linker import Linker
 from tests.basic_settings import get_settings_dict
 
-from .decorator import mark_with_dialects_including
+from .decorator import mark_with_dialects_excluding, mark_with_dialects_including
 
 
 def check_same_ids(df1, df2, unique_id_col="unique_id"):
@@ -83,3 +89,44 @@ def test_salting_spark(spark, spark_api):
 
     check_same_ids(df1, df2)
     check_answer(df1, df2)
+
+
+# SQLite's random() returns integers, so is not usable as a salt
+@mark_with_dialects_excluding("sqlite")
+def test_adaptive_salting_only_salts_skewed_blocks(test_helpers, dialect):
+    helper = test_helpers[dialect]
+    df = helper.load_frame_from_csv("./tests/datasets/fake_1000_from_splink_demos.csv")
+
+    blocking_rules_no_salt = ["l.surname = r.surname", "l.dob = r.dob"]
+    blocking_rules_adaptive = [
+        block_on("surname", salting_partitions=3, salting_min_comparisons=100),
+        "l.dob = r.dob",
+    ]
+
+    db_api = helper.DatabaseAPI(**helper.db_api_args())
+    df1 = generate_linker_output(df, db_api, blocking_rules=blocking_rules_no_salt)
+
+    db_api = helper.DatabaseAPI(**helper.db_api_args())
+    df2 = generate_linker_output(df, db_api, blocking_rules=blocking_rules_adaptive)
+
+    check_same_ids(df1, df2)
+    check_answer(df1, df2)
+
+    br = blocking_rule_to_obj(
+        block_on(
+            "surname", salting_partitions=3, salting_min_comparisons=100
+        ).get_blocking_rule(dialect)
+    )
+    assert isinstance(br, AdaptiveSaltedBlockingRule)
+    splink_df_dict = db_api.register_multiple_tables([df], ["input_data"])
+    materialise_skewed_key_tables([br], db_api, splink_df_dict, None)
+
+    surname_counts = pd.read_csv(
+        "./tests/datasets/fake_1000_from_splink_demos.csv"
+    ).surname.value_counts()
+    expected = set(surname_counts[surname_counts**2 >= 100].index)
+    skewed = br.skewed_keys_table.as_pandas_dataframe()
+    assert len(expected) > 0
+    assert set(skewed["key_0"]) == expected
+    br.drop_materialised_skewed_keys_dataframe()
+    assert br.skewed_keys_table is None
@@ -0,0 +1,62 @@
+from splink.internals.blocking import BlockingRule
+from splink.internals.sqlglot_cache import (
+    MemoCache,
+    clear_sqlglot_caches,
+    parse_one_cached,
+    sqlglot_cache_info,
+    transpile_cached,
+)
+
+
+def test_parse_one_cached_counts_hits_and_returns_copies():
+    clear_sqlglot_caches()
+
+    tree_1 = parse_one_cached("select a from t", dialect="duckdb")
+    tree_2 = parse_one_cached("select a from t", dialect="duckdb")
+    assert sqlglot_cache_info()["parse"]["hits"] == 1
+    assert sqlglot_cache_info()["parse"]["misses"] == 1
+
+    # Modifying a returned tree must not affect the cached tree
+    tree_1.set("from", None)
+    assert tree_2.sql() == "SELECT a FROM t"
+    assert parse_one_cached("select a from t", dialect="duckdb").sql() == (
+        "SELECT a FROM t"
+    )
+
+    # The dialect is part of the key
+    parse_one_cached("select a from t", dialect="spark")
+    assert sqlglot_cache_info()["parse"]["misses"] == 2
+
+
+def test_transpile_cached():
+    clear_sqlglot_caches()
+    for _ in range(3):
+        sql = transpile_cached("cast(x as string)", write="duckdb")
+    assert sql == "CAST(x AS TEXT)"
+    assert sqlglot_cache_info()["transpile"] == {
+        "hits": 2,
+        "misses": 1,
+        "size": 1,
+        "maxsize": 4096,
+    }
+
+
+def test_memo_cache_is_bounded():
+    cache = MemoCache(maxsize=2)
+    for key in ["a", "b", "a", "c"]:
+        cache.get_or_compute(key, key.upper)
+    # "b" was least recently used, so was evicted
+    assert cache.info()["size"] == 2
+    assert cache.get_or_compute("a", lambda: "recomputed") == "A"
+    assert cache.get_or_compute("b", lambda: "recomputed") == "recomputed"
+
+
+def test_blocking_rule_parsing_is_memoised():
+    clear_sqlglot_caches()
+    br = BlockingRule(
+        "l.first_name = r.first_name and l.dob > r.dob", sqlglot_dialect="duckdb"
+    )
+    for _ in range(3):
+        assert br._equi_join_conditions == [("first_name", "first_name")]
+        assert br._filter_conditions == "l.dob > r.dob"
+    assert sqlglot_cache_info()["optimize"]["hits"] == 2
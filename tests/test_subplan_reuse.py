@@ -0,0 +1,93 @@
+import pandas as pd
+
+import splink.internals.comparison_library as cl
+from splink.internals.duckdb.database_api import DuckDBAPI
+from splink.internals.linker import Linker
+from splink.internals.pipeline import CTEPipeline
+
+df = pd.read_csv("./tests/datasets/fake_1000_from_splink_demos.csv")
+
+settings = {
+    "link_type": "dedupe_only",
+    "comparisons": [
+        cl.JaroWinklerAtThresholds("first_name", [0.9, 0.7]),
+        cl.ExactMatch("surname").configure(term_frequency_adjustments=True),
+        cl.ExactMatch("dob"),
+    ],
+    "blocking_rules_to_generate_predictions": [
+        "l.first_name = r.first_name",
+        "l.surname = r.surname",
+    ],
+}
+
+
+def _predict(db_api):
+    linker = Linker(df, settings, db_api=db_api)
+    linker.training.estimate_u_using_random_sampling(max_pairs=1e4, seed=1)
+    linker.training.estimate_parameters_using_expectation_maximisation("l.dob = r.dob")
+    return (
+        linker.inference.predict()
+        .as_pandas_dataframe()
+        .sort_values(["unique_id_l", "unique_id_r"])
+        .reset_index(drop=True)
+    )
+
+
+def test_subplan_reuse_gives_identical_results():
+    expected = _predict(DuckDBAPI())
+
+    db_api = DuckDBAPI()
+    db_api.enable_subplan_reuse()
+    result = _predict(db_api)
+
+    pd.testing.assert_frame_equal(result, expected)
+
+
+def test_repeated_subplans_are_materialised_and_reused():
+    db_api = DuckDBAPI()
+    db_api.enable_subplan_reuse()
+    db_api.register_table(df, "input")
+
+    def run_pipeline():
+        pipeline = CTEPipeline()
+        pipeline.enqueue_sql(
+            "select unique_id, lower(first_name) as first_name from input",
+            "__splink__names",
+        )
+        # identical to __splink__names, so should become a select * from it
+        pipeline.enqueue_sql(
+            "select unique_id, lower(first_name) as first_name from input",
+            "__splink__names_copy",
+        )
+        pipeline.enqueue_sql(
+            """
+            select count(*) as n from __splink__names as l
+            inner join __splink__names_copy as r
+            on l.first_name = r.first_name
+            """,
+            "__splink__name_pairs",
+        )
+        return db_api.sql_pipeline_to_splink_dataframe(pipeline)
+
+    first = run_pipeline().as_record_dict()
+    stats = db_api.execution_stats()
+    names = stats[stats["templated_name"] == "__splink__names"]
+    assert list(names["cache_status"]) == ["miss"]
+
+    # A different pipeline containing the same subplan reuses the table
+    pipeline = CTEPipeline()
+    pipeline.enqueue_sql(
+        "select unique_id, lower(first_name) as first_name from input",
+        "__splink__names",
+    )
+    pipeline.enqueue_sql(
+        "select count(distinct first_name) as n from __splink__names",
+        "__splink__distinct_names",
+    )
+    db_api.sql_pipeline_to_splink_dataframe(pipeline)
+
+    stats = db_api.execution_stats()
+    names = stats[stats["templated_name"] == "__splink__names"]
+    assert list(names["cache_status"]) == ["miss", "hit"]
+
+    assert run_pipeline().as_record_dict() == first
@@ -0,0 +1,102 @@
+import pandas as pd
+import pytest
+
+import splink.internals.comparison_library as cl
+from splink.internals.linker import Linker
+
+from .decorator import mark_with_dialects_excluding
+
+settings = {
+    "link_type": "dedupe_only",
+    "comparisons": [
+        cl.ExactMatch("first_name"),
+        cl.LevenshteinAtThresholds("surname", [1, 2]),
+        cl.ExactMatch("dob"),
+        cl.ExactMatch("city"),
+    ],
+    "blocking_rules_to_generate_predictions": [
+        "l.surname = r.surname",
+        "l.dob = r.dob",
+        "l.city = r.city",
+    ],
+}
+
+
+def _top_k(df_predict, k, lr):
+    other = "r" if lr == "l" else "l"
+    ranked = df_predict.sort_values(
+        [f"unique_id_{lr}", "match_weight", f"unique_id_{other}"],
+        ascending=[True, False, True],
+    )
+    top = ranked.groupby(f"unique_id_{lr}").head(k)
+    return set(zip(top["unique_id_l"], top["unique_id_r"]))
+
+
+def _top_k_either_side(df_predict, k):
+    # Rank each record's candidates whichever side of the pair it is on
+    pairs = df_predict[["unique_id_l", "unique_id_r", "match_weight"]]
+    by_record = pd.concat(
+        [
+            pairs.rename(columns={"unique_id_l": "record", "unique_id_r": "other"}),
+            pairs.rename(columns={"unique_id_r": "record", "unique_id_l": "other"}),
+        ]
+    )
+    by_record = by_record.assign(
+        pair=[
+            (lr, rr) if lr < rr else (rr, lr)
+            for lr, rr in zip(by_record["record"], by_record["other"])
+        ]
+    )
+    ranked = by_record.sort_values(
+        ["record", "match_weight", "other"], ascending=[True, False, True]
+    )
+    return set(ranked.groupby("record").head(k)["pair"])
+
+
+@mark_with_dialects_excluding()
+def test_top_k_per_record(test_helpers, dialect):
+    helper = test_helpers[dialect]
+    df = helper.load_frame_from_csv("./tests/datasets/fake_1000_from_splink_demos.csv")
+
+    linker = Linker(df, settings, **helper.extra_linker_args())
+    df_all = linker.inference.predict().as_pandas_dataframe()
+
+    k = 2
+    expected = {
+        "l": _top_k(df_all, k, "l"),
+        "r": _top_k(df_all, k, "r"),
+    }
+    expected["either"] = _top_k_either_side(df_all, k)
+    # In a dedupe job, ranking by each side separately misses candidates
+    assert expected["either"] != expected["l"] | expected["r"]
+
+    for side, rank_cols in [
+        ("l", ["match_rank_l"]),
+        ("r", ["match_rank_r"]),
+        ("either", ["match_rank_l", "match_rank_r"]),
+    ]:
+        df_top = linker.inference.predict(
+            top_k_per_record=k, top_k_per_record_side=side
+        ).as_pandas_dataframe()
+
+        pairs = set(zip(df_top["unique_id_l"], df_top["unique_id_r"]))
+        assert pairs == expected[side]
+        assert len(df_top) == len(expected[side])
+        assert list(df_top.columns) == list(df_all.columns) + rank_cols
+        if side != "either":
+            assert df_top[f"match_rank_{side}"].max() == k
+        else:
+            best_rank = df_top[["match_rank_l", "match_rank_r"]].min(axis=1)
+            assert best_rank.max() == k
+
+
+@mark_with_dialects_excluding()
+def test_top_k_per_record_invalid_arguments(test_helpers, dialect):
+    helper = test_helpers[dialect]
+    df = helper.load_frame_from_csv("./tests/datasets/fake_1000_from_splink_demos.csv")
+
+    linker = Linker(df, settings, **helper.extra_linker_args())
+    with pytest.raises(ValueError, match="positive integer"):
+        linker.inference.predict(top_k_per_record=0)
+    with pytest.raises(ValueError, match="top_k_per_record_side"):
+        linker.inference.predict(top_k_per_record=1, top_k_per_record_side="both")